@@ -0,0 +1,35 @@
+-- Memory namespaces: one per device on the gateway (tt/gateway.py).
+--
+-- store() tags memories/highlights rows with the device's namespace, and
+-- recall() searches through the four-argument find_highlights below, with
+-- match_namespace null for the single-device setup (python -m tt.main), whose
+-- rows have no namespace. So no device's memories leak into another's recall.
+--
+-- The existing three-argument find_highlights is left exactly as it is (same
+-- signature, same return type, all rows) for anything else calling it.
+
+alter table memories add column if not exists namespace text;
+alter table highlights add column if not exists namespace text;
+
+create index if not exists memories_namespace_idx on memories (namespace);
+create index if not exists highlights_namespace_idx on highlights (namespace);
+
+-- Cosine similarity search within one namespace (null = rows without one).
+-- Rows come back as JSON (every column but the embedding, plus similarity)
+-- so this doesn't depend on the exact column types.
+create or replace function find_highlights(
+  query_embedding vector(1536),
+  match_threshold double precision,
+  match_count integer,
+  match_namespace text
+)
+returns setof jsonb
+language sql stable
+as $$
+  select (to_jsonb(h) - 'embedding') || jsonb_build_object('similarity', 1 - (h.embedding <=> query_embedding))
+  from highlights h
+  where h.namespace is not distinct from match_namespace
+    and 1 - (h.embedding <=> query_embedding) > match_threshold
+  order by h.embedding <=> query_embedding
+  limit match_count;
+$$;
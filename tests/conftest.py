@@ -0,0 +1,14 @@
+import pytest
+
+from tt.brain.handlers import tools_plug
+
+
+@pytest.fixture
+def registry():
+    """Tools registered during the test are gone afterwards, registry version and all."""
+    saved = dict(tools_plug._REGISTRY)
+    version, definitions = tools_plug._registry_version, tools_plug._definitions_cache
+    yield tools_plug.tool
+    tools_plug._REGISTRY.clear()
+    tools_plug._REGISTRY.update(saved)
+    tools_plug._registry_version, tools_plug._definitions_cache = version, definitions
@@ -0,0 +1,60 @@
+import threading
+import time
+
+from tt.utils.audio_buffers import BLOCK, CaptureQueue, SpeakerRingBuffer
+
+
+def test_read_views_keeps_slots_until_advanced():
+    ring = SpeakerRingBuffer(8)
+    ring.write(b"AAAAAAAA")
+    views = ring.read_views(4)
+    # The ring is still full: the producer can't overwrite the peeked bytes
+    assert ring.write(b"BBBB") == 0
+    assert b"".join(views) == b"AAAA"
+    ring.advance(4)
+    assert ring.write(b"BBBB") == 4
+    assert ring.read(8) == (b"AAAABBBB", 8)
+
+
+def test_read_pads_with_silence_and_counts_underrun():
+    ring = SpeakerRingBuffer(8)
+    ring.write(b"AB")
+    assert ring.read(4) == (b"AB\x00\x00", 2)
+    assert ring.underruns == 1
+    assert len(ring) == 0
+
+
+def test_capture_queue_drop_oldest_keeps_the_newest_frames():
+    queue = CaptureQueue(maxsize=2)
+    assert all(queue.put(frame) for frame in (b"1", b"2", b"3"))
+    assert [queue.get_nowait(), queue.get_nowait(), queue.get_nowait()] == [b"2", b"3", None]
+    stats = queue.stats()
+    assert (stats["put_frames"], stats["dropped_frames"], stats["max_depth"]) == (3, 1, 2)
+
+
+def test_capture_queue_block_drops_the_new_frame_after_the_timeout():
+    queue = CaptureQueue(maxsize=1, overflow=BLOCK, block_timeout=0.01)
+    assert queue.put(b"1")
+    assert not queue.put(b"2")
+    assert queue.get_nowait() == b"1"
+    assert queue.stats()["dropped_frames"] == 1
+
+
+def test_capture_queue_block_waits_for_room():
+    queue = CaptureQueue(maxsize=1, overflow=BLOCK, block_timeout=5)
+    queue.put(b"1")
+    threading.Timer(0.05, queue.get_nowait).start()
+    start = time.monotonic()
+    assert queue.put(b"2")
+    assert time.monotonic() - start < 5
+    assert queue.get_nowait() == b"2"
+    assert queue.stats()["dropped_frames"] == 0
+
+
+def test_capture_queue_close_wakes_a_blocked_producer():
+    queue = CaptureQueue(maxsize=1, overflow=BLOCK, block_timeout=5)
+    queue.put(b"1")
+    threading.Timer(0.05, queue.close).start()
+    assert not queue.put(b"2")
+    assert queue.get(timeout=0) == b"1"
+    assert queue.get(timeout=0) is None
@@ -0,0 +1,54 @@
+import base64
+import json
+import time
+
+from tt.utils.audio_framing import AudioUplink
+
+
+def _uplink(**kwargs):
+    sent = []
+    uplink = AudioUplink(sent.append, rate=24000, packet_ms=40, **kwargs)
+    return uplink, sent
+
+
+def _audio(message: str) -> bytes:
+    msg = json.loads(message)
+    assert msg["type"] == "input_audio_buffer.append"
+    return base64.b64decode(msg["audio"])
+
+
+def test_frames_are_coalesced_into_fixed_size_packets():
+    uplink, sent = _uplink(max_latency_ms=10_000)
+    assert uplink.packet_bytes == 1920  # 40 ms of 24 kHz 16-bit mono
+    pcm = bytes(range(256)) * 20  # 5120 bytes
+    for i in range(0, len(pcm), 480):  # 10 ms capture frames
+        uplink.push(pcm[i:i + 480])
+
+    assert [len(_audio(m)) for m in sent] == [1920, 1920]
+    uplink.flush()
+    assert [len(_audio(m)) for m in sent] == [1920, 1920, 1280]
+    assert b"".join(_audio(m) for m in sent) == pcm
+
+    stats = uplink.stats()
+    assert stats["messages"] == 3
+    assert stats["audio_bytes"] == len(pcm)
+    assert stats["wire_bytes"] == sum(len(m) for m in sent)
+
+
+def test_a_frame_bigger_than_the_buffer_still_splits_into_packets():
+    uplink, sent = _uplink(max_latency_ms=10_000)
+    uplink.push(bytes(1920 * 5 + 100))
+    assert [len(_audio(m)) for m in sent] == [1920] * 5
+    uplink.flush()
+    assert len(_audio(sent[-1])) == 100
+
+
+def test_a_partial_packet_is_flushed_at_the_latency_cap():
+    uplink, sent = _uplink(max_latency_ms=40)
+    uplink.push(bytes(480))
+    uplink.poll()
+    assert sent == []
+    time.sleep(0.05)
+    uplink.poll()
+    assert [len(_audio(m)) for m in sent] == [480]
+    assert uplink.stats()["messages"] == 1
@@ -0,0 +1,42 @@
+import time
+
+from tt.brain.handlers import disable_profiling, enable_profiling, find_and_run, profile_snapshot
+from tt.brain.handlers.dispatch_profile import FAST_PATH_SUFFIX, DispatchProfiler
+
+
+def test_counts_time_and_buckets_per_event_type():
+    profiler = DispatchProfiler()
+    for _ in range(3):
+        assert profiler.run(lambda conv, msg: None, None, {}, "a")
+    assert profiler.run(lambda conv, msg: time.sleep(0.002), None, {}, "b")
+    assert not profiler.run(None, None, {}, "nobody")
+    assert not profiler.run(None, None, {}, "nobody")
+
+    snap = profiler.snapshot()
+    assert snap["types"]["a"]["count"] == 3
+    assert sum(snap["types"]["a"]["histogram"].values()) == 3
+    assert snap["types"]["b"]["max_us"] >= 2000
+    histogram = snap["types"]["b"]["histogram"]
+    assert sum(histogram.values()) == 1
+    assert not any(histogram[label] for label in ("<10us", "<30us", "<100us", "<300us", "<1ms"))
+    assert snap["unhandled"] == {"nobody": 2}
+    assert "nobody x2" in profiler.report()
+
+
+def test_fast_path_only_records_frames_it_consumed():
+    profiler = DispatchProfiler()
+    assert profiler.run_fast(lambda conv, raw: True, None, "frame")
+    assert not profiler.run_fast(lambda conv, raw: False, None, "frame")
+    assert profiler.snapshot()["types"]["response.audio.delta" + FAST_PATH_SUFFIX]["count"] == 1
+
+
+def test_find_and_run_records_only_while_enabled():
+    find_and_run(None, {"type": "test.unhandled"})
+    enable_profiling(dump_on_exit=False)
+    try:
+        find_and_run(None, {"type": "test.unhandled"})
+        find_and_run(None, {"type": "test.unhandled"})
+        assert profile_snapshot()["unhandled"] == {"test.unhandled": 2}
+    finally:
+        disable_profiling()
+    assert profile_snapshot() is None
@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import tt.brain.hippocampus.utils.embed as embed_module
+from tt.brain.hippocampus.utils.embedding_cache import EmbeddingCache
+
+
+def test_hits_and_misses_are_counted_per_text():
+    cache = EmbeddingCache()
+    assert cache.get_many("m", ["a", "b"]) == [None, None]
+    cache.put_many("m", ["a"], [[0.5, 0.25]])
+    assert cache.get_many("m", ["a", "b", "a"]) == [[0.5, 0.25], None, [0.5, 0.25]]
+    # Same text under another model is a different entry
+    assert cache.get_many("other", ["a"]) == [None]
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["disk_hits"], stats["misses"]) == (2, 0, 4)
+
+
+def test_vectors_survive_a_restart_in_sqlite(tmp_path):
+    path = tmp_path / "embeddings.sqlite"
+    EmbeddingCache(path).put_many("m", ["a", "b"], [[0.5, 0.25], [1.0, -2.0]])
+
+    reopened = EmbeddingCache(path)
+    assert reopened.get_many("m", ["b", "a"]) == [[1.0, -2.0], [0.5, 0.25]]
+    assert reopened.stats()["disk_hits"] == 2
+    # Now in memory too
+    reopened.get_many("m", ["a"])
+    assert reopened.stats()["memory_hits"] == 1
+
+
+def test_memory_is_an_lru_in_front_of_disk(tmp_path):
+    cache = EmbeddingCache(tmp_path / "embeddings.sqlite", max_memory_entries=1)
+    cache.put_many("m", ["a", "b"], [[1.0], [2.0]])
+    assert cache.stats()["memory_entries"] == 1
+    assert cache.get_many("m", ["a"]) == [[1.0]]
+    assert (cache.memory_hits, cache.disk_hits) == (0, 1)
+
+
+def test_embed_only_sends_distinct_misses(monkeypatch):
+    requests = []
+
+    def create(input, model):
+        requests.append(list(input))
+        return SimpleNamespace(data=[SimpleNamespace(embedding=[float(len(t))]) for t in input])
+
+    client = SimpleNamespace(embeddings=SimpleNamespace(create=create))
+    monkeypatch.setattr(embed_module, "get_openai", lambda: client)
+    monkeypatch.setattr(embed_module, "_cache", EmbeddingCache())
+
+    assert embed_module.embed(["hi", "hello", "hi"]) == [[2.0], [5.0], [2.0]]
+    assert embed_module.embed("hello") == [[5.0]]
+    assert requests == [["hi", "hello"]]
@@ -0,0 +1,75 @@
+import asyncio
+import json
+import socket
+
+import pytest
+
+pytest.importorskip("pyaudio")
+
+from websockets.asyncio.client import connect  # noqa: E402
+from websockets.exceptions import InvalidStatus  # noqa: E402
+
+from tt.experimental.realtime_standin import serve_standin  # noqa: E402
+from tt.gateway import Gateway, parse_device_tokens  # noqa: E402
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _run_with_gateway(body):
+    """Run `body(gateway, port)` against a gateway talking to the local stand-in."""
+
+    async def main():
+        standin_port, gateway_port = _free_port(), _free_port()
+        gateway = Gateway(
+            "standin",
+            device_tokens={"kitchen": "k-token"},
+            ws_url=f"ws://127.0.0.1:{standin_port}",
+            memory=False,
+        )
+        standin_ready, gateway_ready = asyncio.Event(), asyncio.Event()
+        tasks = [
+            asyncio.create_task(serve_standin(port=standin_port, ready=standin_ready)),
+            asyncio.create_task(gateway.serve("127.0.0.1", gateway_port, ready=gateway_ready)),
+        ]
+        await standin_ready.wait()
+        await gateway_ready.wait()
+        try:
+            await body(gateway, gateway_port)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run(main())
+
+
+def test_parse_device_tokens():
+    assert parse_device_tokens(" kitchen:a ,bedroom:b:c,") == {"kitchen": "a", "bedroom": "b:c"}
+    with pytest.raises(ValueError):
+        parse_device_tokens("kitchen")
+
+
+def test_devices_without_valid_credentials_are_refused():
+    async def body(gateway, port):
+        for url in (f"ws://127.0.0.1:{port}/kitchen", f"ws://kitchen:wrong@127.0.0.1:{port}/"):
+            with pytest.raises(InvalidStatus) as refused:
+                async with connect(url):
+                    pass
+            assert refused.value.response.status_code == 401
+        assert gateway.sessions == {}
+
+    _run_with_gateway(body)
+
+
+def test_device_id_comes_from_the_credentials_not_the_path():
+    async def body(gateway, port):
+        async with connect(f"ws://kitchen:k-token@127.0.0.1:{port}/bedroom") as ws:
+            assert json.loads(await asyncio.wait_for(ws.recv(), 10)) == {"type": "state", "state": "ACTIVE"}
+            assert list(gateway.sessions) == ["kitchen"]
+            assert gateway.sessions["kitchen"].conv.tool_context.namespace == "kitchen"
+
+    _run_with_gateway(body)
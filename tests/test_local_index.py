@@ -0,0 +1,64 @@
+from tt.brain.hippocampus.local_index import LocalHighlightIndex
+
+
+def _index():
+    index = LocalHighlightIndex(initial_capacity=2)
+    index.add([
+        {"id": 1, "context": "local", "embedding": [1.0, 0.0]},
+        {"id": 2, "context": "dev1", "embedding": [1.0, 0.1], "namespace": "dev1"},
+        {"id": 3, "context": "dev2", "embedding": "[0.9, 0.1]", "namespace": "dev2"},
+    ])
+    return index
+
+
+def _contexts(rows):
+    return [row["context"] for row in rows]
+
+
+def test_search_stays_inside_namespace():
+    index = _index()
+    assert _contexts(index.search([1.0, 0.0], 0.3, 5, namespace="dev1")) == ["dev1"]
+    assert _contexts(index.search([1.0, 0.0], 0.3, 5, namespace="dev2")) == ["dev2"]
+    assert index.search([1.0, 0.0], 0.3, 5, namespace="unknown") == []
+
+
+def test_no_namespace_means_rows_without_one():
+    assert _contexts(_index().search([1.0, 0.0], 0.3, 5)) == ["local"]
+
+
+class _FakeHighlights:
+    """Just enough of a Supabase client to page `rows`; only when ordered by id."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.ordered = False
+
+    def table(self, name):
+        return self
+
+    def select(self, columns):
+        self.ordered = False
+        return self
+
+    def order(self, column):
+        self.ordered = column == "id"
+        return self
+
+    def range(self, start, end):
+        self.page = (start, end + 1)
+        return self
+
+    def execute(self):
+        assert self.ordered, "paged without a stable order"
+        rows = sorted(self.rows, key=lambda row: row["id"])[slice(*self.page)]
+        return type("Response", (), {"data": rows})()
+
+
+def test_load_pages_in_id_order(monkeypatch):
+    import tt.brain.hippocampus.local_index as local_index
+
+    monkeypatch.setattr(local_index, "PAGE_SIZE", 2)
+    rows = [{"id": i, "context": str(i), "embedding": [1.0, i / 10]} for i in (5, 1, 4, 2, 3)]
+    index = LocalHighlightIndex(initial_capacity=2)
+    index.load(_FakeHighlights(rows))
+    assert len(index) == 5
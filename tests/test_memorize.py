@@ -0,0 +1,27 @@
+import time
+
+import tt.brain.hippocampus.memorize as memorize
+
+
+def _slow(result):
+    def fn(*args):
+        time.sleep(0.1)
+        return result
+
+    return fn
+
+
+def test_stage_timings_are_wall_clock(monkeypatch):
+    monkeypatch.setattr(memorize, "summarize", _slow("summary"))
+    monkeypatch.setattr(memorize, "highlight", _slow(["highlight"]))
+    monkeypatch.setattr(memorize, "embed", lambda texts: [[0.0]] * len(texts))
+    monkeypatch.setattr(memorize, "store", lambda *args: None)
+    session = {"model": "m", "duration": 1, "messages": [], "session_start": "a", "session_end": "b"}
+
+    timings, errors = memorize.memorize_many([session] * 4)
+
+    assert errors == [None] * 4
+    # Four sessions summarized side by side take about one call's time, not four
+    assert 0.09 < timings["summarize"] < 0.3
+    assert 0.09 < timings["highlight"] < 0.3
+    assert timings["summarize"] <= timings["total"]
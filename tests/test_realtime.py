@@ -0,0 +1,55 @@
+import base64
+import time
+
+import pytest
+
+pytest.importorskip("pyaudio")
+
+from tt.brain.handlers import find_and_run  # noqa: E402
+from tt.brain.prefrontal_cortex.openai_realtime import RealtimeConversation  # noqa: E402
+from tt.utils.audio_interface_openai import AudioIO  # noqa: E402
+from tt.utils.event_trace import FakeAudioIO, FakeSocket  # noqa: E402
+
+
+def _conversation():
+    return RealtimeConversation("test", audio=FakeAudioIO(), sock=FakeSocket(), memory=False)
+
+
+def _audio_delta():
+    delta = base64.b64encode(bytes(480)).decode("ascii")
+    return {"type": "response.audio.delta", "response_id": "r1", "delta": delta}
+
+
+def test_wake_latency_runs_to_first_model_audio(capsys):
+    conv = _conversation()
+    conv.connected_at = time.monotonic()  # warm: connected before the wake word
+    conv.activate(woke_at=time.monotonic())
+    conv._push_mic(bytes(960))  # mic audio going up doesn't count
+    assert conv.first_audio_at is None
+
+    find_and_run(conv, _audio_delta())
+    first = conv.first_audio_at
+    assert first is not None and first >= conv.woke_at
+    find_and_run(conv, _audio_delta())
+    assert conv.first_audio_at == first  # the first one wins
+
+    conv.stop()
+    out = capsys.readouterr().out
+    assert "wake → first model audio:" in out
+    assert "(warm session)" in out
+
+
+def test_wake_latency_without_model_audio(capsys):
+    conv = _conversation()
+    conv.activate(woke_at=time.monotonic())
+    conv.stop()
+    assert "wake → first model audio: none played (cold session)" in capsys.readouterr().out
+
+
+def test_audio_io_opens_portaudio_only_when_started(monkeypatch):
+    import tt.utils.audio_interface_openai as audio_interface
+
+    opened = []
+    monkeypatch.setattr(audio_interface.pyaudio, "PyAudio", lambda: opened.append(1))
+    AudioIO()
+    assert opened == []
@@ -0,0 +1,40 @@
+import asyncio
+import threading
+
+import pytest
+
+pytest.importorskip("pyaudio")
+
+from tt.brain.prefrontal_cortex.openai_realtime import RATE  # noqa: E402
+from tt.brain.prefrontal_cortex.openai_realtime_async import AsyncRealtimeConversation  # noqa: E402
+from tt.experimental.load_realtime import _free_port, start_standin  # noqa: E402
+from tt.experimental.realtime_standin import StandinTimings  # noqa: E402
+from tt.utils.event_trace import FakeAudioIO  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def standin_url():
+    port = _free_port()
+    server = start_standin(port, StandinTimings())
+    yield f"ws://127.0.0.1:{port}"
+    server.terminate()
+    server.wait()
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_stop_waits_for_the_mic_pump(standin_url, shared):
+    loop = None
+    if shared:
+        loop = asyncio.new_event_loop()
+        threading.Thread(target=loop.run_forever, daemon=True).start()
+    conv = AsyncRealtimeConversation(
+        "standin", audio=FakeAudioIO(rate=RATE), ws_url=standin_url, memory=False, loop=loop
+    )
+    conv.connect()
+    conv.activate()
+    conv.discard()
+    # Cancelled and finished, not left pending (on a shared loop) or
+    # destroyed pending along with an owned one
+    assert conv._mic_task.cancelled()
+    if shared:
+        loop.call_soon_threadsafe(loop.stop)
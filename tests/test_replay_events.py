@@ -0,0 +1,71 @@
+import contextlib
+import io
+import json
+import time
+
+import pytest
+
+pytest.importorskip("pyaudio")
+
+from tt.brain.prefrontal_cortex.openai_realtime import RATE, RealtimeConversation  # noqa: E402
+from tt.experimental.load_realtime import _free_port, start_standin  # noqa: E402
+from tt.experimental.realtime_standin import StandinTimings  # noqa: E402
+from tt.experimental.replay_events import replay  # noqa: E402
+from tt.utils.event_trace import EventRecorder, FakeAudioIO  # noqa: E402
+
+# Short turns, and every one of them a get_weather call
+TIMINGS = StandinTimings(
+    utterance_ms=200, transcript_ms=10, first_audio_ms=20, tool_args_ms=20, response_ms=200, audio_speed=20.0, tool_every=1
+)
+
+
+def _record(path, tool_calls: int = 2) -> list[dict]:
+    """Record a live session against the stand-in; returns the tool outputs it sent."""
+    port = _free_port()
+    server = start_standin(port, TIMINGS)
+    sent = []
+    conv = RealtimeConversation("standin", audio=FakeAudioIO(rate=RATE), ws_url=f"ws://127.0.0.1:{port}", memory=False)
+    conv.recorder = EventRecorder(path)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            conv.connect()
+            assert conv.session_ready.wait(10)
+            send_raw = conv.sock.send_raw
+
+            def capture(text):
+                item = json.loads(text).get("item") or {}
+                if item.get("type") == "function_call_output":
+                    sent.append({"call_id": item["call_id"], "output": json.loads(item["output"])})
+                send_raw(text)
+
+            conv.sock.send_raw = capture
+            conv.activate()
+            deadline = time.monotonic() + 10
+            while len(sent) < tool_calls and time.monotonic() < deadline:
+                conv.audio.mic_queue.put(bytes(RATE // 50 * 2))  # 20 ms of silence
+                time.sleep(0.002)
+            conv.discard()
+    finally:
+        server.terminate()
+        server.wait()
+    assert len(sent) >= tool_calls
+    return sent
+
+
+def test_replay_reproduces_the_recorded_tool_calls(tmp_path):
+    trace = tmp_path / "session.jsonl.gz"
+    recorded = _record(trace)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        first = replay(trace)
+        second = replay(trace)
+
+    results = first["tool_results"]
+    assert [r["call_id"] for r in results] == [r["call_id"] for r in recorded]
+    for result, live in zip(results, recorded):
+        assert result["name"] == "get_weather"
+        assert json.loads(result["arguments"]) == {"city": "Oslo"}
+        assert result["output"] == live["output"]
+    # Same trace, same calls and outputs, every time
+    assert second["tool_results"] == results
+    assert second["messages_sent"] == first["messages_sent"]
@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+import pytest
+
+import tt.brain.hippocampus.memorize as memorize
+import tt.brain.hippocampus.spool as spool
+from tt.brain.hippocampus.spool import MemorizeWorker, MemorySpool
+
+
+@pytest.fixture
+def outcomes(monkeypatch):
+    """`errors`: what memorize_many reports, one list per call (none left = all stored)."""
+    recorded = SimpleNamespace(errors=[], calls=[])
+
+    def memorize_many(sessions):
+        recorded.calls.append([s["id"] for s in sessions])
+        errors = recorded.errors.pop(0) if recorded.errors else [None] * len(sessions)
+        return {"total": 0.0}, errors
+
+    monkeypatch.setattr(memorize, "memorize_many", memorize_many)
+    return recorded
+
+
+def test_a_spooled_session_is_stored_and_removed(tmp_path, outcomes):
+    worker = MemorizeWorker(MemorySpool(tmp_path))
+    entry = worker.spool.put({"id": 1})
+    assert worker.spool.pending() == [entry]
+
+    assert worker._drain_once() == 0
+    assert outcomes.calls == [[1]]
+    assert worker.spool.pending() == []
+    assert worker._drain_once() is None  # Nothing left: sleep until notified
+
+
+def test_a_failure_is_retried_after_a_backoff(tmp_path, outcomes):
+    worker = MemorizeWorker(MemorySpool(tmp_path))
+    worker.spool.put({"id": 1})
+    outcomes.errors.append([RuntimeError("offline")])
+
+    assert worker._drain_once() == 0
+    [entry] = worker.spool.pending()
+    assert worker.spool.attempts(entry) == 1
+    # Not due yet: the worker sleeps until the backoff runs out
+    assert 0 < worker._drain_once() <= spool.BASE_BACKOFF
+    assert outcomes.calls == [[1]]
+
+
+def test_attempts_survive_a_restart_and_end_in_failed(tmp_path, outcomes, monkeypatch):
+    monkeypatch.setattr(spool, "MAX_ATTEMPTS", 3)
+    queue = MemorySpool(tmp_path)
+    queue.put({"id": 1})
+    for attempt in range(1, 3):
+        outcomes.errors.append([RuntimeError("offline")])
+        # A fresh worker each time, as after a crash or restart
+        MemorizeWorker(queue)._drain_once()
+        [entry] = queue.pending()
+        assert queue.attempts(entry) == attempt
+
+    outcomes.errors.append([RuntimeError("offline")])
+    MemorizeWorker(queue)._drain_once()
+    assert queue.pending() == []
+    [failed] = queue.failed_path.glob("*.json")
+    assert queue.load(failed) == {"id": 1}
+    assert len(outcomes.calls) == 3
+
+
+def test_an_unreadable_entry_goes_to_failed(tmp_path, outcomes):
+    queue = MemorySpool(tmp_path)
+    queue.path.mkdir(parents=True, exist_ok=True)
+    (queue.path / "broken.json").write_text("{not json")
+
+    MemorizeWorker(queue)._drain_once()
+    assert queue.pending() == []
+    assert [p.name for p in queue.failed_path.iterdir()] == ["broken.json"]
+    assert outcomes.calls == []
@@ -0,0 +1,81 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from tt.brain.handlers.websocket_tool_calls import (
+    CONTINUE_RESPONSE,
+    ToolCallBatches,
+    _execute_tool_call,
+)
+from tt.utils.event_trace import FakeSocket
+
+
+def _conversation(deadline: float = 5.0):
+    sock = FakeSocket()
+    log = SimpleNamespace(add_tool_call=lambda *args: None, add_tool_result=lambda *args: None)
+    batches = ToolCallBatches(lambda: sock.send(CONTINUE_RESPONSE), deadline=deadline)
+    return SimpleNamespace(sock=sock, log=log, tool_batches=batches)
+
+
+def _sent(conv) -> list[str]:
+    """What went out, in order: a call_id per output, "continue" per response.create."""
+    kinds = []
+    for _, obj in conv.sock.sent:
+        if obj["type"] == "response.create":
+            kinds.append("continue")
+        else:
+            kinds.append(obj["item"]["call_id"])
+    return kinds
+
+
+def test_a_fanned_out_response_continues_once_after_all_outputs(registry):
+    @registry(description="Echo.")
+    def _echo(n: int):
+        return {"n": n}
+
+    conv = _conversation()
+    for call_id in ("c1", "c2"):
+        conv.tool_batches.add("r1", call_id)
+    _execute_tool_call(conv, "c1", "_echo", '{"n": 1}', "r1")
+    conv.tool_batches.response_done("r1")
+    assert _sent(conv) == ["c1"]  # still waiting on c2
+    _execute_tool_call(conv, "c2", "_echo", '{"n": 2}', "r1")
+    assert _sent(conv) == ["c1", "c2", "continue"]
+
+
+def test_responses_batch_separately():
+    sent = []
+    batches = ToolCallBatches(lambda: sent.append("continue"))
+    batches.add("r1", "c1")
+    batches.add("r2", "c2")
+    batches.response_done("r1")
+    batches.response_done("r2")
+    assert batches.finish("r2", "c2", lambda: sent.append("c2"))
+    assert sent == ["c2", "continue"]
+    assert batches.busy()
+    assert batches.finish("r1", "c1", lambda: sent.append("c1"))
+    assert sent == ["c2", "continue", "c1", "continue"]
+    assert not batches.busy()
+
+
+def test_an_output_after_the_deadline_is_dropped(registry, capsys):
+    release = threading.Event()
+
+    @registry(description="Slow.", timeout=None)
+    def _slow():
+        release.wait(5)
+        return {"late": True}
+
+    conv = _conversation(deadline=0.05)
+    conv.tool_batches.add("r1", "c1")
+    worker = threading.Thread(target=_execute_tool_call, args=(conv, "c1", "_slow", "{}", "r1"))
+    worker.start()
+    conv.tool_batches.response_done("r1")
+    time.sleep(0.15)
+    assert _sent(conv) == ["continue"]  # the deadline let the model carry on
+
+    release.set()
+    worker.join(5)
+    # No function_call_output trailing the response.create it missed
+    assert _sent(conv) == ["continue"]
+    assert "_slow finished after its batch deadline" in capsys.readouterr().out
@@ -0,0 +1,174 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tt.brain.handlers.tools_plug import (
+    _REGISTRY,
+    CachePolicy,
+    ToolContext,
+    ToolTimeoutError,
+    arun_tool,
+    get_tool_definitions,
+    run_in_tool_context,
+    run_tool,
+    validate_tool_args,
+)
+
+
+def test_tool_without_parameters_gets_its_arguments(registry):
+    @registry(description="Echo a message (no declared parameters).")
+    def _echo_undeclared(message: str):
+        return {"message": message}
+
+    assert run_tool("_echo_undeclared", {"message": "hi"}) == {"message": "hi"}
+
+
+def test_tool_without_parameters_drops_unknown_arguments(registry):
+    @registry(description="Takes nothing.")
+    def _no_args():
+        return {"ok": True}
+
+    assert run_tool("_no_args", {"unexpected": 1}) == {"ok": True}
+
+
+def test_get_memories_accepts_message():
+    import tt.brain.tools  # noqa: F401  (registers get_memories)
+
+    assert validate_tool_args("get_memories", {"message": "hi"}) == {"message": "hi"}
+
+
+def test_capped_tool_without_timeout_waits_for_a_slot(registry):
+    @registry(description="Capped, no timeout.", timeout=None, max_concurrency=1)
+    def _capped_no_timeout():
+        return {"ok": True}
+
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda _: run_tool("_capped_no_timeout", {}), range(8)))
+    assert results == [{"ok": True}] * 8
+    assert asyncio.run(arun_tool("_capped_no_timeout", {})) == {"ok": True}
+
+
+def test_run_tool_timeout_caps_the_tools_own(registry):
+    @registry(description="Slow, with a fallback.", timeout=5.0, fallback={"late": True})
+    def _slow_with_fallback():
+        time.sleep(1.0)
+        return {"late": False}
+
+    start = time.monotonic()
+    assert run_tool("_slow_with_fallback", {}, timeout=0.05) == {"late": True}
+    assert time.monotonic() - start < 0.5
+
+
+def test_timeout_raised_by_the_tool_is_a_tool_error(registry):
+    @registry(description="Its own HTTP call timed out.", fallback={"fallback": True})
+    def _raises_timeout():
+        raise TimeoutError("upstream timed out")
+
+    with pytest.raises(TimeoutError, match="upstream"):
+        run_tool("_raises_timeout", {})
+    with pytest.raises(TimeoutError, match="upstream"):
+        asyncio.run(arun_tool("_raises_timeout", {}))
+
+
+def test_none_is_a_valid_fallback(registry):
+    @registry(description="Slow; None when late.", timeout=0.05, fallback=None)
+    def _slow_none_fallback():
+        time.sleep(0.5)
+        return {"late": False}
+
+    @registry(description="Slow; no fallback.", timeout=0.05)
+    def _slow_no_fallback():
+        time.sleep(0.5)
+        return {"late": False}
+
+    assert run_tool("_slow_none_fallback", {}) is None
+    assert asyncio.run(arun_tool("_slow_none_fallback", {})) is None
+    with pytest.raises(ToolTimeoutError, match="after 0.05s"):
+        run_tool("_slow_no_fallback", {})
+
+
+def test_arun_tool_waiting_for_a_slot_counts_one_miss(registry):
+    release = threading.Event()
+
+    @registry(description="Cached, one at a time.", max_concurrency=1, cache=CachePolicy(ttl=60))
+    def _cached_capped(n: int):
+        release.wait(5)
+        return {"n": n}
+
+    cache = _REGISTRY["_cached_capped"]["cache"]
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        holder = loop.run_in_executor(None, run_tool, "_cached_capped", {"n": 1})
+        while not cache.inflight:  # n=1 holds the only slot
+            await asyncio.sleep(0.01)
+        waiter = asyncio.create_task(arun_tool("_cached_capped", {"n": 2}))
+        await asyncio.sleep(0.1)  # probed, now waiting for the slot off the loop
+        # The probe that found no slot published nothing for others to join
+        assert len(cache.inflight) == 1
+        release.set()
+        return await holder, await waiter
+
+    assert asyncio.run(main()) == ({"n": 1}, {"n": 2})
+    assert cache.stats()["misses"] == 2
+    assert cache.stats()["coalesced"] == 0
+
+
+def test_cached_result_is_reused_until_its_ttl(registry):
+    calls = []
+
+    @registry(description="Cached briefly.", cache=CachePolicy(ttl=0.1))
+    def _cached_briefly(n: int):
+        calls.append(n)
+        return {"n": n, "call": len(calls)}
+
+    assert run_tool("_cached_briefly", {"n": 1}) == {"n": 1, "call": 1}
+    assert run_tool("_cached_briefly", {"n": 1}) == {"n": 1, "call": 1}
+    assert run_tool("_cached_briefly", {"n": 2}) == {"n": 2, "call": 2}
+    time.sleep(0.15)
+    assert run_tool("_cached_briefly", {"n": 1}) == {"n": 1, "call": 3}
+    stats = _REGISTRY["_cached_briefly"]["cache"].stats()
+    assert (stats["hits"], stats["misses"]) == (1, 3)
+
+
+def test_concurrent_identical_calls_run_once(registry):
+    calls = []
+    release = threading.Event()
+
+    @registry(description="Cached, slow.", cache=CachePolicy(ttl=60))
+    def _cached_slow(n: int):
+        calls.append(n)
+        release.wait(5)
+        return {"n": n}
+
+    cache = _REGISTRY["_cached_slow"]["cache"]
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(run_tool, "_cached_slow", {"n": 1}) for _ in range(4)]
+        while cache.coalesced < 3:  # the other three joined the first call
+            time.sleep(0.01)
+        release.set()
+        assert [f.result() for f in futures] == [{"n": 1}] * 4
+    assert calls == [1]
+    assert cache.stats()["misses"] == 1
+
+
+def test_argumentless_tools_cache_one_entry_per_namespace():
+    import tt.brain.tools  # noqa: F401  (registers the tools)
+
+    for name in ("get_user_profile", "get_upcoming_events"):
+        cache = _REGISTRY[name]["cache"]
+        for namespace in ("kitchen", "office", "kitchen", "office"):
+            run_in_tool_context(ToolContext(namespace=namespace), run_tool, name, {})
+        # Two devices alternating don't evict each other
+        assert {("kitchen", "{}"), ("office", "{}")} <= set(cache.entries)
+        assert cache.policy.max_entries >= 64
+
+
+def test_earlier_tests_left_no_tools_behind():
+    # Runs last in this file: every test tool above was registered through
+    # the `registry` fixture, which removes it again
+    assert not [name for name in _REGISTRY if name.startswith("_")]
+    assert not [d for d in get_tool_definitions() if d["name"].startswith("_")]
@@ -0,0 +1,35 @@
+import json
+
+from tt.utils.turn_tracer import TurnLatencySink, TurnTracer
+
+
+def test_sink_appends_every_turn_through_one_handle(tmp_path):
+    path = tmp_path / "logs" / "turn_latency.jsonl"
+    sink = TurnLatencySink(path)
+    tracer = TurnTracer(sink, session="s1")
+    for _ in range(3):
+        tracer.start_turn()
+        tracer.mark("first_audio_delta")
+    tracer.end_turn()
+    handle = sink._file
+
+    tracer.start_turn()
+    tracer.end_turn()
+    assert sink._file is handle  # not reopened per turn
+
+    sink.close()
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [span["turn"] for span in lines] == [1, 2, 3, 4]
+    assert all(span["session"] == "s1" for span in lines)
+    assert sink.summary()["first_audio_delta"]["count"] == 3
+
+
+def test_sink_without_a_path_keeps_only_percentiles():
+    sink = TurnLatencySink(None)
+    tracer = TurnTracer(sink)
+    tracer.start_turn()
+    tracer.mark("transcript_completed")
+    tracer.end_turn()
+    assert sink.turns == 1
+    assert sink._file is None
+    assert set(sink.summary()) == {"transcript_completed"}
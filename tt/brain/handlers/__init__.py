@@ -6,10 +6,15 @@ Each handler receives (conv, msg) where:
 - msg: The message dict from the API
 """
 
+import atexit
+
 from tt.brain.handlers.audio import (
     on_audio_delta,
     on_audio_done,
+    try_fast_audio_delta,
 )
+from tt.brain.handlers.dispatch_profile import DispatchProfiler
+from tt.brain.handlers.speech import on_speech_stopped
 from tt.brain.handlers.transcript import (
     on_ai_transcript_delta,
     on_ai_transcript_done,
@@ -19,11 +24,13 @@ from tt.brain.handlers.transcript import (
 from tt.brain.handlers.websocket_tool_calls import (
     on_function_call_args_delta,
     on_function_call_args_done,
+    on_response_done,
 )
 
 
 # Handler registry: maps event type -> handler function
 HANDLERS = {
+    "input_audio_buffer.speech_stopped": on_speech_stopped,
     "response.audio.delta": on_audio_delta,
     "response.audio.done": on_audio_done,
     "response.audio_transcript.delta": on_ai_transcript_delta,
@@ -32,6 +39,7 @@ HANDLERS = {
     "conversation.item.input_audio_transcription.failed": on_user_transcript_failed,
     "response.function_call_arguments.delta": on_function_call_args_delta,
     "response.function_call_arguments.done": on_function_call_args_done,
+    "response.done": on_response_done,
 }
 
 
@@ -41,8 +49,61 @@ def find_and_run(conv, msg: dict) -> bool:
     Returns True if handled, False otherwise.
     """
     handler = HANDLERS.get(msg.get("type"))
+    if _profiler is not None:
+        return _profiler.run(handler, conv, msg, msg.get("type"))
     if handler:
         handler(conv, msg)
         return True
     return False
 
+
+def try_fast_path(conv, raw) -> bool:
+    """Handle a raw frame without JSON parsing if it's one we can (audio deltas)."""
+    if _profiler is not None:
+        return _profiler.run_fast(try_fast_audio_delta, conv, raw)
+    return try_fast_audio_delta(conv, raw)
+
+
+# -------------------------------------------------------------------
+# Dispatch profiling (see dispatch_profile.py)
+# -------------------------------------------------------------------
+
+_profiler = None
+
+
+def enable_profiling(dump_on_exit: bool = True) -> DispatchProfiler:
+    """Start recording per-event-type dispatch stats (idempotent)."""
+    global _profiler
+    if _profiler is None:
+        _profiler = DispatchProfiler()
+        if dump_on_exit:
+            atexit.register(_dump_profile)
+    return _profiler
+
+
+def disable_profiling():
+    global _profiler
+    _profiler = None
+
+
+def profile_snapshot() -> dict | None:
+    """Current dispatch stats, or None if profiling is off."""
+    profiler = _profiler
+    return profiler.snapshot() if profiler else None
+
+
+def _dump_profile():
+    profiler = _profiler
+    if profiler is not None:
+        print(profiler.report())
+
+
+def _enable_from_config():
+    from tt.config import PROFILE_DISPATCH
+
+    if PROFILE_DISPATCH:
+        enable_profiling()
+
+
+_enable_from_config()
+
@@ -1,14 +1,52 @@
 """Handlers for audio streaming events."""
 
-import base64
+import binascii
+
+# Audio deltas are the bulk of inbound traffic, so they get a fast path that
+# skips the generic json.loads -> dict -> find_and_run route. The server puts
+# "type" first; anything that doesn't look exactly like that falls through to
+# the normal path untouched.
+_AUDIO_DELTA_PREFIX = '{"type":"response.audio.delta"'
+_DELTA_KEY = '"delta":"'
 
 
 def on_audio_delta(conv, msg: dict):
     """Stream audio chunk to speaker."""
-    conv.audio.push_tts(base64.b64decode(msg["delta"]))
+    conv.audio.push_tts(binascii.a2b_base64(msg["delta"]))
+    _mark_first_audio(conv)
+
+
+def _mark_first_audio(conv):
+    tracer = getattr(conv, "tracer", None)
+    if tracer:
+        tracer.mark("first_audio_delta")
+
+
+def try_fast_audio_delta(conv, raw) -> bool:
+    """
+    Handle a raw `response.audio.delta` frame without parsing it as JSON.
+
+    Slices the base64 payload out of the frame text, decodes it to bytes and
+    pushes those to the speaker, which copies them into its ring buffer (one
+    intermediate bytes object per delta; binascii can't decode in place).
+    Returns False (frame not consumed) for anything
+    else, including payloads with JSON escapes, so the caller falls back to
+    the generic path.
+    """
+    if not isinstance(raw, str) or not raw.startswith(_AUDIO_DELTA_PREFIX):
+        return False
+    start = raw.find(_DELTA_KEY, len(_AUDIO_DELTA_PREFIX))
+    if start < 0:
+        return False
+    start += len(_DELTA_KEY)
+    end = raw.find('"', start)
+    if end < 0 or raw.find("\\", start, end) >= 0:
+        return False
+    conv.audio.push_tts(binascii.a2b_base64(raw[start:end]))
+    _mark_first_audio(conv)
+    return True
 
 
 def on_audio_done(conv, msg: dict):
     """Clear input buffer when model finishes speaking."""
     conv.sock.send({"type": "input_audio_buffer.clear"})
-
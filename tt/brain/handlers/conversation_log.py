@@ -1,10 +1,9 @@
 """Conversation history tracking and JSON persistence."""
 
-import json
 from datetime import datetime
 from pathlib import Path
 
-from tt.brain.hippocampus.memorize import memorize
+from tt.brain.hippocampus.spool import enqueue
 
 DEFAULT_LOG_DIR = Path("conversation_logs")
 
@@ -12,10 +11,13 @@ DEFAULT_LOG_DIR = Path("conversation_logs")
 class ConversationLog:
     """Tracks conversation history and saves to JSON."""
 
-    def __init__(self, model: str, voice: str, log_dir: Path = DEFAULT_LOG_DIR):
+    def __init__(
+        self, model: str, voice: str, log_dir: Path = DEFAULT_LOG_DIR, namespace: str | None = None
+    ):
         self.model = model
         self.voice = voice
         self.log_dir = log_dir
+        self.namespace = namespace  # memory namespace the session is stored under
         self.messages: list[dict] = []
         self.session_start = datetime.now()
 
@@ -39,6 +41,20 @@ class ConversationLog:
         self.add("tool_result", tool_name=tool_name, output=output)
 
     def save(self):
+        """
+        Hand the session to the background memorize worker and return.
+        The session is spooled to disk first, so nothing is lost if the
+        process exits before it's memorized.
+        """
         session_end = datetime.now()
         duration = session_end - self.session_start
-        memorize(self.model, duration, self.messages, self.session_start, session_end)
+        return enqueue(
+            {
+                "model": self.model,
+                "duration": int(duration.total_seconds()),
+                "messages": self.messages,
+                "session_start": self.session_start.isoformat(),
+                "session_end": session_end.isoformat(),
+                "namespace": self.namespace,
+            }
+        )
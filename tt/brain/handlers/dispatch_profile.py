@@ -0,0 +1,117 @@
+"""
+Opt-in profiling of server event dispatch.
+
+Every event the Realtime socket receives is handled on the receive thread,
+so a slow handler delays the audio deltas queued behind it. When enabled
+(PROFILE_DISPATCH=1, `python -m tt.main --profile-dispatch`, or
+enable_profiling()), find_and_run and the audio fast path record per event
+type: count, total/max handler time and a latency histogram, plus a tally of
+event types nobody handles. When disabled the cost is one global check.
+
+    from tt.brain.handlers import enable_profiling, profile_snapshot
+    enable_profiling()
+    ...
+    profile_snapshot()["types"]["response.audio.delta"]["max_us"]
+"""
+
+import threading
+import time
+from collections import Counter
+
+# Histogram bucket upper bounds in microseconds (last bucket is open-ended)
+BUCKETS_US = (10, 30, 100, 300, 1_000, 3_000, 10_000, 30_000, 100_000)
+_BUCKET_LABELS = [f"<{b}us" if b < 1000 else f"<{b // 1000}ms" for b in BUCKETS_US] + [
+    f">={BUCKETS_US[-1] // 1000}ms"
+]
+FAST_PATH_SUFFIX = " [fast]"
+
+
+class _TypeStats:
+    __slots__ = ("count", "total_ns", "max_ns", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * (len(BUCKETS_US) + 1)
+
+
+class DispatchProfiler:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._types = {}  # event type -> _TypeStats
+        self._unhandled = Counter()
+        self.started = time.monotonic()
+
+    def run(self, handler, conv, msg: dict, typ) -> bool:
+        """Run (and time) the handler for one event; mirrors find_and_run."""
+        if handler is None:
+            with self._lock:
+                self._unhandled[typ] += 1
+            return False
+        t0 = time.perf_counter_ns()
+        try:
+            handler(conv, msg)
+        finally:
+            self._record(typ, time.perf_counter_ns() - t0)
+        return True
+
+    def run_fast(self, fast_path, conv, raw) -> bool:
+        """Time a raw-frame fast path; only frames it consumed are recorded."""
+        t0 = time.perf_counter_ns()
+        handled = fast_path(conv, raw)
+        if handled:
+            self._record("response.audio.delta" + FAST_PATH_SUFFIX, time.perf_counter_ns() - t0)
+        return handled
+
+    def _record(self, typ, elapsed_ns: int):
+        us = elapsed_ns / 1000
+        bucket = len(BUCKETS_US)
+        for i, bound in enumerate(BUCKETS_US):
+            if us < bound:
+                bucket = i
+                break
+        with self._lock:
+            stats = self._types.get(typ)
+            if stats is None:
+                stats = self._types[typ] = _TypeStats()
+            stats.count += 1
+            stats.total_ns += elapsed_ns
+            if elapsed_ns > stats.max_ns:
+                stats.max_ns = elapsed_ns
+            stats.buckets[bucket] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            types = {
+                typ: {
+                    "count": s.count,
+                    "total_ms": s.total_ns / 1e6,
+                    "mean_us": s.total_ns / s.count / 1000 if s.count else 0.0,
+                    "max_us": s.max_ns / 1000,
+                    "histogram": dict(zip(_BUCKET_LABELS, s.buckets)),
+                }
+                for typ, s in self._types.items()
+            }
+            unhandled = dict(self._unhandled)
+        return {
+            "uptime_s": time.monotonic() - self.started,
+            "types": types,
+            "unhandled": unhandled,
+        }
+
+    def report(self) -> str:
+        snap = self.snapshot()
+        lines = [f"[dispatch] Event handling over {snap['uptime_s']:.0f}s (sorted by total time)"]
+        lines.append(f"  {'event type':<58} {'count':>7} {'total ms':>9} {'mean us':>8} {'max us':>9}")
+        for typ, s in sorted(snap["types"].items(), key=lambda kv: -kv[1]["total_ms"]):
+            lines.append(
+                f"  {typ:<58} {s['count']:>7} {s['total_ms']:>9.1f} {s['mean_us']:>8.1f} {s['max_us']:>9.1f}"
+            )
+            busy = [f"{label}:{n}" for label, n in s["histogram"].items() if n]
+            lines.append(f"      {' '.join(busy)}")
+        if snap["unhandled"]:
+            lines.append("  unhandled: " + ", ".join(
+                f"{typ} x{n}" for typ, n in sorted(snap["unhandled"].items(), key=lambda kv: -kv[1])
+            ))
+        return "\n".join(lines)
@@ -0,0 +1,102 @@
+"""
+Speculative get_memories prefetch.
+
+As soon as a user transcript completes, start recalling memories for the
+recent user turns in the background. When the model then calls get_memories
+with the same context, the answer is usually already there instead of costing
+an embed + search round trip of dead air.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from tt.brain.handlers.tools_plug import ToolContext, run_in_tool_context, run_tool
+
+# get_memories searches on the last few user turns combined
+RECENT_USER_TURNS = 3
+
+
+def recent_user_query(log, turns: int = RECENT_USER_TURNS) -> str:
+    """Combine the last `turns` user messages (oldest first) into one query."""
+    user_messages = [
+        entry.get("content", "")
+        for entry in reversed(log.messages)
+        if entry.get("role") == "user"
+    ][:turns]
+    return " ".join(reversed(user_messages)).strip()
+
+
+class MemoryPrefetcher:
+    """Holds at most one in-flight prefetch, keyed by user turn + query."""
+
+    def __init__(self, context: ToolContext | None = None, pool: ThreadPoolExecutor | None = None):
+        # Recalls run as `context` (so they search that device's memories),
+        # on `pool` if one is shared between conversations, else our own
+        self.context = context
+        self._owns_pool = pool is None
+        self._pool = pool or ThreadPoolExecutor(max_workers=2, thread_name_prefix="tt-prefetch")
+        self._lock = threading.Lock()
+        self._turn = None
+        self._query = None
+        self._future = None
+
+        # Counters
+        self.started = 0
+        self.cancelled = 0
+        self.hits = 0
+        self.misses = 0
+
+    def start(self, turn: int, query: str):
+        """Begin recalling for `query`; supersedes any older prefetch."""
+        if not query:
+            return
+        with self._lock:
+            if self._future is not None and self._future.cancel():
+                self.cancelled += 1  # Still queued: never ran
+            # A stale prefetch that's already running can't be interrupted,
+            # but nothing will ever consume its result
+            self._turn, self._query = turn, query
+            self._future = self._pool.submit(
+                run_in_tool_context, self.context, run_tool, "get_memories", {"message": query}
+            )
+            self.started += 1
+
+    def take(self, query: str, timeout: float) -> dict | None:
+        """
+        Return the prefetched get_memories result for `query`, waiting up to
+        `timeout` seconds if it's still running. None means the caller should
+        run the tool itself (no matching prefetch, timed out, or it failed).
+        """
+        with self._lock:
+            future = self._future if query and self._query == query else None
+            if future is None:
+                self.misses += 1
+                return None
+        try:
+            result = future.result(timeout)
+        except Exception:
+            result = None
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "turn": self._turn,
+                "started": self.started,
+                "cancelled": self.cancelled,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def shutdown(self):
+        if self._owns_pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            return
+        with self._lock:
+            if self._future is not None:
+                self._future.cancel()
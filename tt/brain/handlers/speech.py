@@ -0,0 +1,8 @@
+"""Handlers for server VAD speech events."""
+
+
+def on_speech_stopped(conv, msg: dict):
+    """The user stopped speaking: a new turn starts for latency tracing."""
+    tracer = getattr(conv, "tracer", None)
+    if tracer:
+        tracer.start_turn()
@@ -15,13 +15,319 @@ To add a new tool, create a file in tt/brain/tools/ and decorate a function with
         return {"city": city, "temp": 72}
 
 The tool is automatically available to both OpenAI and ElevenLabs.
+
+Every call runs on one shared, bounded thread pool. Per tool you can set a
+timeout, a concurrency cap and a fallback result for when it times out:
+
+    @tool(description="...", timeout=3.0, max_concurrency=2, fallback={"events": []})
+
+Results can be cached per tool (shared by OpenAI and ElevenLabs calls, and
+across sessions in the same process). Identical calls that overlap are
+coalesced into one execution:
+
+    @tool(description="...", cache=CachePolicy(ttl=600, max_entries=64))
+
+Tools can also be `async def`. They run on one shared background event loop
+instead of a pool thread, and can use the pooled HTTP client:
+
+    @tool(description="Return the weather for a city.", parameters={...})
+    async def get_weather(city: str):
+        client = get_http_client()
+        response = await client.get("https://weather.example/api", params={"q": city})
+        return response.json()
+
+Tools are shared by every conversation in the process. What differs per
+conversation (which device, whose memories) travels as a ToolContext in a
+contextvar: callers set it with run_in_tool_context(), tools read it with
+current_tool_context(), and it follows the call onto the pool or tool loop.
+Cached results are kept per memory namespace.
 """
 
-# Global registry: name -> {"the_actual_function": callable, "definition": dict}
+import asyncio
+import contextvars
+import copy
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable
+
+# Shared pool every tool call runs on
+TOOL_POOL_SIZE = 8
+DEFAULT_TOOL_TIMEOUT = 10.0  # seconds
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=TOOL_POOL_SIZE, thread_name_prefix="tt-tool")
+
+# A tool's `fallback` when it declares none (None is a valid fallback result)
+_NO_FALLBACK = object()
+
+# Global registry: name -> {"the_actual_function": callable, "definition": dict, + execution policy}
 _REGISTRY = {}
+# Bumped on every registration so consumers can cache derived payloads
+_registry_version = 0
+_definitions_cache = None  # (version, [definition, ...])
+
+# Shared event loop (own thread) that every async tool runs on, plus the
+# pooled HTTP client bound to it. Both are created on first use.
+_tool_loop = None
+_tool_loop_lock = threading.Lock()
+_http_client = None
+
+
+@dataclass(frozen=True)
+class ToolContext:
+    """Who a tool call is for. The default (all None) is the single local device."""
+
+    device_id: str | None = None
+    namespace: str | None = None  # memory namespace; None = the shared default
+
+
+_tool_context = contextvars.ContextVar("tt_tool_context", default=ToolContext())
+
+
+def current_tool_context() -> ToolContext:
+    """The ToolContext of the call being executed (for use inside tools)."""
+    return _tool_context.get()
+
+
+def run_in_tool_context(context: ToolContext | None, fn, *args, **kwargs):
+    """Call fn with `context` as the current ToolContext (None keeps the current one)."""
+    if context is None:
+        return fn(*args, **kwargs)
+    token = _tool_context.set(context)
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        _tool_context.reset(token)
+
+
+class ToolTimeoutError(TimeoutError):
+    """A tool didn't finish (or couldn't get a concurrency slot) within its timeout."""
+
+
+class ToolArgumentError(ValueError):
+    """Arguments failed the tool's schema. `errors` is a list of {"field", "error"}."""
+
+    def __init__(self, tool_name: str, errors: list[dict]):
+        self.tool_name = tool_name
+        self.errors = errors
+        details = "; ".join(f"{e['field']}: {e['error']}" if e["field"] else e["error"] for e in errors)
+        super().__init__(f"Invalid arguments for {tool_name}: {details}")
+
+    def to_output(self) -> dict:
+        """Structured function_call_output payload for the model."""
+        return {"error": "invalid_arguments", "tool": self.tool_name, "details": self.errors}
+
+
+# -------------------------------------------------------------------
+# Argument validation (compiled once per tool at registration)
+# -------------------------------------------------------------------
+
+_TRUE = {"true", "yes", "1"}
+_FALSE = {"false", "no", "0"}
+
+
+def _coerce_string(value):
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise TypeError("expected a string")
+
+
+def _coerce_integer(value):
+    if isinstance(value, bool):
+        raise TypeError("expected an integer")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            pass
+    raise TypeError("expected an integer")
+
+
+def _coerce_number(value):
+    if isinstance(value, bool):
+        raise TypeError("expected a number")
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            pass
+    raise TypeError("expected a number")
+
+
+def _coerce_boolean(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in _TRUE | _FALSE:
+        return value.strip().lower() in _TRUE
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    raise TypeError("expected a boolean")
+
+
+def _expect(kind, label):
+    def check(value):
+        if not isinstance(value, kind):
+            raise TypeError(f"expected {label}")
+        return value
+
+    return check
+
+
+_COERCERS = {
+    "string": _coerce_string,
+    "integer": _coerce_integer,
+    "number": _coerce_number,
+    "boolean": _coerce_boolean,
+    "array": _expect(list, "an array"),
+    "object": _expect(dict, "an object"),
+}
+
+
+def _compile_validator(tool_name: str, schema: dict, passthrough=()):
+    """
+    Turn a tool's parameter schema into a fast validate(args) -> args function.
+    Known arguments are type-checked and coerced (e.g. "3" -> 3 for integers),
+    missing required ones are reported, unknown ones are dropped.
+
+    `passthrough` names arguments the function takes without declaring them
+    in the schema (e.g. get_memories' message, built by the caller rather
+    than the model); those are passed on unchecked. "*" passes every
+    undeclared argument (the function takes **kwargs).
+    """
+    fields = [
+        (name, _COERCERS.get(spec.get("type", "string"), lambda v: v))
+        for name, spec in schema.get("properties", {}).items()
+    ]
+    required = tuple(schema.get("required", ()))
+    declared = {name for name, _ in fields}
+    passthrough = passthrough if passthrough == "*" else tuple(n for n in passthrough if n not in declared)
+
+    def validate(args) -> dict:
+        if args is None:
+            args = {}
+        if not isinstance(args, dict):
+            raise ToolArgumentError(tool_name, [{"field": None, "error": "arguments must be an object"}])
+        clean, errors = {}, []
+        for name, coerce in fields:
+            if name not in args or args[name] is None:
+                continue
+            try:
+                clean[name] = coerce(args[name])
+            except TypeError as e:
+                errors.append({"field": name, "error": f"{e}, got {args[name]!r}"})
+        if passthrough == "*":
+            clean.update((k, v) for k, v in args.items() if k not in declared)
+        else:
+            for name in passthrough:
+                if name in args:
+                    clean[name] = args[name]
+        for name in required:
+            if name not in clean and not any(e["field"] == name for e in errors):
+                errors.append({"field": name, "error": "is required"})
+        if errors:
+            raise ToolArgumentError(tool_name, errors)
+        return clean
+
+    return validate
+
+
+def _undeclared_params(fn):
+    """Names fn accepts as keyword arguments ("*" if it takes **kwargs)."""
+    names = []
+    for param in inspect.signature(fn).parameters.values():
+        if param.kind is inspect.Parameter.VAR_KEYWORD:
+            return "*"
+        if param.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY):
+            names.append(param.name)
+    return tuple(names)
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    How to cache a tool's results.
+
+    ttl: seconds a result stays fresh.
+    max_entries: LRU bound on distinct argument sets kept.
+    key: callable(args) -> hashable cache key. Defaults to the arguments
+         themselves (JSON with sorted keys).
+    """
+
+    ttl: float
+    max_entries: int = 128
+    key: Callable[[dict], object] | None = None
+
+
+class _ResultCache:
+    """TTL + LRU result cache with single-flight for one tool."""
+
+    def __init__(self, policy: CachePolicy):
+        self.policy = policy
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()  # key -> (expires_at, result)
+        self.inflight = {}  # key -> Future shared by every concurrent caller
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def key(self, args: dict):
+        if self.policy.key is not None:
+            return self.policy.key(args)
+        return json.dumps(args, sort_keys=True, default=str)
+
+    def lookup(self, key):
+        """Fresh cached result as (True, result), else (False, None). Caller holds lock."""
+        cached = self.entries.get(key)
+        if cached is None:
+            return False, None
+        expires_at, result = cached
+        if expires_at < time.monotonic():
+            del self.entries[key]
+            return False, None
+        self.entries.move_to_end(key)
+        return True, result
 
+    def store(self, key, result):
+        """Caller holds lock."""
+        self.entries[key] = (time.monotonic() + self.policy.ttl, result)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.policy.max_entries:
+            self.entries.popitem(last=False)
 
-def tool(description: str, parameters: dict | None = None):
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "entries": len(self.entries),
+            "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+        }
+
+
+def tool(
+    description: str,
+    parameters: dict | None = None,
+    timeout: float | None = DEFAULT_TOOL_TIMEOUT,
+    max_concurrency: int | None = None,
+    fallback=_NO_FALLBACK,
+    cache: CachePolicy | None = None,
+):
     """
     Decorator to register a tool function.
     
@@ -29,8 +335,17 @@ def tool(description: str, parameters: dict | None = None):
         description: What the tool does (shown to the AI).
         parameters: Dict of param_name -> {"type": str, "description": str, "required": bool}
                    If None, the tool takes no parameters.
+        timeout: Seconds a call may take (including waiting for a concurrency
+                 slot) before it's abandoned. None waits forever.
+        max_concurrency: Max simultaneous calls of this tool. None = no cap
+                 beyond the shared pool size.
+        fallback: Result returned instead of an error when a call times out
+                 (any value, None included). Unset: a timeout raises.
+        cache: CachePolicy to reuse results for identical arguments. Cached
+                 results are shared between callers, so treat them as read-only.
     """
     def decorator(the_actual_function):
+        global _registry_version
         name = the_actual_function.__name__
         
         # Build OpenAI-compatible parameter schema
@@ -55,7 +370,19 @@ def tool(description: str, parameters: dict | None = None):
             },
         }
         
-        _REGISTRY[name] = {"the_actual_function": the_actual_function, "definition": definition}
+        _REGISTRY[name] = {
+            "the_actual_function": the_actual_function,
+            "definition": definition,
+            "validate": _compile_validator(
+                name, definition["parameters"], _undeclared_params(the_actual_function)
+            ),
+            "timeout": timeout,
+            "fallback": fallback,
+            "slots": threading.BoundedSemaphore(max_concurrency) if max_concurrency else None,
+            "cache": _ResultCache(cache) if cache else None,
+            "is_async": inspect.iscoroutinefunction(the_actual_function),
+        }
+        _registry_version += 1
         return the_actual_function
     
     return decorator
@@ -66,8 +393,54 @@ def tool(description: str, parameters: dict | None = None):
 # -------------------------------------------------------------------
 
 def get_tool_definitions():
-    """Get all tool definitions in OpenAI format."""
-    return [entry["definition"] for entry in _REGISTRY.values()]
+    """Get all tool definitions in OpenAI format (built once per registry change)."""
+    global _definitions_cache
+    if _definitions_cache is None or _definitions_cache[0] != _registry_version:
+        _definitions_cache = (
+            _registry_version,
+            [entry["definition"] for entry in _REGISTRY.values()],
+        )
+    return _definitions_cache[1]
+
+
+def registry_version() -> int:
+    """Changes whenever a tool is registered; use it to key cached payloads."""
+    return _registry_version
+
+
+def validate_tool_args(tool_name: str, args) -> dict:
+    """Validate and coerce arguments against the tool's schema (raises ToolArgumentError)."""
+    entry = _REGISTRY.get(tool_name)
+    if not entry:
+        raise ValueError(f"Unknown tool: {tool_name}")
+    return entry["validate"](args)
+
+
+@contextmanager
+def override_tool(tool_name: str, fn):
+    """
+    Run `fn` in place of a registered tool until the block exits (e.g. to
+    keep replays offline). Schema, timeout and fallback stay the tool's own;
+    its cache is bypassed so real and stand-in results never mix.
+    """
+    entry = _REGISTRY.get(tool_name)
+    if not entry:
+        raise ValueError(f"Unknown tool: {tool_name}")
+    saved = {key: entry[key] for key in ("the_actual_function", "is_async", "cache")}
+    entry.update(the_actual_function=fn, is_async=inspect.iscoroutinefunction(fn), cache=None)
+    try:
+        yield
+    finally:
+        entry.update(saved)
+
+
+def get_tool_stats():
+    """Cache hit/miss/coalesced counts for every tool with a cache policy."""
+    return {
+        name: entry["cache"].stats()
+        for name, entry in _REGISTRY.items()
+        if entry["cache"] is not None
+    }
 
 
 def register_with_elevenlabs(client_tools):
@@ -78,14 +451,235 @@ def register_with_elevenlabs(client_tools):
         client_tools.register("get_weather", callable)
 
     The first argument is the tool name (string); the second is the callable.
+    ElevenLabs calls it with a single parameters dict, so each tool is wrapped
+    to go through arun_tool() (same pool, loop, timeouts, limits and cache as
+    OpenAI). The wrappers are async, so ElevenLabs awaits them on its own loop
+    instead of parking an executor thread per call.
+    """
+    for name in _REGISTRY:
+        client_tools.register(name, _elevenlabs_handler(name), is_async=True)
+
+
+def _elevenlabs_handler(tool_name: str):
+    async def handler(parameters: dict):
+        args = {k: v for k, v in (parameters or {}).items() if k != "tool_call_id"}
+        return await arun_tool(tool_name, args)
+
+    return handler
+
+
+def get_tool_loop() -> asyncio.AbstractEventLoop:
+    """The shared event loop async tools run on (started on first use)."""
+    global _tool_loop
+    with _tool_loop_lock:
+        if _tool_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="tt-tool-loop", daemon=True
+            ).start()
+            _tool_loop = loop
+    return _tool_loop
+
+
+def get_http_client():
+    """
+    Shared httpx.AsyncClient (keep-alive connection pool) for async tools.
+    Only use it from inside an async tool: it belongs to the tool loop.
+    """
+    global _http_client
+    if _http_client is None:
+        import httpx
+
+        _http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(DEFAULT_TOOL_TIMEOUT),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        )
+    return _http_client
+
+
+def submit_tool(tool_name: str, args: dict, slot_timeout: float | None = None):
     """
-    for name, entry in _REGISTRY.items():
-        client_tools.register(name, entry["the_actual_function"])
+    Start a tool call on the shared pool and return its Future.
+    Waits up to `slot_timeout` for a concurrency slot if the tool is capped.
 
+    For cached tools, a fresh cached result comes back as an already-done
+    Future, and a call identical to one still running shares its Future.
 
-def run_tool(tool_name: str, args: dict):
-    """Execute a tool by name."""
+    Arguments are validated/coerced first; raises ToolArgumentError.
+    """
     entry = _REGISTRY.get(tool_name)
     if not entry:
         raise ValueError(f"Unknown tool: {tool_name}")
-    return entry["the_actual_function"](**(args or {}))
+    args = entry["validate"](args)
+
+    cache = entry["cache"]
+    if cache is None:
+        _acquire_slot(tool_name, entry, slot_timeout)
+        return _start(entry, args)
+
+    key = cache.key(args or {})
+    namespace = _tool_context.get().namespace
+    if namespace is not None:
+        # One device's cached result must never answer another's call
+        key = (namespace, key)
+    with cache.lock:
+        shared = _cached_or_shared(cache, key)
+    if shared is not None:
+        return shared
+
+    # A miss: hold a slot before counting it or publishing an inflight Future,
+    # so a caller that can't get one (e.g. arun_tool's probe) leaves no trace
+    _acquire_slot(tool_name, entry, slot_timeout)
+    with cache.lock:
+        # Someone may have stored or started this call while we waited
+        shared = _cached_or_shared(cache, key)
+        if shared is None:
+            cache.misses += 1
+            shared = cache.inflight[key] = Future()
+            started = True
+        else:
+            started = False
+    if not started:
+        _release_slot(entry)
+        return shared
+
+    def settle(future):
+        with cache.lock:
+            cache.inflight.pop(key, None)
+            if future.exception() is None:
+                cache.store(key, future.result())
+        if future.exception() is None:
+            shared.set_result(future.result())
+        else:
+            shared.set_exception(future.exception())
+
+    try:
+        _start(entry, args).add_done_callback(settle)
+    except BaseException as e:
+        with cache.lock:
+            cache.inflight.pop(key, None)
+        shared.set_exception(e)
+        raise
+    return shared
+
+
+def _cached_or_shared(cache: _ResultCache, key):
+    """A done Future for a fresh cached result, or the inflight one; else None. Caller holds lock."""
+    found, result = cache.lookup(key)
+    if found:
+        cache.hits += 1
+        done = Future()
+        done.set_result(result)
+        return done
+    shared = cache.inflight.get(key)
+    if shared is not None:
+        cache.coalesced += 1
+    return shared
+
+
+def _acquire_slot(tool_name: str, entry: dict, slot_timeout: float | None):
+    slots = entry["slots"]
+    if slots is None:
+        return
+    # Semaphore.acquire(timeout=-1) doesn't block: None must mean wait for good
+    acquired = slots.acquire() if slot_timeout is None else slots.acquire(timeout=slot_timeout)
+    if not acquired:
+        raise ToolTimeoutError(f"Tool {tool_name} is at its concurrency limit")
+
+
+def _release_slot(entry: dict):
+    if entry["slots"] is not None:
+        entry["slots"].release()
+
+
+def _start(entry: dict, args: dict):
+    """Run the call (its slot, if capped, already held; released when it's done)."""
+    try:
+        # Both carry the caller's ToolContext: the tool loop copies it into
+        # the task, pool threads run the call inside a copy
+        if entry["is_async"]:
+            future = asyncio.run_coroutine_threadsafe(
+                entry["the_actual_function"](**(args or {})), get_tool_loop()
+            )
+        else:
+            future = _EXECUTOR.submit(
+                contextvars.copy_context().run, entry["the_actual_function"], **(args or {})
+            )
+    except BaseException:
+        _release_slot(entry)
+        raise
+    if entry["slots"] is not None:
+        future.add_done_callback(lambda _: _release_slot(entry))
+    return future
+
+
+def _on_timeout(tool_name: str, entry: dict, timeout: float | None):
+    """The tool's fallback result if it has one, else raise ToolTimeoutError."""
+    if entry["fallback"] is not _NO_FALLBACK:
+        return copy.deepcopy(entry["fallback"])
+    if timeout is None:
+        raise ToolTimeoutError(f"Tool {tool_name} timed out")
+    raise ToolTimeoutError(f"Tool {tool_name} timed out after {timeout}s")
+
+
+def run_tool(tool_name: str, args: dict, timeout: float | None = None):
+    """
+    Execute a tool by name (sync tools on the shared pool, async tools on the
+    shared tool loop) and wait for its result.
+
+    If the tool's timeout (or `timeout`, when that's shorter, e.g. what's
+    left of the caller's budget) passes first, returns its fallback result
+    if it has one, otherwise raises ToolTimeoutError. (A running call can't
+    be killed; it finishes in the background and its result is dropped.)
+    Anything the tool itself raises, TimeoutError included, propagates.
+    """
+    entry = _REGISTRY.get(tool_name)
+    if not entry:
+        raise ValueError(f"Unknown tool: {tool_name}")
+
+    if timeout is None or (entry["timeout"] is not None and entry["timeout"] < timeout):
+        timeout = entry["timeout"]
+    deadline = None if timeout is None else time.monotonic() + timeout
+    try:
+        future = submit_tool(tool_name, args, slot_timeout=timeout)
+    except ToolTimeoutError:  # No concurrency slot in time
+        return _on_timeout(tool_name, entry, timeout)
+    remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+    # wait() rather than future.result(timeout): since 3.11 the latter's
+    # TimeoutError is the builtin one, which the tool may raise too
+    done, _ = wait((future,), remaining)
+    if not done:
+        return _on_timeout(tool_name, entry, timeout)
+    return future.result()
+
+
+async def arun_tool(tool_name: str, args: dict):
+    """
+    Async counterpart of run_tool() for callers already on an event loop.
+    Same timeout/fallback/cache semantics; never blocks the caller's loop.
+    """
+    entry = _REGISTRY.get(tool_name)
+    if not entry:
+        raise ValueError(f"Unknown tool: {tool_name}")
+
+    timeout = entry["timeout"]
+    deadline = None if timeout is None else time.monotonic() + timeout
+    try:
+        try:
+            future = submit_tool(tool_name, args, slot_timeout=0)
+        except ToolTimeoutError:
+            # At its concurrency limit: wait for a slot off the loop
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            future = await asyncio.get_running_loop().run_in_executor(
+                None, submit_tool, tool_name, args, remaining
+            )
+    except ToolTimeoutError:  # No concurrency slot in time
+        return _on_timeout(tool_name, entry, timeout)
+    remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+    # asyncio.wait (not wait_for): a timeout must not cancel a Future
+    # that coalesced callers may be sharing
+    wrapped = asyncio.wrap_future(future)
+    done, _ = await asyncio.wait({wrapped}, timeout=remaining)
+    if not done:
+        return _on_timeout(tool_name, entry, timeout)
+    return wrapped.result()
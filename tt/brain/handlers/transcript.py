@@ -1,5 +1,7 @@
 """Handlers for transcript events (user and AI)."""
 
+from tt.brain.handlers.memory_prefetch import recent_user_query
+
 
 def on_ai_transcript_delta(conv, msg: dict):
     """Stream AI transcript to console."""
@@ -31,6 +33,9 @@ def on_ai_transcript_done(conv, msg: dict):
 def on_user_transcript_completed(conv, msg: dict):
     """Handle completed user speech transcription."""
     transcript = msg.get("transcript", "")
+    tracer = getattr(conv, "tracer", None)
+    if tracer:
+        tracer.mark("transcript_completed")
     if transcript:
         print(f"\nUser: {transcript}")
         conv.log.add_user(transcript)
@@ -39,6 +44,10 @@ def on_user_transcript_completed(conv, msg: dict):
             with conv.user_turn_condition:
                 conv.user_turn += 1
                 conv.user_turn_condition.notify_all()
+        # Start recalling memories now, before the model asks for them
+        prefetcher = getattr(conv, "memory_prefetch", None)
+        if prefetcher:
+            prefetcher.start(getattr(conv, "user_turn", 0), recent_user_query(conv.log))
 
 
 def on_user_transcript_failed(conv, msg: dict):
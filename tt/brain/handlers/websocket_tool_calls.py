@@ -2,8 +2,103 @@
 
 import json
 import threading
-
-from tt.brain.handlers.tools_plug import run_tool
+import time
+
+from tt.brain.handlers.memory_prefetch import recent_user_query
+from tt.brain.handlers.tools_plug import ToolArgumentError, run_tool
+
+# How long get_memories waits on an in-flight prefetch before running itself
+PREFETCH_WAIT = 5.0
+# Cap on a whole get_memories call (transcript wait + prefetch + own run);
+# past it the tool's fallback (no memories) goes back instead of more silence
+GET_MEMORIES_BUDGET = 8.0
+# Once a response is done, how long to wait for the rest of its tool calls
+# before letting the model continue with whatever has reported back
+TOOL_BATCH_DEADLINE = 8.0
+
+# Asks the model to carry on after tool outputs are in
+CONTINUE_RESPONSE = {"type": "response.create", "response": {"modalities": ["audio", "text"]}}
+
+
+class ToolCallBatches:
+    """
+    Tracks outstanding tool calls per response_id so that a response which
+    fans out into several calls gets exactly one response.create, sent once
+    all of them have reported back (or the deadline passes).
+
+    A batch is complete when its `response.done` has arrived (no more calls
+    can be added) and no calls are outstanding. A call that reports back
+    after the deadline has flushed its batch is dropped: the model has
+    already moved on, and an output arriving after response.create would
+    only surface, out of context, in some later turn.
+    """
+
+    def __init__(self, send_continue, deadline: float = TOOL_BATCH_DEADLINE):
+        self.send_continue = send_continue
+        self.deadline = deadline
+        self._lock = threading.Lock()
+        self._batches = {}  # response_id -> {"pending": set, "done": bool, "timer": Timer | None}
+
+    def add(self, response_id: str, call_id: str):
+        with self._lock:
+            batch = self._batches.setdefault(
+                response_id, {"pending": set(), "done": False, "timer": None}
+            )
+            batch["pending"].add(call_id)
+
+    def finish(self, response_id: str, call_id: str, send_output) -> bool:
+        """
+        A call has its result: send_output() puts its function_call_output on
+        the wire, unless the deadline already flushed the batch. Returns False
+        if the output was dropped.
+        """
+        with self._lock:
+            batch = self._batches.get(response_id)
+            if batch is None or call_id not in batch["pending"]:
+                return False
+            # Under the lock, so a deadline flush can't get its response.create out first
+            send_output()
+            batch["pending"].discard(call_id)
+            ready = batch["done"] and not batch["pending"]
+        if ready:
+            self._flush(response_id)
+        return True
+
+    def response_done(self, response_id: str):
+        with self._lock:
+            batch = self._batches.get(response_id)
+            if batch is None:
+                return  # No tool calls in this response
+            batch["done"] = True
+            if batch["pending"]:
+                batch["timer"] = threading.Timer(self.deadline, self._flush, (response_id,))
+                batch["timer"].daemon = True
+                batch["timer"].start()
+                return
+        self._flush(response_id)
+
+    def busy(self) -> bool:
+        """Whether any batch still owes a tool output or its response.create."""
+        with self._lock:
+            return any(batch["pending"] or batch["done"] for batch in self._batches.values())
+
+    def _flush(self, response_id: str):
+        with self._lock:
+            batch = self._batches.pop(response_id, None)
+        if batch is None:
+            return  # Someone else flushed it first
+        if batch["timer"] is not None:
+            batch["timer"].cancel()
+        if batch["pending"]:
+            print(f"\n⏱️  {len(batch['pending'])} tool call(s) missed the deadline; continuing without them")
+        self.send_continue()
+
+    def cancel(self):
+        with self._lock:
+            batches, self._batches = self._batches, {}
+        for batch in batches.values():
+            if batch["timer"] is not None:
+                batch["timer"].cancel()
 
 
 def on_function_call_args_delta(conv, msg: dict):
@@ -18,23 +113,63 @@ def on_function_call_args_done(conv, msg: dict):
     call_id = msg["call_id"]
     tool_name = msg["name"]
 
-    # Parse arguments
-    args_json = conv.tool_arg_buffers.pop(call_id, "") + msg.get("arguments", "")
-    try:
-        parsed_args = json.loads(args_json or "{}")
-    except json.JSONDecodeError:
-        parsed_args = {}
+    # The done event carries the complete arguments; the streamed deltas are
+    # only a fallback for when it doesn't
+    buffered = conv.tool_arg_buffers.pop(call_id, "")
+    args_json = msg.get("arguments")
+    if args_json is None:
+        args_json = buffered
+
+    response_id = msg.get("response_id")
+    batches = getattr(conv, "tool_batches", None)
+    if batches and response_id:
+        batches.add(response_id, call_id)
+
+    conv.dispatch(
+        _execute_tool_call, conv, call_id, tool_name, args_json, response_id
+    )
+
+
+def on_response_done(conv, msg: dict):
+    """Once a response with tool calls is done, its batch can complete."""
+    tracer = getattr(conv, "tracer", None)
+    if tracer:
+        tracer.mark("response_done")
+
+    response_id = (msg.get("response") or {}).get("id")
+    batches = getattr(conv, "tool_batches", None)
+    if batches and response_id:
+        batches.response_done(response_id)
 
-    threading.Thread(
-        target=_execute_tool_call,
-        args=(conv, call_id, tool_name, parsed_args),
-        daemon=True,
-    ).start()
+
+def _parse_args(tool_name: str, args_json: str) -> dict:
+    """Decode the model's argument string (raises ToolArgumentError)."""
+    try:
+        return json.loads(args_json or "{}")
+    except json.JSONDecodeError as e:
+        raise ToolArgumentError(
+            tool_name, [{"field": None, "error": f"arguments are not valid JSON ({e.msg} at {e.pos})"}]
+        ) from None
 
 
-def _execute_tool_call(conv, call_id: str, tool_name: str, parsed_args: dict):
+def _execute_tool_call(
+    conv, call_id: str, tool_name: str, args_json: str, response_id: str | None = None
+):
     """Execute tool and send result back to model."""
-    if tool_name == "get_memories":
+    tracer = getattr(conv, "tracer", None)
+    if tracer:
+        tracer.tool_start(call_id, tool_name)
+    tool_output = None
+    deadline = None
+    if tool_name != "get_memories":
+        try:
+            parsed_args = _parse_args(tool_name, args_json)
+        except ToolArgumentError as e:
+            # Tell the model what was wrong so it can retry, instead of running with {}
+            parsed_args = {"raw": args_json}
+            tool_output = e.to_output()
+    else:
+        deadline = time.monotonic() + GET_MEMORIES_BUDGET
         start_turn = getattr(conv, "user_turn", 0)
         condition = getattr(conv, "user_turn_condition", None)
         if condition:
@@ -46,41 +181,48 @@ def _execute_tool_call(conv, call_id: str, tool_name: str, parsed_args: dict):
                 )
 
         # get_memories never needs model-sent args; always build from recent user turns.
-        user_messages = [
-            entry.get("content", "")
-            for entry in reversed(conv.log.messages)
-            if entry.get("role") == "user"
-        ][:3]
-        combined = " ".join(reversed(user_messages)).strip()
+        combined = recent_user_query(conv.log)
         parsed_args = {"message": combined}
 
+        # Usually already recalled when the user's transcript came in
+        prefetcher = getattr(conv, "memory_prefetch", None)
+        if prefetcher:
+            tool_output = prefetcher.take(
+                combined, timeout=min(PREFETCH_WAIT, max(0.0, deadline - time.monotonic()))
+            )
+
     print(f"\n🛠️  Tool: {tool_name}({parsed_args})")
     conv.log.add_tool_call(tool_name, parsed_args)
 
     # Execute tool
-    try:
-        tool_output = run_tool(tool_name, parsed_args)
-    except Exception as e:
-        tool_output = {"error": str(e)}
-
+    if tool_output is None:
+        try:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            tool_output = run_tool(tool_name, parsed_args, timeout=remaining)
+        except ToolArgumentError as e:
+            tool_output = e.to_output()
+        except Exception as e:
+            tool_output = {"error": str(e)}
+
+    if tracer:
+        tracer.tool_end(call_id)
     conv.log.add_tool_result(tool_name, tool_output)
 
     # Send result back to model
-    conv.sock.send(
-        {
-            "type": "conversation.item.create",
-            "item": {
-                "type": "function_call_output",
-                "call_id": call_id,
-                "output": json.dumps(tool_output),
-            },
-        }
-    )
-
-    # Request model to continue
-    conv.sock.send(
-        {
-            "type": "response.create",
-            "response": {"modalities": ["audio", "text"]},
-        }
-    )
+    output = {
+        "type": "conversation.item.create",
+        "item": {
+            "type": "function_call_output",
+            "call_id": call_id,
+            "output": json.dumps(tool_output),
+        },
+    }
+
+    # Request model to continue: once per response, after all its calls are in
+    batches = getattr(conv, "tool_batches", None)
+    if batches and response_id:
+        if not batches.finish(response_id, call_id, lambda: conv.sock.send(output)):
+            print(f"\n⏱️  {tool_name} finished after its batch deadline; dropping its output")
+    else:
+        conv.sock.send(output)
+        conv.sock.send(CONTINUE_RESPONSE)
@@ -0,0 +1,177 @@
+"""
+In-process vector index over the Supabase `highlights` table.
+
+Keeps every highlight embedding in one contiguous, L2-normalized float32
+matrix so recall is a single matrix-vector product instead of a
+`find_highlights` RPC round trip. Same semantics as the RPC: cosine
+similarity above `match_threshold`, best `match_count` first, and only
+rows in the searched memory namespace (one per gateway device; None = rows
+stored without one).
+
+Enable with HIPPOCAMPUS_LOCAL_INDEX=1. The index loads lazily on first use
+(or via preload() at startup) and is kept in sync by store().
+"""
+
+import json
+import threading
+
+import numpy as np
+
+from tt.brain.hippocampus.supabase_client import get_supabase
+
+PAGE_SIZE = 1000
+
+
+class LocalHighlightIndex:
+    def __init__(self, initial_capacity: int = 1024):
+        self._lock = threading.Lock()
+        self._initial_capacity = initial_capacity
+        self._matrix = None  # (capacity, dim) float32, rows L2-normalized
+        self._size = 0
+        self._rows: list[dict] = []  # highlight metadata, aligned with matrix rows
+        self._ids: set = set()
+        # Namespace of each row as a small int code (aligned with matrix rows)
+        self._namespaces = None
+        self._namespace_codes = {None: 0}
+
+    def __len__(self):
+        return self._size
+
+    def load(self, client=None):
+        """Page the whole highlights table into the index."""
+        client = client or get_supabase()
+        start = 0
+        while True:
+            # "*" so the namespace column comes along where the schema has one;
+            # ordered, or offset pages can skip or repeat rows
+            response = (
+                client.table("highlights")
+                .select("*")
+                .order("id")
+                .range(start, start + PAGE_SIZE - 1)
+                .execute()
+            )
+            rows = response.data or []
+            self.add(rows)
+            if len(rows) < PAGE_SIZE:
+                break
+            start += PAGE_SIZE
+
+    def add(self, rows: list[dict]):
+        """Append highlight rows (as returned by Supabase). Rows already indexed are skipped."""
+        with self._lock:
+            vectors, metas, codes = [], [], []
+            for row in rows:
+                row_id = row.get("id")
+                if row_id is not None and row_id in self._ids:
+                    continue
+                embedding = row.get("embedding")
+                if embedding is None:
+                    continue
+                # pgvector comes back over PostgREST as a "[0.1,0.2,...]" string
+                if isinstance(embedding, str):
+                    embedding = json.loads(embedding)
+                vectors.append(embedding)
+                metas.append({k: v for k, v in row.items() if k != "embedding"})
+                namespace = row.get("namespace")
+                codes.append(self._namespace_codes.setdefault(namespace, len(self._namespace_codes)))
+                if row_id is not None:
+                    self._ids.add(row_id)
+            if not vectors:
+                return
+
+            block = np.asarray(vectors, dtype=np.float32)
+            norms = np.linalg.norm(block, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            block /= norms
+
+            needed = self._size + len(block)
+            if self._matrix is None or needed > len(self._matrix):
+                current = 0 if self._matrix is None else len(self._matrix)
+                capacity = max(self._initial_capacity, needed, 2 * current)
+                grown = np.empty((capacity, block.shape[1]), dtype=np.float32)
+                grown_namespaces = np.zeros(capacity, dtype=np.int32)
+                if self._size:
+                    grown[: self._size] = self._matrix[: self._size]
+                    grown_namespaces[: self._size] = self._namespaces[: self._size]
+                self._matrix = grown
+                self._namespaces = grown_namespaces
+            self._matrix[self._size:needed] = block
+            self._namespaces[self._size:needed] = codes
+            self._rows.extend(metas)
+            # Searches snapshot (matrix, size) under the lock, so rows past
+            # their snapshot size are never read
+            self._size = needed
+
+    def search(
+        self, query_embedding, match_threshold: float, match_count: int, namespace: str | None = None
+    ) -> list[dict]:
+        """
+        Top `match_count` highlights with cosine similarity > `match_threshold`,
+        among rows stored under `namespace` (None = rows without one).
+        """
+        with self._lock:
+            matrix, namespaces, size, rows = self._matrix, self._namespaces, self._size, self._rows
+            code = self._namespace_codes.get(namespace)
+            mixed = len(self._namespace_codes) > 1
+        if not size or match_count <= 0 or code is None:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+        sims = matrix[:size] @ (query / norm)
+        if mixed:
+            # Other namespaces can never clear the threshold
+            sims[namespaces[:size] != code] = -np.inf
+
+        if match_count < size:
+            top = np.argpartition(-sims, match_count - 1)[:match_count]
+        else:
+            top = np.arange(size)
+        top = top[np.argsort(-sims[top])]
+
+        return [
+            {**rows[i], "similarity": float(sims[i])}
+            for i in top
+            if sims[i] > match_threshold
+        ]
+
+
+# -------------------------------------------------------------------
+# Process-wide index
+# -------------------------------------------------------------------
+
+_index = None
+_loading = None  # index being loaded; receives store() writes that race the load
+_index_lock = threading.Lock()
+
+
+def get_local_index() -> LocalHighlightIndex:
+    """Return the shared index, loading it from Supabase on first use."""
+    global _index, _loading
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _loading = LocalHighlightIndex()
+                try:
+                    _loading.load()
+                    _index = _loading
+                finally:
+                    _loading = None
+    return _index
+
+
+def preload():
+    """Load the index in the background so the first recall doesn't pay for it."""
+    threading.Thread(target=get_local_index, daemon=True).start()
+
+
+def on_highlights_stored(rows: list[dict]):
+    """Keep the index in sync with rows just written by store()."""
+    # Not loaded at all yet: the initial load will pick these rows up from the
+    # table. Mid-load: add them now; add() skips any the load also sees.
+    index = _index or _loading
+    if index is not None:
+        index.add(rows)
@@ -1,74 +1,162 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from tt.brain.hippocampus.utils.embed import embed
 from tt.brain.hippocampus.utils.highlights import highlight
 from tt.brain.hippocampus.utils.store import store
 
 from .utils.summarize import summarize
 
+# Cap on concurrent summarize/highlight LLM calls when memorizing a backlog
+MAX_EXTRACT_WORKERS = 8
 
-def create_highlights(detailed_conversation):
-    import time
-
-    t0 = time.perf_counter()
-    highlights = highlight(detailed_conversation)
-    t1 = time.perf_counter()
-    print(f"Highlights generation ({t1 - t0:.2f}s): {len(highlights)} items")
-
-    embeddings = embed(highlights)
-    t2 = time.perf_counter()
-    print(f"Highlights embedding ({t2 - t1:.2f}s)")
-
-    return list(zip(highlights, embeddings))
+_timings_lock = threading.Lock()
 
 
-def memorize(model, duration, detailed_conversation, session_start, session_end):
-    import time
-
+def _timed(spans, stage, fn, *args):
+    """Run fn, widening the stage's (first start, last end) span to cover it."""
     t0 = time.perf_counter()
-    summary = summarize(detailed_conversation)
-    t1 = time.perf_counter()
-    print(f"Summary ({t1 - t0:.2f}s): {summary}")
-
-    embedding = embed(summary)[0]
-    t2 = time.perf_counter()
-    print(f"Summary embedding ({t2 - t1:.2f}s)")
-
-    highlights_and_embeddings = create_highlights(detailed_conversation)
-    t3 = time.perf_counter()
-
-    # Convert duration to int seconds
+    try:
+        return fn(*args)
+    finally:
+        t1 = time.perf_counter()
+        with _timings_lock:
+            start, end = spans.get(stage, (t0, t1))
+            spans[stage] = (min(start, t0), max(end, t1))
+
+
+def _normalize(session: dict) -> dict:
+    """Coerce duration to int seconds and datetimes to ISO strings."""
+    duration = session["duration"]
     if hasattr(duration, "total_seconds"):
         duration = int(duration.total_seconds())
     else:
         duration = int(duration)
 
-    # Convert datetime objects to ISO strings
+    session_start = session["session_start"]
+    session_end = session["session_end"]
     if hasattr(session_start, "isoformat"):
         session_start = session_start.isoformat()
     if hasattr(session_end, "isoformat"):
         session_end = session_end.isoformat()
 
-    store(
-        model,
-        duration,
-        summary,
-        detailed_conversation,
-        embedding,
-        session_start,
-        session_end,
-        highlights_and_embeddings,
+    return {**session, "duration": duration, "session_start": session_start, "session_end": session_end}
+
+
+def memorize_many(sessions: list[dict]):
+    """
+    Memorize a batch of sessions.
+
+    Each session is a dict with keys: model, duration, messages,
+    session_start, session_end, and optionally namespace (whose memories
+    these are, see recall()).
+
+    Pipeline (per session, all sessions side by side):
+        summarize ─┐
+                   ├─> embed([every summary and highlight]) ─> store
+        highlight ─┘
+
+    Summarization and highlight extraction don't depend on each other, so
+    they run concurrently across every session, and all embeddings for the
+    whole batch go out as one request.
+
+    Returns (timings, errors):
+        timings: wall-clock seconds per stage, from its first call starting
+                 to its last one finishing
+                 {"summarize": ..., "highlight": ..., "embed": ..., "store": ..., "total": ...}
+                 (summarize and highlight run side by side, so they overlap)
+        errors:  one entry per session, None if it was stored, else the exception
+    """
+    spans = {}
+    t0 = time.perf_counter()
+    errors = [None] * len(sessions)
+    sessions = [_normalize(s) for s in sessions]
+
+    workers = min(MAX_EXTRACT_WORKERS, 2 * len(sessions)) or 1
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tt-memorize") as pool:
+        futures = [
+            (
+                pool.submit(_timed, spans, "summarize", summarize, s["messages"]),
+                pool.submit(_timed, spans, "highlight", highlight, s["messages"]),
+            )
+            for s in sessions
+        ]
+        extracted = []
+        for i, (summary_future, highlights_future) in enumerate(futures):
+            try:
+                extracted.append((i, summary_future.result(), highlights_future.result()))
+            except Exception as e:
+                errors[i] = e
+
+    # One embedding request for every summary and highlight in the batch
+    texts = [text for _, summary, highlights in extracted for text in (summary, *highlights)]
+    try:
+        vectors = _timed(spans, "embed", embed, texts) if texts else []
+    except Exception as e:
+        for i, _, _ in extracted:
+            errors[i] = e
+        extracted = []
+
+    offset = 0
+    for i, summary, highlights in extracted:
+        embedding = vectors[offset]
+        highlight_vectors = vectors[offset + 1:offset + 1 + len(highlights)]
+        offset += 1 + len(highlights)
+        s = sessions[i]
+        try:
+            _timed(
+                spans,
+                "store",
+                store,
+                s["model"],
+                s["duration"],
+                summary,
+                s["messages"],
+                embedding,
+                s["session_start"],
+                s["session_end"],
+                list(zip(highlights, highlight_vectors)),
+                s.get("namespace"),
+            )
+        except Exception as e:
+            errors[i] = e
+
+    timings = {stage: end - start for stage, (start, end) in spans.items()}
+    timings["total"] = time.perf_counter() - t0
+    return timings, errors
+
+
+def memorize(model, duration, detailed_conversation, session_start, session_end):
+    """
+    Summarize, extract highlights, embed and store one conversation.
+    Returns per-stage timings (see memorize_many); raises if it failed.
+    """
+    timings, errors = memorize_many(
+        [
+            {
+                "model": model,
+                "duration": duration,
+                "messages": detailed_conversation,
+                "session_start": session_start,
+                "session_end": session_end,
+            }
+        ]
     )
-    t4 = time.perf_counter()
-    print(f"Store ({t4 - t3:.2f}s)")
-    print("Memorization completed")
+    if errors[0] is not None:
+        raise errors[0]
+    return timings
 
 
 if __name__ == "__main__":
-    memorize(
-        "gpt-4o-mini",
-        10,
-        """Hey TED, I need a plan to organize my desk before midterms.
-        Start by throwing away obvious trash, then sort papers into keep/shred piles.
-        Should I keep my old notebooks? Keep one for reference, store the rest in your red box.""",
-        "2023-01-01",
-        "2023-01-02",
+    print(
+        memorize(
+            "gpt-4o-mini",
+            10,
+            """Hey TED, I need a plan to organize my desk before midterms.
+            Start by throwing away obvious trash, then sort papers into keep/shred piles.
+            Should I keep my old notebooks? Keep one for reference, store the rest in your red box.""",
+            "2023-01-01",
+            "2023-01-02",
+        )
     )
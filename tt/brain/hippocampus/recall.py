@@ -1,17 +1,37 @@
-from tt.brain.hippocampus.supabase_client import supabase
+from tt.brain.hippocampus.supabase_client import get_supabase
 from tt.brain.hippocampus.utils.embed import embed
+from tt.config import HIPPOCAMPUS_LOCAL_INDEX
 
+MATCH_THRESHOLD = 0.3
+MATCH_COUNT = 2
 
-def recall(message):
-    response = supabase.rpc(
-        "find_highlights",
-        {
-            # Supabase RPC expects a single embedding vector, not a list
-            "query_embedding": embed(message)[0],
-            "match_threshold": 0.3,
-            "match_count": 2,
-        },
-    ).execute()
+
+def recall(message, namespace: str | None = None):
+    """
+    Highlights most similar to `message`, from `namespace` only (one per
+    device on a gateway; None = rows stored without one, i.e. the
+    single-device setup). See supabase/migrations/*_memory_namespaces.sql.
+    """
+    # Supabase RPC expects a single embedding vector, not a list
+    query_embedding = embed(message)[0]
+
+    if HIPPOCAMPUS_LOCAL_INDEX:
+        from tt.brain.hippocampus.local_index import get_local_index
+
+        return get_local_index().search(
+            query_embedding, MATCH_THRESHOLD, MATCH_COUNT, namespace=namespace
+        )
+
+    # Always the four-argument find_highlights from the memory_namespaces
+    # migration (match_namespace null = rows without one); the three-argument
+    # form searches every namespace
+    params = {
+        "query_embedding": query_embedding,
+        "match_threshold": MATCH_THRESHOLD,
+        "match_count": MATCH_COUNT,
+        "match_namespace": namespace,
+    }
+    response = get_supabase().rpc("find_highlights", params).execute()
     # Supabase returns a list of highlight rows (may be empty)
     return response.data or []
 
@@ -0,0 +1,199 @@
+"""
+Durable spool + background worker for memorization.
+
+ConversationLog.save() drops the finished session into an on-disk spool and
+returns immediately; a single background worker drains the spool through
+memorize_many(), retrying with exponential backoff. When a backlog builds up
+(e.g. TED was offline), pending sessions are memorized together so their
+embeddings share one API call.
+
+Spool layout (one JSON file per session, written atomically):
+    conversation_logs/spool/<timestamp>-<id>.json
+    conversation_logs/spool/<timestamp>-<id>.retry<N>.json   # N failed attempts so far
+    conversation_logs/spool/failed/...   # gave up after MAX_ATTEMPTS
+
+The attempt count lives in the file name so MAX_ATTEMPTS holds across
+restarts; only the backoff timer is kept in memory (a restart retries at once).
+"""
+
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from pathlib import Path
+
+DEFAULT_SPOOL_DIR = Path("conversation_logs") / "spool"
+
+BATCH_SIZE = 8          # sessions memorized together when there's a backlog
+BASE_BACKOFF = 5.0      # seconds before the first retry, doubled each attempt
+MAX_BACKOFF = 300.0
+MAX_ATTEMPTS = 10
+
+_ATTEMPTS_SUFFIX = re.compile(r"\.retry(\d+)$")
+
+
+class MemorySpool:
+    """Directory of pending sessions, one JSON file each."""
+
+    def __init__(self, path: Path = DEFAULT_SPOOL_DIR):
+        self.path = Path(path)
+        self.failed_path = self.path / "failed"
+
+    def put(self, session: dict) -> Path:
+        self.path.mkdir(parents=True, exist_ok=True)
+        name = f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}.json"
+        final = self.path / name
+        tmp = self.path / f".{name}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(session, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, final)
+        return final
+
+    def pending(self) -> list[Path]:
+        if not self.path.exists():
+            return []
+        return sorted(self.path.glob("*.json"))
+
+    def load(self, entry: Path) -> dict:
+        with open(entry, encoding="utf-8") as f:
+            return json.load(f)
+
+    def ack(self, entry: Path):
+        entry.unlink(missing_ok=True)
+
+    def attempts(self, entry: Path) -> int:
+        """Failed memorize attempts recorded in the entry's name."""
+        match = _ATTEMPTS_SUFFIX.search(entry.stem)
+        return int(match.group(1)) if match else 0
+
+    def record_attempt(self, entry: Path, attempts: int) -> Path:
+        """Rename the entry to carry its attempt count; returns the new path."""
+        stem = _ATTEMPTS_SUFFIX.sub("", entry.stem)
+        renamed = entry.with_name(f"{stem}.retry{attempts}{entry.suffix}")
+        os.replace(entry, renamed)
+        return renamed
+
+    def fail(self, entry: Path):
+        self.failed_path.mkdir(parents=True, exist_ok=True)
+        os.replace(entry, self.failed_path / entry.name)
+
+
+class MemorizeWorker:
+    """Single background thread that drains a MemorySpool."""
+
+    def __init__(self, spool: MemorySpool, batch_size: int = BATCH_SIZE):
+        self.spool = spool
+        self.batch_size = batch_size
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._retry = {}  # entry name -> next_try monotonic time
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="tt-memorize-worker", daemon=True
+            )
+            self._thread.start()
+
+    def notify(self):
+        """Wake the worker (new session spooled)."""
+        self._wake.set()
+
+    def stop(self, timeout: float | None = None):
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                wait = self._drain_once()
+            except Exception as e:
+                print(f"[memorize] Worker error: {e}")
+                wait = BASE_BACKOFF
+            if wait != 0:
+                self._wake.wait(wait)
+                self._wake.clear()
+
+    def _drain_once(self) -> float | None:
+        """
+        Memorize one batch of due sessions.
+        Returns how long to sleep: 0 = go again now, None = until notified.
+        """
+        now = time.monotonic()
+        entries = self.spool.pending()
+        due = [e for e in entries if self._retry.get(e.name, 0.0) <= now]
+        if not due:
+            if not entries:
+                return None
+            return min(self._retry[e.name] for e in entries if e.name in self._retry) - now
+
+        batch, sessions = [], []
+        for entry in due[: self.batch_size]:
+            try:
+                sessions.append(self.spool.load(entry))
+                batch.append(entry)
+            except (OSError, ValueError) as e:
+                print(f"[memorize] Unreadable spool entry {entry.name}: {e}")
+                self.spool.fail(entry)
+
+        if batch:
+            # Imported here so spooling a session never pays for the
+            # OpenAI/Supabase client setup
+            from tt.brain.hippocampus.memorize import memorize_many
+
+            timings, errors = memorize_many(sessions)
+            for entry, error in zip(batch, errors):
+                if error is None:
+                    self._retry.pop(entry.name, None)
+                    self.spool.ack(entry)
+                else:
+                    self._schedule_retry(entry, error)
+            stored = errors.count(None)
+            if stored:
+                print(f"[memorize] Stored {stored}/{len(batch)} sessions ({timings['total']:.2f}s)")
+        return 0
+
+    def _schedule_retry(self, entry: Path, error: Exception):
+        attempts = self.spool.attempts(entry) + 1
+        self._retry.pop(entry.name, None)
+        if attempts >= MAX_ATTEMPTS:
+            print(f"[memorize] Giving up on {entry.name} after {attempts} attempts: {error}")
+            self.spool.fail(entry)
+            return
+        entry = self.spool.record_attempt(entry, attempts)
+        delay = min(MAX_BACKOFF, BASE_BACKOFF * 2 ** (attempts - 1))
+        print(f"[memorize] {entry.name} failed ({error}); retry {attempts} in {delay:.0f}s")
+        self._retry[entry.name] = time.monotonic() + delay
+
+
+# -------------------------------------------------------------------
+# Process-wide spool + worker
+# -------------------------------------------------------------------
+
+_worker = None
+_worker_lock = threading.Lock()
+
+
+def get_worker() -> MemorizeWorker:
+    """Return the shared worker, starting it (and draining any backlog) on first use."""
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = MemorizeWorker(MemorySpool())
+            _worker.start()
+    return _worker
+
+
+def enqueue(session: dict) -> Path:
+    """Durably spool a finished session and wake the worker."""
+    worker = get_worker()
+    entry = worker.spool.put(session)
+    worker.notify()
+    return entry
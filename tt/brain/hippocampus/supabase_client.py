@@ -1,10 +1,33 @@
-from supabase import Client, create_client
+import threading
+from typing import TYPE_CHECKING
 
-from tt.config import SUPABASE_KEY, SUPABASE_URL
+if TYPE_CHECKING:
+    from supabase import Client
 
+_client = None
+_client_lock = threading.Lock()
+
+
+def create_supabase_client() -> "Client":
+    from supabase import create_client
+
+    from tt.config import SUPABASE_KEY, SUPABASE_URL
 
-def create_supabase_client() -> Client:
     return create_client(SUPABASE_URL, SUPABASE_KEY)
 
 
-supabase = create_supabase_client()
+def get_supabase() -> "Client":
+    """Shared Supabase client, created on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = create_supabase_client()
+    return _client
+
+
+def __getattr__(name: str):
+    # Keeps `from tt.brain.hippocampus.supabase_client import supabase` working
+    if name == "supabase":
+        return get_supabase()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,42 @@
-from openai import OpenAI
+import threading
 
-from tt.config import OPENAI_API_KEY
+from tt.brain.hippocampus.utils.embedding_cache import EmbeddingCache
+from tt.brain.hippocampus.utils.openai_client import get_openai
+from tt.config import EMBED_CACHE_MEMORY_ENTRIES, EMBED_CACHE_PATH
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+MODEL = "text-embedding-3-small"
+
+# Created on first embed() so importing recall/tools stays cheap
+_cache = None
+_init_lock = threading.Lock()
+
+
+def get_cache() -> EmbeddingCache:
+    global _cache
+    if _cache is None:
+        with _init_lock:
+            if _cache is None:
+                _cache = EmbeddingCache(EMBED_CACHE_PATH or None, EMBED_CACHE_MEMORY_ENTRIES)
+    return _cache
 
 
 def embed(messages):
-    response = client.embeddings.create(input=messages, model="text-embedding-3-small")
+    texts = [messages] if isinstance(messages, str) else list(messages)
+    cache = get_cache()
+
+    # Only send cache misses to the API (each distinct text once)
+    vectors = cache.get_many(MODEL, texts)
+    misses = list(dict.fromkeys(t for t, v in zip(texts, vectors) if v is None))
+    if misses:
+        response = get_openai().embeddings.create(input=misses, model=MODEL)
+        fetched = [item.embedding for item in response.data]
+        cache.put_many(MODEL, misses, fetched)
+        by_text = dict(zip(misses, fetched))
+        vectors = [v if v is not None else by_text[t] for t, v in zip(texts, vectors)]
 
     # always outputs a list, but where you are then you decide to use [0] or use it as a list
-    return [item.embedding for item in response.data]
+    return vectors
+
+
+def cache_stats() -> dict:
+    return get_cache().stats()
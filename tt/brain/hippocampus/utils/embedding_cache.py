@@ -0,0 +1,100 @@
+"""
+Content-addressed embedding cache: in-memory LRU in front of a SQLite file.
+
+Entries are keyed by sha256(model + text), so the same sentence embedded by
+the same model is only ever sent to the API once. Vectors are stored on disk
+as packed float32.
+"""
+
+import array
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+# SQLite caps the number of bound parameters per statement
+_SQL_BATCH = 500
+
+
+class EmbeddingCache:
+    def __init__(self, path: Path | str | None = None, max_memory_entries: int = 4096):
+        self.max_memory_entries = max_memory_entries
+        self._memory = OrderedDict()  # key -> list[float], most recently used last
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            path = Path(path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._db.commit()
+
+        # Counters
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(model: str, text: str) -> str:
+        return hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, model: str, texts: list[str]) -> list[list[float] | None]:
+        """Look up each text; None marks a miss."""
+        keys = [self.key(model, t) for t in texts]
+        found = {}
+        with self._lock:
+            for k in keys:
+                if k in self._memory:
+                    self._memory.move_to_end(k)
+                    found[k] = self._memory[k]
+            self.memory_hits += sum(1 for k in keys if k in found)
+
+            disk_keys = [k for k in dict.fromkeys(keys) if k not in found]
+            if disk_keys and self._db is not None:
+                for i in range(0, len(disk_keys), _SQL_BATCH):
+                    batch = disk_keys[i:i + _SQL_BATCH]
+                    rows = self._db.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})",
+                        batch,
+                    ).fetchall()
+                    for k, blob in rows:
+                        vector = array.array("f")
+                        vector.frombytes(blob)
+                        found[k] = vector.tolist()
+                        self._remember(k, found[k])
+                from_disk = set(disk_keys)
+                self.disk_hits += sum(1 for k in keys if k in found and k in from_disk)
+            self.misses += sum(1 for k in keys if k not in found)
+
+        return [found.get(k) for k in keys]
+
+    def put_many(self, model: str, texts: list[str], vectors: list[list[float]]):
+        keys = [self.key(model, t) for t in texts]
+        with self._lock:
+            for k, v in zip(keys, vectors):
+                self._remember(k, v)
+            if self._db is not None:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    [(k, array.array("f", v).tobytes()) for k, v in zip(keys, vectors)],
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, vector: list[float]):
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> dict:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_entries": len(self._memory),
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
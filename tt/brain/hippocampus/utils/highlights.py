@@ -1,11 +1,10 @@
 import json
 from pickle import HIGHEST_PROTOCOL
 
-from openai import OpenAI
 from pydantic import BaseModel
 
+from tt.brain.hippocampus.utils.openai_client import get_openai
 from tt.brain.temporal_lobe.prompts.extract_highlights import HIGHLIGHT_PROMPT
-from tt.config import OPENAI_API_KEY
 
 
 class highlight_output_format(BaseModel):
@@ -13,7 +12,7 @@ class highlight_output_format(BaseModel):
 
 
 def highlight(messages):
-    client = OpenAI(api_key=OPENAI_API_KEY)
+    client = get_openai()
 
     prompt = f"{HIGHLIGHT_PROMPT}{messages}"
 
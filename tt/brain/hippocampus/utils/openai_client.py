@@ -0,0 +1,135 @@
+"""
+Shared OpenAI clients for the hippocampus (summaries, highlights, embeddings).
+
+One client per process, built on first use, over a keep-alive connection
+pool: after the first call, requests reuse an open TLS connection instead of
+handshaking again. Timeouts, retries and pool size come from tt.config.
+
+    from tt.brain.hippocampus.utils.openai_client import get_openai
+    get_openai().responses.create(...)
+
+For asyncio pipelines, get_async_openai() returns the AsyncOpenAI equivalent
+(one per event loop, since an async connection pool can't cross loops).
+
+connection_stats() reports requests vs new connections/TLS handshakes, via
+httpcore's "trace" request extension.
+"""
+
+import threading
+import weakref
+
+from tt.config import (
+    OPENAI_API_KEY,
+    OPENAI_CONNECT_TIMEOUT,
+    OPENAI_MAX_CONNECTIONS,
+    OPENAI_MAX_RETRIES,
+    OPENAI_TIMEOUT,
+)
+
+_client = None
+_async_clients = weakref.WeakKeyDictionary()  # event loop -> AsyncOpenAI
+_lock = threading.Lock()
+
+
+# -------------------------------------------------------------------
+# Connection reuse stats
+# -------------------------------------------------------------------
+
+_stats_lock = threading.Lock()
+_stats = {"requests": 0, "connections": 0, "tls_handshakes": 0}
+
+
+def _count(key: str):
+    with _stats_lock:
+        _stats[key] += 1
+
+
+def _on_trace(event_name: str, info: dict):
+    if event_name.endswith("connect_tcp.complete"):
+        _count("connections")
+    elif event_name.endswith("start_tls.complete"):
+        _count("tls_handshakes")
+
+
+async def _on_trace_async(event_name: str, info: dict):
+    _on_trace(event_name, info)
+
+
+def _trace_request(request):
+    _count("requests")
+    request.extensions["trace"] = _on_trace
+
+
+async def _trace_request_async(request):
+    _count("requests")
+    request.extensions["trace"] = _on_trace_async
+
+
+def connection_stats() -> dict:
+    """Requests sent vs connections opened; reuse_rate near 1.0 = pooling works."""
+    with _stats_lock:
+        stats = dict(_stats)
+    requests = stats["requests"]
+    stats["reused"] = max(0, requests - stats["connections"])
+    stats["reuse_rate"] = stats["reused"] / requests if requests else 0.0
+    return stats
+
+
+# -------------------------------------------------------------------
+# Clients
+# -------------------------------------------------------------------
+
+
+def _client_options() -> dict:
+    import httpx
+
+    return {
+        "timeout": httpx.Timeout(OPENAI_TIMEOUT, connect=OPENAI_CONNECT_TIMEOUT),
+        "limits": httpx.Limits(
+            max_connections=OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=OPENAI_MAX_CONNECTIONS,
+        ),
+    }
+
+
+def get_openai():
+    """Process-wide OpenAI client (thread-safe, pooled)."""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                from openai import DefaultHttpxClient, OpenAI
+
+                options = _client_options()
+                _client = OpenAI(
+                    api_key=OPENAI_API_KEY,
+                    timeout=options["timeout"],
+                    max_retries=OPENAI_MAX_RETRIES,
+                    http_client=DefaultHttpxClient(
+                        **options, event_hooks={"request": [_trace_request]}
+                    ),
+                )
+    return _client
+
+
+def get_async_openai():
+    """AsyncOpenAI client for the running event loop (pooled per loop)."""
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.get(loop)
+        if client is None:
+            from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+            options = _client_options()
+            client = AsyncOpenAI(
+                api_key=OPENAI_API_KEY,
+                timeout=options["timeout"],
+                max_retries=OPENAI_MAX_RETRIES,
+                http_client=DefaultAsyncHttpxClient(
+                    **options, event_hooks={"request": [_trace_request_async]}
+                ),
+            )
+            _async_clients[loop] = client
+    return client
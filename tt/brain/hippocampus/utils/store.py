@@ -1,4 +1,9 @@
-from tt.brain.hippocampus.supabase_client import supabase
+from tt.brain.hippocampus.supabase_client import get_supabase
+from tt.config import HIPPOCAMPUS_LOCAL_INDEX
+
+# Highlights per insert request; one request covers any normal session,
+# very long ones are split into a few.
+HIGHLIGHT_BATCH_SIZE = 500
 
 
 def store(
@@ -10,8 +15,13 @@ def store(
     session_start,
     session_end,
     highlights_and_embeddings,
+    namespace=None,
 ):
-    supabase.table("memories").insert(
+    # Rows only get a namespace column when there is one (gateway devices),
+    # so a single-device database needs no schema change
+    tag = {} if namespace is None else {"namespace": namespace}
+    supabase = get_supabase()
+    memory = supabase.table("memories").insert(
         {
             "model": model,
             "duration": duration,
@@ -20,10 +30,40 @@ def store(
             "embedding": embeddings,
             "session_start": session_start,
             "session_end": session_end,
+            **tag,
         }
     ).execute()
 
-    for highlight, embedding in highlights_and_embeddings:
-        supabase.table("highlights").insert(
-            {"embedding": embedding, "context": highlight, "date": session_start}
-        ).execute()
+    rows = [
+        {"embedding": embedding, "context": highlight, "date": session_start, **tag}
+        for highlight, embedding in highlights_and_embeddings
+    ]
+    stored = []
+    try:
+        for i in range(0, len(rows), HIGHLIGHT_BATCH_SIZE):
+            response = supabase.table("highlights").insert(
+                rows[i:i + HIGHLIGHT_BATCH_SIZE]
+            ).execute()
+            stored.extend(response.data or [])
+    except Exception:
+        # PostgREST can't wrap two tables in one transaction, so undo what
+        # already landed rather than leave a memory with half its highlights.
+        _undo(memory.data or [], stored)
+        raise
+
+    if HIPPOCAMPUS_LOCAL_INDEX:
+        from tt.brain.hippocampus.local_index import on_highlights_stored
+
+        on_highlights_stored(stored)
+
+
+def _undo(memory_rows, highlight_rows):
+    supabase = get_supabase()
+    for table, rows in (("highlights", highlight_rows), ("memories", memory_rows)):
+        ids = [row["id"] for row in rows if row.get("id") is not None]
+        if not ids:
+            continue
+        try:
+            supabase.table(table).delete().in_("id", ids).execute()
+        except Exception as e:
+            print(f"[store] Failed to roll back {table} rows {ids}: {e}")
@@ -1,11 +1,9 @@
-from openai import OpenAI
-
+from tt.brain.hippocampus.utils.openai_client import get_openai
 from tt.brain.temporal_lobe.prompts.summarize_conversation import SUMMARIZE_PROMPT
-from tt.config import OPENAI_API_KEY
 
 
 def summarize(messages):
-    client = OpenAI(api_key=OPENAI_API_KEY)
+    client = get_openai()
 
     prompt = f"{SUMMARIZE_PROMPT}{messages}"
 
@@ -1,20 +1,44 @@
 """OpenAI Realtime API conversation controller."""
 
-import base64
+import atexit
+import audioop
+import functools
+import json
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
 
 import pyaudio
 
 import tt.brain.tools  # Register tools on import
-from tt.brain.handlers import find_and_run
+from tt.brain.handlers import find_and_run, try_fast_path
 from tt.brain.handlers.conversation_log import ConversationLog
-from tt.brain.handlers.tools_plug import get_tool_definitions
+from tt.brain.handlers.memory_prefetch import MemoryPrefetcher
+from tt.brain.handlers.tools_plug import (
+    ToolContext,
+    get_tool_definitions,
+    registry_version,
+    run_in_tool_context,
+)
+from tt.brain.handlers.websocket_tool_calls import CONTINUE_RESPONSE, ToolCallBatches
 from tt.brain.temporal_lobe.prompts.ted_personality import INSTRUCTIONS
-from tt.config import OPENAI_API_KEY
+from tt.config import (
+    EVENT_TRACE_AUDIO,
+    EVENT_TRACE_DIR,
+    OPENAI_API_KEY,
+    TURN_LATENCY_LOG,
+    UPLINK_MAX_LATENCY_MS,
+    UPLINK_PACKET_MS,
+)
 from tt.state_manager import State, StateManager
+from tt.utils.audio_buffers import DROP_OLDEST
+from tt.utils.audio_framing import AudioUplink
 from tt.utils.audio_interface_openai import AudioIO
+from tt.utils.event_trace import EventRecorder
 from tt.utils.realtime_socket import RealtimeSocket
+from tt.utils.turn_tracer import TurnLatencySink, TurnTracer
 
 # -------------------------------------------------------------------
 # Config
@@ -23,41 +47,183 @@ from tt.utils.realtime_socket import RealtimeSocket
 CHUNK_SIZE = 1024
 RATE = 24000
 FORMAT = pyaudio.paInt16
+SPEAKER_BUFFER_SECONDS = 120.0  # Max model speech buffered ahead of playback
+MIC_QUEUE_FRAMES = 64  # Max mic chunks waiting to be sent before overflow kicks in
+MIC_OVERFLOW = DROP_OLDEST  # or BLOCK (see tt.utils.audio_buffers.CaptureQueue)
 
 MODEL = "gpt-realtime-mini"
 VOICE = "ballad"
 VAD_THRESHOLD = 0.5
 # other model to try: whisper-1 but is 2x the cost but still $0.006 / minute
 INPUT_AUDIO_TRANSCRIPTION_MODEL = "gpt-4o-mini-transcribe"
+TOOL_CALL_WORKERS = 8  # Max tool calls being handled (waited on + reported) at once
+PREFETCH_WORKERS = 4  # Max memory prefetches running at once, across conversations
+
+
+
+@functools.lru_cache(maxsize=1)
+def session_update_payload(tools_version: int) -> str:
+    """
+    Serialized session.update, built once and reused by every session.
+    Keyed by the tool registry version so a newly registered tool rebuilds it.
+    """
+    return json.dumps(
+        {
+            "type": "session.update",
+            "session": {
+                "voice": VOICE,
+                "instructions": INSTRUCTIONS,
+                "tools": get_tool_definitions(),
+                "tool_choice": "auto",
+                "input_audio_transcription": {"model": INPUT_AUDIO_TRANSCRIPTION_MODEL},
+                "turn_detection": {
+                    "type": "server_vad",
+                    "threshold": VAD_THRESHOLD,
+                },
+            },
+        }
+    )
 
 
 # -------------------------------------------------------------------
 # Controller
 # -------------------------------------------------------------------
 
+# Shared by every conversation: handles tool calls off the receive thread.
+# Each worker waits on the tool itself, which runs on the tools_plug pool
+# and is bounded by that tool's timeout.
+_TOOL_CALL_POOL = ThreadPoolExecutor(
+    max_workers=TOOL_CALL_WORKERS, thread_name_prefix="tt-tool-call"
+)
+# Also shared, so many concurrent conversations don't each hold prefetch threads
+_PREFETCH_POOL = ThreadPoolExecutor(
+    max_workers=PREFETCH_WORKERS, thread_name_prefix="tt-prefetch"
+)
+
+# Turn latency percentiles accumulate across conversations in this process
+# (every device on a gateway), so they're reported once, at exit
+_TURN_LATENCY = TurnLatencySink(TURN_LATENCY_LOG or None)
+
+
+def _dump_turn_latency():
+    if _TURN_LATENCY.turns:
+        print(f"[latency] Turn latency over the last {_TURN_LATENCY.window} turns:")
+        print(_TURN_LATENCY.format_summary())
+    _TURN_LATENCY.close()
+
+
+atexit.register(_dump_turn_latency)
+
 
 class RealtimeConversation:
-    def __init__(self, api_key: str, state_mgr: StateManager | None = None):
-        self.audio = AudioIO(chunk_size=CHUNK_SIZE, rate=RATE, format=FORMAT)
-        self.sock = RealtimeSocket(
-            api_key,
-            f"wss://api.openai.com/v1/realtime?model={MODEL}",
-            self._on_msg,
+    def __init__(
+        self,
+        api_key: str,
+        state_mgr: StateManager | None = None,
+        audio=None,
+        sock=None,
+        ws_url: str | None = None,
+        memory: bool = True,
+        tool_context: ToolContext | None = None,
+    ):
+        # audio/sock can be injected (e.g. the fakes in tt.utils.event_trace for replay);
+        # ws_url points at another Realtime endpoint (e.g. the local stand-in server);
+        # memory=False skips memory prefetch and memorizing the session (load tests);
+        # tool_context says which device this is and whose memories to use (gateway)
+        self.audio = audio or AudioIO(
+            chunk_size=CHUNK_SIZE,
+            rate=RATE,
+            format=FORMAT,
+            speaker_buffer_seconds=SPEAKER_BUFFER_SECONDS,
+            mic_queue_frames=MIC_QUEUE_FRAMES,
+            mic_overflow=MIC_OVERFLOW,
+        )
+        self.sock = sock or self._make_socket(
+            api_key, ws_url or f"wss://api.openai.com/v1/realtime?model={MODEL}"
+        )
+        self.uplink = AudioUplink(
+            self.sock.send_raw,
+            rate=RATE,
+            sample_width=self.audio.sample_width,
+            packet_ms=UPLINK_PACKET_MS,
+            max_latency_ms=UPLINK_MAX_LATENCY_MS,
         )
         self.running = True
-        self.log = ConversationLog(MODEL, VOICE)
+        self.tool_context = tool_context or ToolContext()
+        self.log = ConversationLog(MODEL, VOICE, namespace=self.tool_context.namespace)
         self.state_mgr = state_mgr
 
         # Buffers for streaming data
         self.transcript_buffers = {}  # AI transcript chunks
         self.transcript_printed = set()
         self.tool_arg_buffers = {}  # Tool call argument chunks
+        # One response.create per response, after all of its tool calls report back
+        self.tool_batches = ToolCallBatches(lambda: self.sock.send(CONTINUE_RESPONSE))
         # Track completed user turns so tools can wait for transcripts
         self.user_turn = 0
         self.user_turn_condition = threading.Condition()
+        # Recalls memories as user turns complete so get_memories is instant
+        self.memory = memory
+        self.memory_prefetch = (
+            MemoryPrefetcher(self.tool_context, pool=_PREFETCH_POOL) if memory else None
+        )
+
+        # Per-turn latency: speech stopped -> transcript, tools, first audio...
+        self.tracer = TurnTracer(_TURN_LATENCY)
+        self.audio.on_playback = self._on_playback
+
+        # Set once the server has applied our session.update
+        self.session_ready = threading.Event()
+        self.connected_at = None  # monotonic time the socket opened
+        self.woke_at = None  # monotonic time of the wake word that activated us
+        self.first_audio_at = None  # monotonic time model audio first played after that
+
+        # Inbound event trace for replay (EVENT_TRACE_DIR), opened on connect
+        self.recorder = None
+
+    def _make_socket(self, api_key: str, ws_url: str):
+        return RealtimeSocket(api_key, ws_url, self._on_msg, on_raw=self._on_raw)
+
+    def dispatch(self, fn, *args):
+        """Run blocking work (e.g. a tool call) off the receive thread."""
+        _TOOL_CALL_POOL.submit(run_in_tool_context, self.tool_context, fn, *args)
 
     def start(self):
+        """Connect and go live straight away (no warm-up)."""
+        self.connect()
+        self.activate()
+
+    def connect(self):
+        """
+        Open the socket and configure the session, without touching audio.
+        A connected conversation can sit idle (e.g. in a WarmSessionPool)
+        until activate() is called; session_ready is set once it's configured.
+        """
+        self._start_recording()
         self.sock.connect()
+        self.connected_at = time.monotonic()
+
+    def _start_recording(self):
+        if EVENT_TRACE_DIR and self.recorder is None:
+            name = f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{id(self):x}.jsonl.gz"
+            self.recorder = EventRecorder(Path(EVENT_TRACE_DIR) / name, include_audio=EVENT_TRACE_AUDIO)
+
+    def activate(
+        self,
+        woke_at: float | None = None,
+        preroll: bytes | None = None,
+        preroll_rate: int = RATE,
+    ):
+        """
+        Start audio and stream the mic; the conversation is now live.
+        `preroll` is mic audio captured around the wake word (16-bit mono at
+        `preroll_rate`); it's sent ahead of the live mic so nothing said
+        while we were spinning up is lost.
+        """
+        self.woke_at = woke_at if woke_at is not None else time.monotonic()
+        # A warm session may have been connected long before the user spoke
+        self.log.session_start = datetime.now()
+        self._send_preroll(preroll, preroll_rate)
         self.audio.start()
         threading.Thread(target=self._mic_loop, daemon=True).start()
         print(
@@ -67,15 +233,48 @@ class RealtimeConversation:
     def _mic_loop(self):
         """Stream mic audio to OpenAI. Server VAD handles speech detection."""
         while self.running:
-            chunk = self.audio.read_mic_chunk()
+            # Wakes as soon as the mic callback delivers a frame; on timeout,
+            # flush any partial packet that has hit the latency cap.
+            chunk = self.audio.read_mic_chunk(timeout=self.uplink.max_latency)
             if chunk:
-                self.sock.send(
-                    {
-                        "type": "input_audio_buffer.append",
-                        "audio": base64.b64encode(chunk).decode("utf-8"),
-                    }
-                )
-            time.sleep(0.01)
+                self._push_mic(chunk)
+            else:
+                self.uplink.poll()
+
+    def _send_preroll(self, preroll: bytes | None, rate: int):
+        if not preroll:
+            return
+        if rate != RATE:
+            preroll, _ = audioop.ratecv(preroll, self.audio.sample_width, 1, rate, RATE, None)
+        self._push_mic(preroll)
+
+    def _push_mic(self, chunk: bytes):
+        self.uplink.push(chunk)
+
+    def _on_playback(self):
+        # Runs in the speaker callback: just take the timestamp, stop() logs it
+        if self.first_audio_at is None and self.woke_at is not None:
+            self.first_audio_at = time.monotonic()
+        self.tracer.mark("first_playback")
+
+    def _log_wake_latency(self):
+        """Wake word -> first model audio played, the wait a warm session shortens."""
+        if self.woke_at is None:
+            return
+        warm = "warm" if self.connected_at is not None and self.connected_at < self.woke_at else "cold"
+        if self.first_audio_at is None:
+            print(f"[latency] wake → first model audio: none played ({warm} session)")
+        else:
+            print(
+                f"[latency] wake → first model audio: "
+                f"{(self.first_audio_at - self.woke_at) * 1000:.0f} ms ({warm} session)"
+            )
+
+    def _on_raw(self, raw) -> bool:
+        """Fast path for raw frames that don't need a full JSON parse."""
+        if self.recorder is not None:
+            self.recorder.record(raw)
+        return try_fast_path(self, raw)
 
     def _on_msg(self, msg: dict):
         """Route incoming messages to handlers."""
@@ -83,24 +282,11 @@ class RealtimeConversation:
 
         # Session setup
         if typ == "session.created":
-            self.sock.send(
-                {
-                    "type": "session.update",
-                    "session": {
-                        "voice": VOICE,
-                        "instructions": INSTRUCTIONS,
-                        "tools": get_tool_definitions(),
-                        "tool_choice": "auto",
-                        "input_audio_transcription": {
-                            "model": INPUT_AUDIO_TRANSCRIPTION_MODEL
-                        },
-                        "turn_detection": {
-                            "type": "server_vad",
-                            "threshold": VAD_THRESHOLD,
-                        },
-                    },
-                }
-            )
+            self.tracer.session = (msg.get("session") or {}).get("id")
+            self.sock.send_raw(session_update_payload(registry_version()))
+            return
+        if typ == "session.updated":
+            self.session_ready.set()
             return
 
         # Error handling
@@ -115,6 +301,21 @@ class RealtimeConversation:
         """Block until the websocket connection closes."""
         self.sock.done_event.wait()
 
+    def is_alive(self) -> bool:
+        """Socket still open (the server closes it when the session expires)."""
+        return self.running and not self.sock.done_event.is_set()
+
+    def discard(self):
+        """Tear down a session that was never activated: nothing to save."""
+        self.running = False
+        self.sock.close()
+        self.audio.stop()
+        if self.memory_prefetch:
+            self.memory_prefetch.shutdown()
+        self.tool_batches.cancel()
+        if self.recorder is not None:
+            self.recorder.close()
+
     def stop(self):
         # FUTURE FW integration: after the conversation ends and the websocket
         # is torn down, the state manager should notify firmware to enter idle:
@@ -125,7 +326,16 @@ class RealtimeConversation:
         self.running = False
         self.audio.stop()
         self.sock.close()
-        self.log.save()
+        if self.memory_prefetch:
+            self.memory_prefetch.shutdown()
+        self.tool_batches.cancel()
+        if self.recorder is not None:
+            self.recorder.close()
+            print(f"[trace] {self.recorder.events} events recorded to {self.recorder.path}")
+        self.tracer.end_turn()
+        self._log_wake_latency()
+        if self.memory:
+            self.log.save()
 
         if self.state_mgr:
             self.state_mgr.transition(State.WINDING_DOWN)
@@ -0,0 +1,172 @@
+"""
+asyncio runtime for the OpenAI Realtime conversation.
+
+Same behaviour and handlers as RealtimeConversation, but the socket receive
+loop, the socket send queue, mic pumping and tool dispatch all run on one
+event loop thread instead of a recv thread + mic thread + a thread per tool.
+Blocking tools are bridged to the loop's executor.
+
+Select it with `python -m tt.main --backend openai --runtime asyncio`.
+
+By default each conversation starts its own loop thread. Pass `loop=` to run
+many conversations on one shared loop instead (see tt/gateway.py); code
+already on that loop uses `await conv.aconnect()` / `await conv.aactivate()`,
+since the blocking connect()/activate() would wait on the loop they run on.
+"""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+
+from tt.brain.handlers.tools_plug import ToolContext, run_in_tool_context
+from tt.brain.prefrontal_cortex.openai_realtime import RATE, RealtimeConversation
+from tt.config import OPENAI_API_KEY
+from tt.state_manager import StateManager
+from tt.utils.realtime_socket_async import AsyncRealtimeSocket
+
+
+class AsyncRealtimeConversation(RealtimeConversation):
+    def __init__(
+        self,
+        api_key: str,
+        state_mgr: StateManager | None = None,
+        audio=None,
+        sock=None,
+        ws_url: str | None = None,
+        memory: bool = True,
+        tool_context: ToolContext | None = None,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ):
+        super().__init__(
+            api_key, state_mgr, audio=audio, sock=sock, ws_url=ws_url, memory=memory,
+            tool_context=tool_context,
+        )
+        # A shared loop is owned (started and stopped) by whoever passed it in
+        self.loop = loop
+        self._owns_loop = loop is None
+        self._loop_thread = None
+        self._mic_ready = None
+        self._mic_task = None
+
+    def _make_socket(self, api_key: str, ws_url: str):
+        return AsyncRealtimeSocket(api_key, ws_url, self._on_msg, on_raw=self._on_raw)
+
+    def dispatch(self, fn, *args):
+        """Bridge blocking work (e.g. a tool call) to the loop's executor."""
+        self.loop.run_in_executor(None, run_in_tool_context, self.tool_context, fn, *args)
+
+    def connect(self):
+        if self._owns_loop:
+            self.loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self.loop.run_forever, name="tt-realtime-loop", daemon=True
+            )
+            self._loop_thread.start()
+        asyncio.run_coroutine_threadsafe(self.aconnect(), self.loop).result()
+
+    async def aconnect(self):
+        """connect(), for callers already running on the conversation's loop."""
+        self._start_recording()
+        await self.sock.connect()
+        self.connected_at = time.monotonic()
+
+    def activate(
+        self,
+        woke_at: float | None = None,
+        preroll: bytes | None = None,
+        preroll_rate: int = RATE,
+    ):
+        woke_at = woke_at if woke_at is not None else time.monotonic()
+        asyncio.run_coroutine_threadsafe(
+            self.aactivate(woke_at, preroll, preroll_rate), self.loop
+        ).result()
+
+    async def aactivate(
+        self,
+        woke_at: float | None = None,
+        preroll: bytes | None = None,
+        preroll_rate: int = RATE,
+    ):
+        """activate(), for callers already running on the conversation's loop."""
+        self.woke_at = woke_at if woke_at is not None else time.monotonic()
+        self.log.session_start = datetime.now()
+        self._send_preroll(preroll, preroll_rate)
+        self._mic_ready = asyncio.Event()
+        self.audio.mic_queue.on_put(self._notify_mic)
+        self.audio.start()
+        self._mic_task = asyncio.create_task(self._mic_pump())
+        print(
+            "🎧 Realtime conversation started (asyncio). Speak into your mic... (Ctrl+C to quit)"
+        )
+
+    def _notify_mic(self):
+        # Runs on the PortAudio thread: just poke the loop
+        try:
+            self.loop.call_soon_threadsafe(self._mic_ready.set)
+        except RuntimeError:
+            pass  # Loop already closed during shutdown
+
+    async def _mic_pump(self):
+        """Stream mic audio to OpenAI. Server VAD handles speech detection."""
+        while self.running:
+            try:
+                await asyncio.wait_for(self._mic_ready.wait(), self.uplink.max_latency)
+            except asyncio.TimeoutError:
+                self.uplink.poll()
+                continue
+            self._mic_ready.clear()
+            while True:
+                chunk = self.audio.mic_queue.get_nowait()
+                if chunk is None:
+                    break
+                self._push_mic(chunk)
+
+    def discard(self):
+        super().discard()
+        self._stop_loop()
+
+    def stop(self):
+        super().stop()
+        self._stop_loop()
+
+    async def _cancel_mic_pump(self):
+        self._mic_task.cancel()
+        await asyncio.gather(self._mic_task, return_exceptions=True)
+
+    def _stop_loop(self):
+        if self.loop is None:
+            return
+        if self._mic_task and not self.loop.is_closed():
+            # Wait for the pump to unwind before going on: a cancelled task
+            # that never ran again is left pending on a shared loop, or
+            # destroyed with an owned one
+            try:
+                asyncio.run_coroutine_threadsafe(self._cancel_mic_pump(), self.loop).result(5)
+            except Exception:
+                pass
+        if not self._owns_loop:
+            return  # Shared loop: other conversations are still on it
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._loop_thread.join(timeout=5)
+        if not self.loop.is_running():
+            self.loop.close()
+
+
+# -------------------------------------------------------------------
+# Entry point (standalone, without state manager)
+# -------------------------------------------------------------------
+
+
+def main():
+    conv = AsyncRealtimeConversation(OPENAI_API_KEY)
+    conv.start()
+    try:
+        conv.wait_until_done()
+    except KeyboardInterrupt:
+        print("\nShutting down...")
+    conv.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Keeps a Realtime session connected and configured while TED listens for the
+wake word, so the wake word only has to flip it live.
+
+Without it, every conversation starts with a TLS handshake, session.created
+and session.update before the user can be heard. The pool does that work
+ahead of time and replaces the idle session before the server expires it
+(or as soon as the server drops it).
+
+Usage:
+    pool = WarmSessionPool(lambda: RealtimeConversation(OPENAI_API_KEY, state_mgr))
+    pool.prepare()              # start warming while we wait for the wake word
+    ...
+    conv = pool.acquire()       # connected + configured (or connects now if not)
+    conv.activate(woke_at)
+"""
+
+import threading
+import time
+
+# Realtime sessions are capped at 30 minutes; replace idle ones well before that
+MAX_SESSION_AGE = 25 * 60.0
+# How long a new session may take to be configured before we give up on it
+READY_TIMEOUT = 10.0
+# How often the refresher checks the warm session's health
+CHECK_INTERVAL = 1.0
+# Back-off after a failed warm-up (e.g. network down) before trying again
+RETRY_DELAY = 5.0
+
+
+class WarmSessionPool:
+    """
+    Holds at most one connected-but-inactive conversation.
+
+    Warming only happens between prepare() and acquire(), so there's never a
+    spare session open while a conversation is running.
+    """
+
+    def __init__(self, factory, max_age: float = MAX_SESSION_AGE, ready_timeout: float = READY_TIMEOUT):
+        self.factory = factory
+        self.max_age = max_age
+        self.ready_timeout = ready_timeout
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._wanted = False
+        self._conv = None  # warm conversation, session_ready already set
+        self._thread = None
+
+        # Counters
+        self.warmed = 0
+        self.refreshed = 0
+        self.hits = 0
+        self.misses = 0
+
+    def prepare(self):
+        """Start (or keep) a warm session until the next acquire()."""
+        with self._lock:
+            self._wanted = True
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="tt-warm-session", daemon=True)
+            self._thread.start()
+        self._wake.set()
+
+    def acquire(self):
+        """
+        Hand over the warm session. If none is ready (still connecting, or it
+        died), a new one is connected on the spot, same as without the pool.
+        """
+        with self._lock:
+            self._wanted = False
+            conv, self._conv = self._conv, None
+        if conv is not None and conv.is_alive():
+            self.hits += 1
+            return conv
+        if conv is not None:
+            conv.discard()
+        self.misses += 1
+        conv = self.factory()
+        conv.connect()
+        return conv
+
+    def close(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=self.ready_timeout + 1)
+        with self._lock:
+            conv, self._conv = self._conv, None
+        if conv is not None:
+            conv.discard()
+
+    def stats(self) -> dict:
+        return {"warmed": self.warmed, "refreshed": self.refreshed, "hits": self.hits, "misses": self.misses}
+
+    def _run(self):
+        while not self._stop.is_set():
+            wait = CHECK_INTERVAL
+            try:
+                self._refresh()
+            except Exception as e:
+                print(f"[warm] Couldn't warm a session: {e}")
+                wait = RETRY_DELAY
+            self._wake.wait(wait)
+            self._wake.clear()
+
+    def _refresh(self):
+        with self._lock:
+            wanted, current = self._wanted, self._conv
+        if current is not None:
+            expired = time.monotonic() - current.connected_at > self.max_age
+            if wanted and current.is_alive() and not expired:
+                return
+            # Stale, dropped by the server, or no longer wanted
+            with self._lock:
+                if self._conv is current:
+                    self._conv = None
+                else:
+                    return  # Taken by acquire() meanwhile
+            current.discard()
+            if wanted:
+                self.refreshed += 1
+        if not wanted:
+            return
+
+        conv = self.factory()
+        conv.connect()
+        if not conv.session_ready.wait(self.ready_timeout) or not conv.is_alive():
+            conv.discard()
+            raise TimeoutError(f"session not ready after {self.ready_timeout:.0f}s")
+        with self._lock:
+            if self._wanted and self._conv is None and not self._stop.is_set():
+                self._conv = conv
+                conv = None
+        if conv is not None:
+            conv.discard()  # acquire() moved on without us
+            return
+        self.warmed += 1
+        print("[warm] Realtime session connected and ready")
@@ -2,7 +2,7 @@
 
 from datetime import datetime, timezone
 
-from tt.brain.handlers.tools_plug import tool
+from tt.brain.handlers.tools_plug import current_tool_context, tool
 from tt.brain.hippocampus.recall import recall
 from tt.brain.tools.utils.recency import describe_recency
 
@@ -12,9 +12,13 @@ from tt.brain.tools.utils.recency import describe_recency
         "Use this frequently to stay grounded in past conversations. "
         "When in doubt, call this tool to retrieve context and improve your answers."
     ),
+    # Better to answer without memories than to leave the user in silence
+    timeout=8.0,
+    fallback={"memories": []},
 )
 def get_memories(message: str):
-    retrieved_data = recall(message) or []
+    # Only this device's memories (namespace None = single-device setup)
+    retrieved_data = recall(message, namespace=current_tool_context().namespace) or []
     now = datetime.now(timezone.utc)
 
     memories = []
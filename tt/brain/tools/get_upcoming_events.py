@@ -1,9 +1,13 @@
 """Tool: get_upcoming_events"""
 
-from tt.brain.handlers.tools_plug import tool
+from tt.brain.handlers.tools_plug import CachePolicy, tool
 
 
-@tool(description="Return upcoming calendar events for the day.")
+@tool(
+    description="Return upcoming calendar events for the day.",
+    # No arguments, so one entry per memory namespace (device)
+    cache=CachePolicy(ttl=300, max_entries=64),
+)
 def get_upcoming_events():
     return {
         "events": [
@@ -1,9 +1,10 @@
 """Tool: get_user_profile"""
 
-from tt.brain.handlers.tools_plug import tool
+from tt.brain.handlers.tools_plug import CachePolicy, tool
 
 
-@tool(description="Return the user's profile info.")
+# No arguments, so one entry per memory namespace (device)
+@tool(description="Return the user's profile info.", cache=CachePolicy(ttl=3600, max_entries=64))
 def get_user_profile():
     return {
         "name": "Alex Rivera",
@@ -1,13 +1,14 @@
 """Tool: get_weather"""
 
-from tt.brain.handlers.tools_plug import tool
+from tt.brain.handlers.tools_plug import CachePolicy, tool
 
 
 @tool(
     description="Return the weather for a city.",
     parameters={
         "city": {"type": "string", "description": "City name", "required": True}
-    }
+    },
+    cache=CachePolicy(ttl=600, max_entries=32, key=lambda args: args.get("city", "").strip().lower()),
 )
 def get_weather(city: str):
     return {
@@ -22,9 +22,69 @@ ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
 # OpenAI Configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# Shared HTTP client for OpenAI calls outside the Realtime socket
+# (summaries, highlights, embeddings): request/connect timeouts in seconds,
+# SDK retries (with backoff) and the size of the keep-alive pool.
+OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "30"))
+OPENAI_CONNECT_TIMEOUT = float(os.getenv("OPENAI_CONNECT_TIMEOUT", "5"))
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "20"))
+
+# Realtime uplink framing: mic audio is coalesced into packets of this many ms,
+# and a partial packet is flushed once its oldest audio is MAX_LATENCY_MS old.
+UPLINK_PACKET_MS = int(os.getenv("UPLINK_PACKET_MS", "40"))
+UPLINK_MAX_LATENCY_MS = int(os.getenv("UPLINK_MAX_LATENCY_MS", "80"))
+
+# Keep a Realtime session connected and configured while listening for the
+# wake word, so waking up doesn't wait on the handshake + session setup
+REALTIME_WARM_SESSION = os.getenv("REALTIME_WARM_SESSION", "1").lower() in ("1", "true", "yes")
+
+# Per-turn latency spans (speech stopped -> transcript, tools, first audio...),
+# one JSON line per turn, e.g. TURN_LATENCY_LOG=conversation_logs/turn_latency.jsonl.
+# Off by default: the in-process percentiles are printed at exit either way.
+TURN_LATENCY_LOG = os.getenv("TURN_LATENCY_LOG", "")
+
+# Record per-event-type dispatch counts/timings (report printed on exit)
+PROFILE_DISPATCH = os.getenv("PROFILE_DISPATCH", "").lower() in ("1", "true", "yes")
+
+# Record every inbound Realtime event of each conversation to
+# EVENT_TRACE_DIR/<timestamp>.jsonl.gz for replay (tt.experimental.replay_events).
+# Audio payloads are stripped unless EVENT_TRACE_AUDIO=1.
+EVENT_TRACE_DIR = os.getenv("EVENT_TRACE_DIR", "")
+EVENT_TRACE_AUDIO = os.getenv("EVENT_TRACE_AUDIO", "").lower() in ("1", "true", "yes")
+
+# Gateway (python -m tt.gateway): devices stream audio in over websockets and
+# each gets its own Realtime conversation. MAX_SESSIONS caps concurrent devices;
+# WORKERS bounds the threads shared by every session for blocking work
+# (tool call handling, session teardown/saving). Only local connections by
+# default: set GATEWAY_HOST=0.0.0.0 to let devices on the network in.
+GATEWAY_HOST = os.getenv("GATEWAY_HOST", "127.0.0.1")
+GATEWAY_PORT = int(os.getenv("GATEWAY_PORT", "8780"))
+GATEWAY_MAX_SESSIONS = int(os.getenv("GATEWAY_MAX_SESSIONS", "500"))
+GATEWAY_WORKERS = int(os.getenv("GATEWAY_WORKERS", "16"))
+# The devices allowed to connect, as "device_id:token,device_id:token". Each
+# authenticates with HTTP Basic auth on the websocket handshake; its device id
+# is also the namespace its memories are kept under.
+GATEWAY_DEVICE_TOKENS = os.getenv("GATEWAY_DEVICE_TOKENS", "")
+
 # Porcupine Configuration (for wake word detection)
 PORCUPINE_ACCESS_KEY = os.getenv("PORCUPINE_ACCESS_KEY")
 
-# Supabase Configuration
-SUPABASE_URL: str = _require_env("SUPABASE_URL")
-SUPABASE_KEY: str = _require_env("SUPABASE_KEY")
+# Hippocampus: serve recall from an in-process vector index instead of the
+# find_highlights RPC (needs numpy; loads all highlights into memory)
+HIPPOCAMPUS_LOCAL_INDEX = os.getenv("HIPPOCAMPUS_LOCAL_INDEX", "").lower() in ("1", "true", "yes")
+
+# Embedding cache: in-memory LRU + SQLite file (set EMBED_CACHE_PATH="" for memory only)
+EMBED_CACHE_PATH = os.getenv("EMBED_CACHE_PATH", ".cache/embeddings.sqlite3")
+EMBED_CACHE_MEMORY_ENTRIES = int(os.getenv("EMBED_CACHE_MEMORY_ENTRIES", "4096"))
+
+# Supabase Configuration: SUPABASE_URL, SUPABASE_KEY
+# Only the hippocampus needs these, so they're checked when first read
+# (see __getattr__) rather than when tt.config is imported.
+_REQUIRED_ON_ACCESS = ("SUPABASE_URL", "SUPABASE_KEY")
+
+
+def __getattr__(name: str):
+    if name in _REQUIRED_ON_ACCESS:
+        return _require_env(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
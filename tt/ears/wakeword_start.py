@@ -1,62 +1,152 @@
 """
 Wake word detection using Porcupine.
 
-Provides a blocking `wait_for_wakeword()` that can be called repeatedly
-in the main lifecycle loop. Each call creates a fresh Porcupine instance
-and audio stream, listens until the wake word is detected, then cleans up
-and returns.
+`WakeWordEngine` is created once and reused every cycle: Porcupine and
+PyAudio stay loaded, only the capture stream is opened per cycle (and closed
+again so the conversation can have the mic). Frames are handed to Porcupine
+as an int16 memoryview of the captured bytes. Porcupine copies every frame
+into a ctypes array itself, which dominates the per-frame cost however the
+frame was decoded (see tt/experimental/bench_wakeword.py).
+
+The engine keeps the last PREROLL_MS of audio, and keeps capturing after
+the wake word until finish() is called, so "Hey Ted, what's..." reaches the
+conversation whole instead of losing whatever was said while it spun up.
+
+`wait_for_wakeword()` is kept for callers that just want to block.
 """
 
-import struct
+import collections
+import queue
+import time
 
 import pvporcupine
 import pyaudio
 
 from tt.config import PORCUPINE_ACCESS_KEY
 
+KEYWORD_PATH = "tt/brain/models/wake_model_hey_ted.ppn"
+PREROLL_MS = 1500  # Audio kept from before the wake word (covers the phrase itself)
+MAX_TAIL_MS = 5000  # Cap on audio captured between detection and finish()
 
-def wait_for_wakeword():
-    """
-    Block until the wake word is detected, then return.
 
-    Creates and tears down Porcupine + PyAudio each cycle so resources
-    are fully released while the conversation is active.
+class WakeWordEngine:
+    """
+    Long-lived Porcupine + PyAudio. Call wait() to listen, then finish() to
+    release the mic and get the pre-roll (16-bit mono PCM at `sample_rate`).
 
-    FUTURE FW integration: while this function is blocking, firmware
-    should be in IDLE mode:
+    FUTURE FW integration: while wait() is blocking, firmware should be in
+    IDLE mode:
       - Servo PWM disabled (arms free-moving, no torque, lower power draw)
       - MPU I2C disabled (no motion/gesture reads needed while idle)
       - Heart rate sensor powered down (no reads until conversation starts)
-    Once this function returns (wake word detected), the caller should
-    transition to ACTIVE so firmware powers everything back on.
+    Once wait() returns (wake word detected), the caller should transition
+    to ACTIVE so firmware powers everything back on.
     """
-    if not PORCUPINE_ACCESS_KEY:
-        raise RuntimeError("PORCUPINE_ACCESS_KEY not found in environment (.env)")
-
-    porcupine = pvporcupine.create(
-        access_key=PORCUPINE_ACCESS_KEY,
-        keyword_paths=["tt/brain/models/wake_model_hey_ted.ppn"],
-    )
-
-    paud = pyaudio.PyAudio()
-    audio_stream = paud.open(
-        rate=porcupine.sample_rate,
-        channels=1,
-        format=pyaudio.paInt16,
-        input=True,
-        frames_per_buffer=porcupine.frame_length,
-    )
-
-    print("Listening for wakeword...")
-
-    try:
+
+    def __init__(self, keyword_path: str = KEYWORD_PATH, preroll_ms: int = PREROLL_MS):
+        if not PORCUPINE_ACCESS_KEY:
+            raise RuntimeError("PORCUPINE_ACCESS_KEY not found in environment (.env)")
+
+        self.porcupine = pvporcupine.create(
+            access_key=PORCUPINE_ACCESS_KEY,
+            keyword_paths=[keyword_path],
+        )
+        self.sample_rate = self.porcupine.sample_rate
+        self.frame_length = self.porcupine.frame_length
+        frame_ms = self.frame_length * 1000 / self.sample_rate
+        self.paud = pyaudio.PyAudio()
+        self.stream = None
+
+        # Written by the PortAudio callback, consumed by wait()
+        self._frames = queue.SimpleQueue()
+        self._preroll = collections.deque(maxlen=max(1, int(preroll_ms / frame_ms)))
+        self._tail = []
+        self._max_tail = int(MAX_TAIL_MS / frame_ms)
+        self._triggered = False
+
+        # Stats for the last cycle
+        self.rearm_ms = None  # wait() called -> first frame reached Porcupine
+        self.idle_cpu = None  # process CPU / wall time while listening
+        self.listened_s = None
+
+    def _on_frame(self, in_data, frame_count, time_info, status):
+        if self._triggered:
+            if len(self._tail) < self._max_tail:
+                self._tail.append(in_data)
+        else:
+            self._preroll.append(in_data)
+            self._frames.put(in_data)
+        return (None, pyaudio.paContinue)
+
+    def wait(self):
+        """Block until the wake word is detected. The mic keeps recording until finish()."""
+        started, cpu_started = time.monotonic(), time.process_time()
+        self._reset()
+        self.stream = self.paud.open(
+            rate=self.sample_rate,
+            channels=1,
+            format=pyaudio.paInt16,
+            input=True,
+            frames_per_buffer=self.frame_length,
+            stream_callback=self._on_frame,
+        )
+        print("Listening for wakeword...")
+
+        first = True
         while True:
-            pcm = audio_stream.read(porcupine.frame_length)
-            pcm = struct.unpack_from("h" * porcupine.frame_length, pcm)
-            if porcupine.process(pcm) >= 0:
-                print("Wake word detected!")
-                return
-    finally:
-        audio_stream.close()
-        paud.terminate()
-        porcupine.delete()
+            pcm = self._frames.get()
+            if first:
+                self.rearm_ms = (time.monotonic() - started) * 1000
+                first = False
+            if self.porcupine.process(memoryview(pcm).cast("h")) >= 0:
+                self._triggered = True
+                break
+
+        self.listened_s = time.monotonic() - started
+        self.idle_cpu = (time.process_time() - cpu_started) / self.listened_s if self.listened_s else 0.0
+        print(
+            f"Wake word detected! (re-armed in {self.rearm_ms:.0f} ms, "
+            f"idle CPU {self.idle_cpu * 100:.1f}% over {self.listened_s:.0f}s)"
+        )
+
+    def finish(self) -> bytes:
+        """Release the mic and return the audio around the wake word."""
+        if self.stream is not None:
+            self.stream.stop_stream()
+            self.stream.close()
+            self.stream = None
+        audio = b"".join(self._preroll) + b"".join(self._tail)
+        self._reset()
+        return audio
+
+    def _reset(self):
+        self._triggered = False
+        self._preroll.clear()
+        self._tail = []
+        self._frames = queue.SimpleQueue()
+
+    def stats(self) -> dict:
+        return {"rearm_ms": self.rearm_ms, "idle_cpu": self.idle_cpu, "listened_s": self.listened_s}
+
+    def close(self):
+        self.finish()
+        self.paud.terminate()
+        self.porcupine.delete()
+
+
+_engine = None
+
+
+def get_engine() -> WakeWordEngine:
+    """Return the process-wide engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        _engine = WakeWordEngine()
+    return _engine
+
+
+def wait_for_wakeword() -> bytes:
+    """Block until the wake word is detected; returns the pre-roll audio."""
+    engine = get_engine()
+    engine.wait()
+    return engine.finish()
@@ -0,0 +1,145 @@
+"""
+Benchmark: CPU cost of handling inbound response.audio.delta frames.
+
+Compares three paths on synthetic frames shaped like the Realtime API's and
+reports CPU milliseconds per second of received audio:
+
+    baseline   the original code: json.loads -> handler lookup ->
+               base64.b64decode -> bytearray speaker buffer
+    generic    json.loads -> find_and_run -> on_audio_delta (binascii) ->
+               speaker ring
+    fast path  try_fast_audio_delta on the raw frame text -> speaker ring
+
+Speedups are against the baseline.
+
+Usage:
+    python -m tt.experimental.bench_audio_delta
+    python -m tt.experimental.bench_audio_delta --seconds 3000 --delta-ms 20
+"""
+
+import argparse
+import base64
+import json
+import os
+import time
+
+from tt.brain.handlers import find_and_run
+from tt.brain.handlers.audio import try_fast_audio_delta
+from tt.utils.audio_buffers import SpeakerRingBuffer
+
+RATE = 24000
+SAMPLE_WIDTH = 2
+
+
+class _FakeAudio:
+    def __init__(self, capacity_bytes):
+        self.speaker = SpeakerRingBuffer(capacity_bytes)
+
+    def push_tts(self, audio_bytes):
+        self.speaker.write(audio_bytes)
+
+    def drain(self):
+        self.speaker.clear()
+
+
+class _BaselineAudio:
+    """The original AudioIO speaker: one growing bytearray."""
+
+    def __init__(self, capacity_bytes):
+        self.audio_buffer = bytearray()
+
+    def push_tts(self, audio_bytes):
+        self.audio_buffer.extend(audio_bytes)
+
+    def drain(self):
+        self.audio_buffer.clear()
+
+
+class _FakeConv:
+    def __init__(self, audio):
+        self.audio = audio
+
+
+def _baseline_on_audio_delta(conv, msg: dict):
+    conv.audio.push_tts(base64.b64decode(msg["delta"]))
+
+
+_BASELINE_HANDLERS = {"response.audio.delta": _baseline_on_audio_delta}
+
+
+def _make_frames(seconds: float, delta_ms: int) -> list[str]:
+    pcm = os.urandom(int(RATE * delta_ms / 1000) * SAMPLE_WIDTH)
+    delta = base64.b64encode(pcm).decode("ascii")
+    count = int(seconds * 1000 / delta_ms)
+    return [
+        json.dumps(
+            {
+                "type": "response.audio.delta",
+                "event_id": f"event_{i}",
+                "response_id": "resp_bench",
+                "item_id": "item_bench",
+                "output_index": 0,
+                "content_index": 0,
+                "delta": delta,
+            },
+            separators=(",", ":"),
+        )
+        for i in range(count)
+    ]
+
+
+def _baseline(conv, raw):
+    msg = json.loads(raw)
+    handler = _BASELINE_HANDLERS.get(msg.get("type"))
+    if handler:
+        handler(conv, msg)
+
+
+def _generic(conv, raw):
+    find_and_run(conv, json.loads(raw))
+
+
+def _fast(conv, raw):
+    if not try_fast_audio_delta(conv, raw):
+        find_and_run(conv, json.loads(raw))
+
+
+def _measure(handle, audio_cls, frames, frame_bytes) -> float:
+    # Buffer holds one frame; drain after each push so it never overruns
+    conv = _FakeConv(audio_cls(frame_bytes))
+    audio = conv.audio
+    t0 = time.process_time()
+    for raw in frames:
+        handle(conv, raw)
+        audio.drain()
+    return time.process_time() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=1500, help="Seconds of audio to simulate")
+    parser.add_argument("--delta-ms", type=int, default=100, help="Audio per delta frame")
+    parser.add_argument("--rounds", type=int, default=3, help="Best-of rounds")
+    args = parser.parse_args()
+
+    frames = _make_frames(args.seconds, args.delta_ms)
+    frame_bytes = int(RATE * args.delta_ms / 1000) * SAMPLE_WIDTH
+
+    results = {}
+    paths = (
+        ("baseline", _baseline, _BaselineAudio),
+        ("generic", _generic, _FakeAudio),
+        ("fast path", _fast, _FakeAudio),
+    )
+    for name, handle, audio_cls in paths:
+        best = min(_measure(handle, audio_cls, frames, frame_bytes) for _ in range(args.rounds))
+        results[name] = best / args.seconds * 1000  # CPU ms per second of audio
+
+    print(f"{len(frames)} frames, {args.seconds:.0f}s of audio, {args.delta_ms} ms per delta")
+    for name, ms in results.items():
+        speedup = results["baseline"] / ms
+        print(f"  {name:<10} {ms:7.3f} ms CPU / s audio  ({speedup:.2f}x vs baseline)")
+
+
+if __name__ == "__main__":
+    main()
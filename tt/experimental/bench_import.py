@@ -0,0 +1,112 @@
+"""
+Benchmark: cold-start import time of the tt package (fails on regression).
+
+Imports each target module in a fresh interpreter under `-X importtime`, with
+the Supabase/OpenAI variables removed from the environment, and checks that:
+  - the import succeeds without those variables,
+  - none of the heavy client libraries (openai, supabase, numpy, ...) get
+    loaded just by importing it; they belong behind first use,
+  - its cumulative import time (best of --runs) stays under --budget-ms.
+
+Exits non-zero if any check fails, so it can gate CI or a pre-commit hook.
+
+Usage:
+    python -m tt.experimental.bench_import
+    python -m tt.experimental.bench_import --budget-ms 100 --runs 5
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+TARGETS = [
+    "tt.config",
+    "tt.main",
+    "tt.brain.handlers",
+    "tt.brain.tools",
+    "tt.brain.hippocampus.recall",
+    "tt.brain.hippocampus.spool",
+]
+
+# Must only be imported when a client is actually used
+HEAVY_MODULES = ["openai", "supabase", "numpy", "pydantic", "httpx", "pvporcupine"]
+
+# Only needed once the hippocampus / OpenAI clients are used
+LAZY_ENV = ["SUPABASE_URL", "SUPABASE_KEY", "OPENAI_API_KEY"]
+
+# tt.config calls load_dotenv(), which would put the variables right back
+# from a local .env; neutralise it (dotenv's own import isn't counted then)
+# (__import__ rather than importlib.import_module: -X importtime only sees the former)
+_PROBE = """
+import json, sys
+import dotenv
+dotenv.load_dotenv = lambda *args, **kwargs: False
+__import__(sys.argv[1])
+print(json.dumps([m for m in json.loads(sys.argv[2]) if m in sys.modules]))
+"""
+
+_IMPORTTIME = re.compile(r"^import time:\s+\d+\s+\|\s+(\d+)\s+\|\s*(\S+)\s*$")
+
+
+def _measure(target: str) -> tuple[float | None, list[str], str | None]:
+    """(cumulative ms, heavy modules loaded, error) for one cold import."""
+    env = {k: v for k, v in os.environ.items() if k not in LAZY_ENV}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE, target, json.dumps(HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if proc.returncode != 0:
+        return None, [], proc.stderr.strip().splitlines()[-1]
+    cumulative = None
+    for line in proc.stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match and match.group(2) == target:
+            cumulative = int(match.group(1)) / 1000
+    return cumulative, json.loads(proc.stdout.strip().splitlines()[-1]), None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget-ms", type=float, default=150, help="Max cumulative import time per target")
+    parser.add_argument("--runs", type=int, default=3, help="Best-of runs per target")
+    parser.add_argument("targets", nargs="*", default=TARGETS)
+    args = parser.parse_args()
+
+    failures = 0
+    for target in args.targets:
+        times, heavy, error = [], [], None
+        for _ in range(args.runs):
+            ms, heavy, error = _measure(target)
+            if error:
+                break
+            if ms is None:
+                error = "no -X importtime entry (already imported?)"
+                break
+            times.append(ms)
+        if error:
+            failures += 1
+            print(f"  FAIL {target:<30} import failed: {error}")
+            continue
+
+        best = min(times)
+        problems = []
+        if heavy:
+            problems.append(f"loads {', '.join(heavy)}")
+        if best > args.budget_ms:
+            problems.append(f"over budget ({args.budget_ms:.0f} ms)")
+        failures += bool(problems)
+        status = "FAIL" if problems else "ok  "
+        print(f"  {status} {target:<30} {best:7.1f} ms  {'; '.join(problems)}")
+
+    if failures:
+        print(f"{failures} target(s) regressed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark: per-row vs bulk highlight inserts in hippocampus store().
+
+Starts a local stand-in for Supabase's PostgREST endpoint (POST/DELETE on
+/rest/v1/<table>, with a configurable per-request latency), points the
+Supabase client at it and times the old one-request-per-highlight loop
+against store()'s bulk insert.
+
+Usage:
+    python -m tt.experimental.bench_store
+    python -m tt.experimental.bench_store --highlights 15 --latency-ms 40
+"""
+
+import argparse
+import itertools
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class _PostgRESTStandIn(BaseHTTPRequestHandler):
+    latency = 0.03
+    ids = itertools.count(1)
+    requests = 0
+
+    def do_POST(self):
+        time.sleep(self.latency)
+        type(self).requests += 1
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"[]")
+        rows = body if isinstance(body, list) else [body]
+        self._reply(201, [{"id": next(self.ids), **row} for row in rows])
+
+    def do_DELETE(self):
+        time.sleep(self.latency)
+        type(self).requests += 1
+        self._reply(200, [])
+
+    def _reply(self, status, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def _start_server(latency: float) -> ThreadingHTTPServer:
+    _PostgRESTStandIn.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PostgRESTStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--highlights", type=int, default=15, help="Highlights per session")
+    parser.add_argument("--latency-ms", type=float, default=30, help="Simulated round trip per request")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    server = _start_server(args.latency_ms / 1000)
+    # Must be set before tt.config / the Supabase client are imported
+    os.environ["SUPABASE_URL"] = f"http://127.0.0.1:{server.server_port}"
+    os.environ["SUPABASE_KEY"] = "bench.stand.in"
+    os.environ["HIPPOCAMPUS_LOCAL_INDEX"] = ""
+
+    from tt.brain.hippocampus.supabase_client import get_supabase
+    from tt.brain.hippocampus.utils.store import store
+
+    supabase = get_supabase()
+
+    embedding = [0.0] * 1536
+    highlights = [(f"highlight {i}", embedding) for i in range(args.highlights)]
+    session = ("bench", 60, "summary", [], embedding, "2024-01-01T00:00:00", "2024-01-01T00:01:00")
+
+    def per_row():
+        supabase.table("memories").insert({"summary": "summary"}).execute()
+        for highlight, vector in highlights:
+            supabase.table("highlights").insert(
+                {"embedding": vector, "context": highlight, "date": session[5]}
+            ).execute()
+
+    def bulk():
+        store(*session, highlights)
+
+    for name, fn in (("per-row", per_row), ("bulk", bulk)):
+        fn()  # warm up the connection
+        _PostgRESTStandIn.requests = 0
+        t0 = time.perf_counter()
+        for _ in range(args.rounds):
+            fn()
+        elapsed = (time.perf_counter() - t0) / args.rounds
+        print(
+            f"  {name:<8} {elapsed * 1000:8.1f} ms/session  "
+            f"{_PostgRESTStandIn.requests / args.rounds:.0f} requests/session"
+        )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark: wake-word idle cost.
+
+Always measures the per-frame cost of getting a captured frame into
+Porcupine: decoding it (struct.unpack_from into a tuple, or a memoryview
+cast) plus the ctypes array Porcupine.process() builds from whatever it's
+given, `(c_short * len(pcm))(*pcm)`. That conversion dominates, so the two
+decodes end up close. With PORCUPINE_ACCESS_KEY set
+and a mic present, also compares re-arming the old way (create Porcupine +
+PyAudio + stream every cycle) with the persistent WakeWordEngine (open the
+stream only).
+
+Usage:
+    python -m tt.experimental.bench_wakeword
+    python -m tt.experimental.bench_wakeword --cycles 5
+"""
+
+import argparse
+import os
+import struct
+import time
+from ctypes import c_short
+
+FRAME_LENGTH = 512  # Porcupine's frame length at 16 kHz
+SAMPLE_RATE = 16000
+
+
+def _to_porcupine(pcm):
+    # What pvporcupine.Porcupine.process() does with its pcm argument
+    return (c_short * len(pcm))(*pcm)
+
+
+def _decode(frames: int) -> dict:
+    pcm = os.urandom(FRAME_LENGTH * 2)
+    fmt = "h" * FRAME_LENGTH
+    results = {}
+    for name, decode in (
+        ("struct", lambda: _to_porcupine(struct.unpack_from(fmt, pcm))),
+        ("memoryview", lambda: _to_porcupine(memoryview(pcm).cast("h"))),
+    ):
+        t0 = time.process_time()
+        for _ in range(frames):
+            decode()
+        results[name] = (time.process_time() - t0) / frames * 1e6
+    return results
+
+
+def _rearm(cycles: int) -> dict:
+    import pvporcupine
+    import pyaudio
+
+    from tt.config import PORCUPINE_ACCESS_KEY
+    from tt.ears.wakeword_start import KEYWORD_PATH, WakeWordEngine
+
+    def fresh():
+        porcupine = pvporcupine.create(access_key=PORCUPINE_ACCESS_KEY, keyword_paths=[KEYWORD_PATH])
+        paud = pyaudio.PyAudio()
+        stream = paud.open(
+            rate=porcupine.sample_rate,
+            channels=1,
+            format=pyaudio.paInt16,
+            input=True,
+            frames_per_buffer=porcupine.frame_length,
+        )
+        stream.read(porcupine.frame_length)
+        stream.close()
+        paud.terminate()
+        porcupine.delete()
+
+    engine = WakeWordEngine()
+
+    def persistent():
+        engine.stream = engine.paud.open(
+            rate=engine.sample_rate,
+            channels=1,
+            format=pyaudio.paInt16,
+            input=True,
+            frames_per_buffer=engine.frame_length,
+            stream_callback=engine._on_frame,
+        )
+        engine._frames.get()
+        engine.finish()
+
+    results = {}
+    for name, fn in (("fresh", fresh), ("persistent", persistent)):
+        t0 = time.perf_counter()
+        for _ in range(cycles):
+            fn()
+        results[name] = (time.perf_counter() - t0) / cycles * 1000
+    engine.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=50_000, help="Frames to decode")
+    parser.add_argument("--cycles", type=int, default=3, help="Re-arm cycles (needs a mic)")
+    args = parser.parse_args()
+
+    decode = _decode(args.frames)
+    frames_per_sec = SAMPLE_RATE / FRAME_LENGTH
+    print(f"Frame decode + Porcupine's ctypes copy ({FRAME_LENGTH} samples, {frames_per_sec:.2f} frames/s while idle)")
+    for name, us in decode.items():
+        print(f"  {name:<11} {us:7.2f} us/frame  {us * frames_per_sec / 1000:6.3f} ms CPU/s")
+
+    if not os.getenv("PORCUPINE_ACCESS_KEY"):
+        print("Re-arm: skipped (PORCUPINE_ACCESS_KEY not set)")
+        return
+    try:
+        rearm = _rearm(args.cycles)
+    except Exception as e:
+        print(f"Re-arm: skipped ({e})")
+        return
+    print("Re-arm (until the first frame is captured)")
+    for name, ms in rearm.items():
+        print(f"  {name:<11} {ms:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
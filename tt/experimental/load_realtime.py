@@ -0,0 +1,204 @@
+"""
+Load-test N concurrent realtime conversations against the local stand-in.
+
+Starts tt/experimental/realtime_standin.py in a subprocess (so its CPU isn't
+counted), connects N RealtimeConversations (or AsyncRealtimeConversations
+with --runtime asyncio, all on one shared loop, as the gateway runs them,
+with --runtime shared) to it over real websockets, with FakeAudioIO in
+place of the sound card and one feeder thread streaming silent mic frames
+to every session in realtime. The stand-in turns every `utterance_ms` of
+audio into a user turn, some of them tool calls, so the full event path
+runs: fast-path audio deltas, transcripts, tool dispatch and output.
+
+Reports turn latency (ms after speech stopped, per session and overall)
+and CPU: process CPU time per session and as a share of one core.
+
+Usage:
+    python -m tt.experimental.load_realtime --sessions 20 --seconds 30
+    python -m tt.experimental.load_realtime --sessions 100 --runtime asyncio --tool-every 2
+    python -m tt.experimental.load_realtime --sessions 300 --runtime shared
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import fields
+
+from tt.brain.prefrontal_cortex.openai_realtime import CHUNK_SIZE, RATE, RealtimeConversation
+from tt.experimental.realtime_standin import StandinTimings
+from tt.utils.event_trace import FakeAudioIO
+from tt.utils.turn_tracer import TurnLatencySink, TurnTracer
+
+REPORTED = ("transcript_completed", "first_audio_delta", "response_done", "tool")
+
+
+class _SessionSink(TurnLatencySink):
+    """Per-session percentiles that also feed the overall sink."""
+
+    def __init__(self, overall: TurnLatencySink):
+        super().__init__(None, window=overall.window)
+        self.overall = overall
+
+    def record(self, span: dict):
+        super().record(span)
+        self.overall.record(span)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_standin(port: int, timings: StandinTimings) -> subprocess.Popen:
+    """Run the stand-in server in a subprocess; returns once it's listening."""
+    cmd = [sys.executable, "-m", "tt.experimental.realtime_standin", "--port", str(port)]
+    for field in fields(StandinTimings):
+        cmd += [f"--{field.name.replace('_', '-')}", str(getattr(timings, field.name))]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    line = proc.stdout.readline()
+    if "listening" not in line:
+        proc.kill()
+        raise RuntimeError(f"Stand-in server didn't start: {line!r}")
+    return proc
+
+
+def _feed_mic(convs: list, stop: threading.Event):
+    """Put one silent mic frame per session every CHUNK_SIZE samples, in realtime."""
+    frame = bytes(CHUNK_SIZE * 2)
+    period = CHUNK_SIZE / RATE
+    next_at = time.monotonic()
+    while not stop.is_set():
+        for conv in convs:
+            conv.audio.mic_queue.put(frame)
+        next_at += period
+        delay = next_at - time.monotonic()
+        if delay > 0:
+            stop.wait(delay)
+
+
+def run_load(
+    sessions: int,
+    seconds: float,
+    runtime: str = "thread",
+    timings: StandinTimings = StandinTimings(),
+    verbose: bool = False,
+) -> dict:
+    loop = None
+    if runtime in ("asyncio", "shared"):
+        from tt.brain.prefrontal_cortex.openai_realtime_async import AsyncRealtimeConversation as conv_cls
+    else:
+        conv_cls = RealtimeConversation
+    if runtime == "shared":
+        loop = asyncio.new_event_loop()
+        threading.Thread(target=loop.run_forever, name="load-loop", daemon=True).start()
+    options = {"loop": loop} if loop else {}
+
+    port = _free_port()
+    server = start_standin(port, timings)
+    overall = TurnLatencySink(None)
+    convs, sinks = [], []
+    stop = threading.Event()
+    # The conversations print every transcript and tool call; keep the report readable
+    quiet = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+    try:
+        with quiet:
+            connect_start = time.monotonic()
+            for i in range(sessions):
+                conv = conv_cls(
+                    "standin", audio=FakeAudioIO(rate=RATE), ws_url=f"ws://127.0.0.1:{port}", memory=False, **options
+                )
+                sink = _SessionSink(overall)
+                conv.tracer = TurnTracer(sink, session=f"load-{i}")
+                conv.connect()
+                convs.append(conv)
+                sinks.append(sink)
+            for conv in convs:
+                if not conv.session_ready.wait(10):
+                    raise RuntimeError("A session never got session.updated from the stand-in")
+            connect_s = time.monotonic() - connect_start
+
+            cpu_start, wall_start = time.process_time(), time.monotonic()
+            for conv in convs:
+                conv.activate()
+            feeder = threading.Thread(target=_feed_mic, args=(convs, stop), name="load-mic", daemon=True)
+            feeder.start()
+            time.sleep(seconds)
+            stop.set()
+            feeder.join()
+            for conv in convs:
+                conv.tracer.end_turn()
+            cpu = time.process_time() - cpu_start
+            wall = time.monotonic() - wall_start
+            alive = sum(conv.is_alive() for conv in convs)
+    finally:
+        stop.set()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for conv in convs:
+                conv.discard()
+            for conv in convs:
+                conv.sock.done_event.wait(2)
+            server.terminate()
+            server.wait()
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+
+    return {
+        "sessions": sessions,
+        "runtime": runtime,
+        "connect_seconds": connect_s,
+        "seconds": wall,
+        "cpu_seconds": cpu,
+        "cpu_per_session": cpu / sessions,
+        "core_share_per_session": cpu / wall / sessions,
+        "alive": alive,
+        "audio_bytes": [conv.audio.played_bytes for conv in convs],
+        "per_session": [sink.summary() for sink in sinks],
+        "turns": overall.turns,
+        "overall": overall.format_summary(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sessions", type=int, default=10, help="Concurrent conversations")
+    parser.add_argument("--seconds", type=float, default=20.0, help="How long to stream")
+    parser.add_argument("--runtime", choices=["thread", "asyncio", "shared"], default="thread")
+    parser.add_argument("--verbose", action="store_true", help="Keep the conversations' own output")
+    for field in fields(StandinTimings):
+        parser.add_argument(f"--{field.name.replace('_', '-')}", type=field.type, default=field.default,
+                            help="Stand-in timing (see realtime_standin.py)")
+    args = parser.parse_args()
+    timings = StandinTimings(**{field.name: getattr(args, field.name) for field in fields(StandinTimings)})
+
+    stats = run_load(args.sessions, args.seconds, args.runtime, timings, args.verbose)
+
+    print(f"{stats['sessions']} sessions ({stats['runtime']} runtime), connected in "
+          f"{stats['connect_seconds']:.2f}s, streamed {stats['seconds']:.1f}s, {stats['alive']} still alive")
+    print(f"  CPU: {stats['cpu_seconds']:.2f}s total on {os.cpu_count()} cores, "
+          f"{stats['cpu_per_session'] * 1000:.0f} ms per session, "
+          f"{stats['core_share_per_session'] * 100:.2f}% of a core per session")
+    print(f"  turns: {stats['turns']}, audio played per session: "
+          f"{min(stats['audio_bytes'])}-{max(stats['audio_bytes'])} bytes")
+    print("  turn latency, all sessions (ms after speech stopped):")
+    print(stats["overall"])
+    print("  per session (p50 / p95 ms):")
+    print(f"    {'session':<8} " + " ".join(f"{name:>24}" for name in REPORTED))
+    for i, summary in enumerate(stats["per_session"]):
+        cells = [
+            f"{summary[name]['p50']:>9.0f} / {summary[name]['p95']:<5.0f} (n={summary[name]['count']:<3})"
+            if name in summary else f"{'-':>24}"
+            for name in REPORTED
+        ]
+        print(f"    load-{i:<3} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
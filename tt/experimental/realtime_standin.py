@@ -0,0 +1,215 @@
+"""
+Local stand-in for the OpenAI Realtime API, for load tests.
+
+Speaks the subset of the Realtime protocol RealtimeSocket and the handlers in
+tt/brain/handlers use, with synthetic timings instead of a model:
+
+- session.created on connect, session.updated after session.update
+- every `utterance_ms` of input_audio_buffer.append audio is one user turn:
+  speech_started, speech_stopped, then the input transcription after
+  `transcript_ms`
+- every `tool_every`-th turn the response is a get_weather call (arguments
+  streamed as function_call_arguments deltas, then response.done) and the
+  spoken answer follows the client's response.create
+- a spoken response starts `first_audio_ms` after speech stopped and streams
+  transcript deltas and `response_ms` of silent audio in `delta_ms` chunks,
+  `audio_speed` times faster than realtime, then the done events
+
+Frames are sent as compact JSON, like the API, so the audio delta fast path
+applies. Run on its own to point a conversation at it by hand:
+
+    python -m tt.experimental.realtime_standin --port 8765
+    # RealtimeConversation(key, ws_url="ws://127.0.0.1:8765")
+
+or let tt/experimental/load_realtime.py start it.
+"""
+
+import argparse
+import asyncio
+import base64
+import itertools
+import json
+from dataclasses import dataclass, fields
+
+from websockets.asyncio.server import serve
+from websockets.exceptions import ConnectionClosed
+
+RATE = 24000
+SAMPLE_WIDTH = 2
+TRANSCRIPT = "Sure. The weather in Oslo is sunny and twenty two degrees today."
+TOOL_ARGS = '{"city":"Oslo"}'
+
+
+@dataclass(frozen=True)
+class StandinTimings:
+    utterance_ms: int = 1500  # input audio that makes up one user turn
+    transcript_ms: int = 150  # speech stopped -> input transcription
+    first_audio_ms: int = 300  # speech stopped (or response.create) -> first audio delta
+    tool_args_ms: int = 100  # speech stopped -> function call arguments done
+    response_ms: int = 2000  # audio per spoken response
+    delta_ms: int = 100  # audio per response.audio.delta
+    audio_speed: float = 4.0  # how much faster than realtime audio is streamed
+    tool_every: int = 3  # every Nth turn calls a tool (0 = never)
+
+
+def _dump(obj: dict) -> str:
+    return json.dumps(obj, separators=(",", ":"))
+
+
+class StandinSession:
+    """One client connection: counts uplink audio and plays scripted turns."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, ws, timings: StandinTimings):
+        self.ws = ws
+        self.timings = timings
+        self.id = f"sess_standin_{next(self._ids)}"
+        self._n = itertools.count(1)
+        self.turns = 0
+        self.heard_ms = 0.0  # input audio since the last turn
+        self.responding = False  # input audio is ignored while the "model" talks
+        self.pending_tool = None  # response id waiting on a function_call_output
+        self._tasks = set()
+        chunk = bytes(RATE * SAMPLE_WIDTH * timings.delta_ms // 1000)
+        self._silence = base64.b64encode(chunk).decode("ascii")
+
+    def _id(self, prefix: str) -> str:
+        return f"{prefix}_{next(self._n)}"
+
+    async def send(self, obj: dict):
+        await self.ws.send(_dump(obj))
+
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def run(self):
+        await self.send({"type": "session.created", "session": {"id": self.id, "object": "realtime.session"}})
+        try:
+            async for raw in self.ws:
+                await self.on_message(json.loads(raw))
+        except ConnectionClosed:
+            pass
+        finally:
+            for task in list(self._tasks):
+                task.cancel()
+
+    async def on_message(self, msg: dict):
+        typ = msg.get("type")
+        if typ == "session.update":
+            await self.send({"type": "session.updated", "session": {"id": self.id, **(msg.get("session") or {})}})
+        elif typ == "input_audio_buffer.append":
+            if self.responding:
+                return
+            # base64 length -> decoded bytes -> ms, without decoding
+            audio = msg.get("audio", "")
+            size = len(audio) * 3 // 4 - audio[-2:].count("=")
+            self.heard_ms += size / SAMPLE_WIDTH / RATE * 1000
+            if self.heard_ms >= self.timings.utterance_ms:
+                self.heard_ms = 0.0
+                self.responding = True
+                self._spawn(self.user_turn())
+        elif typ == "response.create" and self.pending_tool:
+            self.pending_tool = None
+            self._spawn(self.spoken_response(self.timings.first_audio_ms))
+
+    async def user_turn(self):
+        t = self.timings
+        self.turns += 1
+        item_id = self._id("item")
+        await self.send({"type": "input_audio_buffer.speech_started", "item_id": item_id, "audio_start_ms": 0})
+        await self.send({"type": "input_audio_buffer.speech_stopped", "item_id": item_id, "audio_end_ms": t.utterance_ms})
+        self._spawn(self.transcription(item_id))
+        if t.tool_every and self.turns % t.tool_every == 0:
+            await self.tool_response()
+        else:
+            await self.spoken_response(t.first_audio_ms)
+
+    async def transcription(self, item_id: str):
+        await asyncio.sleep(self.timings.transcript_ms / 1000)
+        await self.send({
+            "type": "conversation.item.input_audio_transcription.completed",
+            "item_id": item_id,
+            "content_index": 0,
+            "transcript": f"What's the weather like in Oslo? (turn {self.turns})",
+        })
+
+    async def tool_response(self):
+        response_id, item_id, call_id = self._id("resp"), self._id("item"), self._id("call")
+        step = self.timings.tool_args_ms / 1000 / 3
+        await asyncio.sleep(step)
+        await self.send({"type": "response.created", "response": {"id": response_id, "status": "in_progress"}})
+        for part in (TOOL_ARGS[:8], TOOL_ARGS[8:]):
+            await asyncio.sleep(step)
+            await self.send({
+                "type": "response.function_call_arguments.delta",
+                "response_id": response_id, "item_id": item_id, "output_index": 0,
+                "call_id": call_id, "delta": part,
+            })
+        common = {"response_id": response_id, "item_id": item_id, "output_index": 0, "call_id": call_id}
+        await self.send({
+            "type": "response.function_call_arguments.done", **common,
+            "name": "get_weather", "arguments": TOOL_ARGS,
+        })
+        self.pending_tool = response_id
+        await self.send({"type": "response.done", "response": {"id": response_id, "status": "completed"}})
+
+    async def spoken_response(self, delay_ms: int):
+        t = self.timings
+        response_id, item_id = self._id("resp"), self._id("item")
+        ids = {"response_id": response_id, "item_id": item_id, "output_index": 0, "content_index": 0}
+        await asyncio.sleep(delay_ms / 1000)
+        await self.send({"type": "response.created", "response": {"id": response_id, "status": "in_progress"}})
+
+        chunks = max(1, t.response_ms // t.delta_ms)
+        words = TRANSCRIPT.split(" ")
+        per_chunk = -(-len(words) // chunks)
+        interval = t.delta_ms / 1000 / t.audio_speed
+        for i in range(chunks):
+            text = " ".join(words[i * per_chunk:(i + 1) * per_chunk])
+            if text:
+                await self.send({"type": "response.audio_transcript.delta", **ids, "delta": text + " "})
+            # Same key order as the API: the fast path matches on the prefix
+            await self.ws.send(
+                '{"type":"response.audio.delta","response_id":"%s","item_id":"%s",'
+                '"output_index":0,"content_index":0,"delta":"%s"}' % (response_id, item_id, self._silence)
+            )
+            await asyncio.sleep(interval)
+
+        await self.send({"type": "response.audio.done", **ids})
+        await self.send({"type": "response.audio_transcript.done", **ids, "transcript": TRANSCRIPT})
+        await self.send({"type": "response.done", "response": {"id": response_id, "status": "completed"}})
+        self.responding = False
+
+
+async def serve_standin(host: str = "127.0.0.1", port: int = 8765, timings: StandinTimings = StandinTimings(), ready=None):
+    """Serve until cancelled; `ready` (an asyncio.Event) is set once listening."""
+
+    async def handler(ws):
+        await StandinSession(ws, timings).run()
+
+    async with serve(handler, host, port, max_size=None, compression=None):
+        print(f"[standin] Realtime stand-in listening on ws://{host}:{port}", flush=True)
+        if ready is not None:
+            ready.set()
+        await asyncio.Future()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    for field in fields(StandinTimings):
+        parser.add_argument(f"--{field.name.replace('_', '-')}", type=field.type, default=field.default)
+    args = parser.parse_args()
+    timings = StandinTimings(**{field.name: getattr(args, field.name) for field in fields(StandinTimings)})
+    try:
+        asyncio.run(serve_standin(args.host, args.port, timings))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Replay a recorded realtime event trace through RealtimeConversation.
+
+Feeds every frame of a trace (recorded with EVENT_TRACE_DIR, see
+tt/utils/event_trace.py) through the same path the socket uses
+(_on_raw, then _on_msg), against FakeSocket + FakeAudioIO, so handler
+throughput, allocations and tool-dispatch latency can be measured without
+the OpenAI API or a sound card. Replays stay offline and deterministic:
+memory prefetch is off and tools that would call out (get_memories) return
+canned results; --live-tools runs them for real. Use --realtime to keep the
+recorded timing (e.g. to reproduce a race seen in production).
+
+Usage:
+    python -m tt.experimental.replay_events conversation_logs/traces/<trace>.jsonl.gz
+    python -m tt.experimental.replay_events <trace> --realtime --speed 2
+    python -m tt.experimental.replay_events <trace> --allocations --profile
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from contextlib import ExitStack
+
+from tt.brain.handlers.tools_plug import override_tool
+from tt.brain.prefrontal_cortex.openai_realtime import RATE, RealtimeConversation
+from tt.utils.event_trace import FakeAudioIO, FakeSocket, read_events
+from tt.utils.turn_tracer import TurnLatencySink, TurnTracer
+
+# Results for tools that would otherwise hit the network during a replay
+OFFLINE_TOOL_RESULTS = {
+    "get_memories": {"memories": []},
+}
+
+
+def _offline_tools() -> ExitStack:
+    stack = ExitStack()
+    for name, result in OFFLINE_TOOL_RESULTS.items():
+        stack.enter_context(override_tool(name, lambda _result=result, **_: _result))
+    return stack
+
+
+def replay(
+    path, realtime: bool = False, speed: float = 1.0, tool_wait: float = 10.0, live_tools: bool = False
+) -> dict:
+    """Replay one trace; returns throughput and tool-dispatch stats."""
+    with ExitStack() if live_tools else _offline_tools():
+        return _replay(path, realtime, speed, tool_wait)
+
+
+def _replay(path, realtime: bool, speed: float, tool_wait: float) -> dict:
+    sock, audio = FakeSocket(), FakeAudioIO(rate=RATE)
+    # No memory prefetch and nothing memorized: replays never touch Supabase/OpenAI
+    conv = RealtimeConversation("replay", audio=audio, sock=sock, memory=False)
+    # Keep replayed turns out of the production latency log
+    sink = TurnLatencySink(None)
+    conv.tracer = TurnTracer(sink, session="replay")
+
+    calls = {}  # call_id -> monotonic time its arguments.done was fed
+    requested = {}  # call_id -> (tool name, arguments string)
+    events = 0
+    start, cpu_start = time.monotonic(), time.process_time()
+    for t, raw in read_events(path):
+        if realtime:
+            delay = start + t / speed - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        events += 1
+        if conv._on_raw(raw):
+            continue
+        msg = json.loads(raw)
+        if msg.get("type") == "response.function_call_arguments.done":
+            calls[msg["call_id"]] = time.monotonic()
+            requested[msg["call_id"]] = (msg.get("name"), msg.get("arguments"))
+        conv._on_msg(msg)
+    fed = time.monotonic() - start
+    cpu = time.process_time() - cpu_start
+
+    # Tool calls run off the "receive" thread; wait for their outputs
+    deadline = time.monotonic() + tool_wait
+    outputs = {}  # call_id -> (monotonic time sent, output)
+    while True:
+        with sock.lock:
+            sent = list(sock.sent)
+        for sent_at, obj in sent:
+            item = obj.get("item") or {}
+            if item.get("type") == "function_call_output" and item.get("call_id") in calls:
+                outputs.setdefault(item["call_id"], (sent_at, json.loads(item["output"])))
+        # Done once every call has answered and its response.create is out
+        settled = len(outputs) == len(calls) and not conv.tool_batches.busy()
+        if settled or time.monotonic() > deadline:
+            break
+        time.sleep(0.01)
+
+    conv.tracer.end_turn()
+    conv.discard()
+    return {
+        "events": events,
+        "seconds": fed,
+        "cpu_seconds": cpu,
+        "events_per_sec": events / fed if fed else 0.0,
+        "audio_bytes": audio.played_bytes,
+        "messages_sent": len(sock.sent),
+        "tool_calls": len(calls),
+        "tool_outputs": len(outputs),
+        "tool_latency_ms": sorted((outputs[c][0] - calls[c]) * 1000 for c in outputs),
+        # In the order the calls were fed: what was asked and what went back
+        "tool_results": [
+            {
+                "call_id": call_id,
+                "name": requested[call_id][0],
+                "arguments": requested[call_id][1],
+                "output": outputs[call_id][1] if call_id in outputs else None,
+            }
+            for call_id in calls
+        ],
+        "turns": sink.format_summary(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("trace", help="Trace file (.jsonl.gz)")
+    parser.add_argument("--realtime", action="store_true", help="Keep the recorded timing")
+    parser.add_argument("--speed", type=float, default=1.0, help="Speed-up factor with --realtime")
+    parser.add_argument("--allocations", action="store_true", help="Track allocations with tracemalloc")
+    parser.add_argument("--profile", action="store_true", help="Print per-event-type dispatch timings")
+    parser.add_argument("--live-tools", action="store_true", help="Run network tools (get_memories) for real")
+    args = parser.parse_args()
+
+    if args.profile:
+        from tt.brain.handlers import enable_profiling
+
+        profiler = enable_profiling(dump_on_exit=False)
+    if args.allocations:
+        tracemalloc.start()
+
+    stats = replay(args.trace, realtime=args.realtime, speed=args.speed, live_tools=args.live_tools)
+
+    print(f"Replayed {stats['events']} events in {stats['seconds']:.3f}s "
+          f"({stats['events_per_sec']:.0f} events/s, {stats['cpu_seconds']:.3f}s CPU)")
+    print(f"  audio played: {stats['audio_bytes']} bytes, messages sent: {stats['messages_sent']}")
+    latencies = stats["tool_latency_ms"]
+    print(f"  tool calls: {stats['tool_calls']}, outputs: {stats['tool_outputs']}")
+    if latencies:
+        print(f"  tool dispatch -> output: min {latencies[0]:.1f} ms, "
+              f"median {latencies[len(latencies) // 2]:.1f} ms, max {latencies[-1]:.1f} ms")
+    if stats["turns"]:
+        print("  turn latency (replay clock):")
+        print(stats["turns"])
+
+    if args.allocations:
+        _, peak = tracemalloc.get_traced_memory()
+        top = tracemalloc.take_snapshot().statistics("lineno")[:10]
+        tracemalloc.stop()
+        print(f"  allocations: peak {peak / 1024:.0f} KiB; largest live sites:")
+        for stat in top:
+            print(f"    {stat}")
+    if args.profile:
+        print(profiler.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Gateway: many devices, one process.
+
+Each device connects over a websocket and streams its mic in; the gateway
+gives it its own Realtime conversation and streams the model's audio back.
+Per device, isolated: the conversation state (StateManager), the
+conversation log, the memory namespace memories are stored and recalled
+under, and the ToolContext its tool calls run with (see tools_plug).
+Shared by every device: one asyncio loop running all conversations and
+device sockets, a bounded worker pool for blocking work (tool call
+handling, teardown), the tool pool, the pooled OpenAI/Supabase clients and
+the background memorize worker.
+
+Device protocol (ws://<device_id>:<token>@<host>:<port>/):
+
+    handshake           HTTP Basic auth with the device's id and token
+                        (GATEWAY_DEVICE_TOKENS); anything else gets a 401
+    device -> gateway   binary: mic audio, 16-bit mono PCM at 24 kHz, any frame size
+    gateway -> device   binary: model audio, same format, to play in order
+                        text:   {"type": "state", "state": "ACTIVE" | "WINDING_DOWN" | "IDLE"}
+
+A conversation lasts as long as the device's connection (or until the
+Realtime session ends, which closes it). A device reconnecting replaces its
+old session. The device id comes from the credentials, never the URL, so a
+device can only ever reach its own memories and sessions.
+
+Usage:
+    GATEWAY_DEVICE_TOKENS="kitchen:<token>,bedroom:<token>" python -m tt.gateway
+    python -m tt.gateway --port 8780 --max-sessions 300 --workers 16
+"""
+
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from websockets.asyncio.server import basic_auth, serve
+from websockets.exceptions import ConnectionClosed
+
+from tt.brain.handlers.tools_plug import ToolContext
+from tt.brain.prefrontal_cortex.openai_realtime_async import AsyncRealtimeConversation
+from tt.config import (
+    GATEWAY_DEVICE_TOKENS,
+    GATEWAY_HOST,
+    GATEWAY_MAX_SESSIONS,
+    GATEWAY_PORT,
+    GATEWAY_WORKERS,
+    OPENAI_API_KEY,
+)
+from tt.state_manager import State, StateManager
+from tt.utils.audio_interface_device import DeviceAudioIO
+
+# Close codes sent to devices
+CLOSE_REPLACED = 4409
+CLOSE_FULL = 1013  # "try again later"
+
+
+def parse_device_tokens(spec: str) -> dict[str, str]:
+    """"kitchen:tok1,bedroom:tok2" -> {"kitchen": "tok1", "bedroom": "tok2"}."""
+    tokens = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        device_id, sep, token = entry.partition(":")
+        if not sep or not device_id or not token:
+            raise ValueError(f"Expected device_id:token, got {entry!r}")
+        tokens[device_id] = token
+    return tokens
+
+
+class DeviceSession:
+    """One connected device and its conversation."""
+
+    def __init__(self, device_id: str, ws, conv, audio: DeviceAudioIO, state_mgr: StateManager):
+        self.device_id = device_id
+        self.ws = ws
+        self.conv = conv
+        self.audio = audio
+        self.state_mgr = state_mgr
+
+
+class Gateway:
+    def __init__(
+        self,
+        api_key: str = OPENAI_API_KEY,
+        device_tokens: dict[str, str] | None = None,
+        max_sessions: int = GATEWAY_MAX_SESSIONS,
+        workers: int = GATEWAY_WORKERS,
+        ws_url: str | None = None,
+        memory: bool = True,
+    ):
+        self.api_key = api_key
+        # device id -> token; the only devices let in
+        self.device_tokens = (
+            parse_device_tokens(GATEWAY_DEVICE_TOKENS) if device_tokens is None else device_tokens
+        )
+        self.max_sessions = max_sessions
+        self.workers = workers
+        self.ws_url = ws_url  # Realtime endpoint override (e.g. the local stand-in)
+        self.memory = memory
+        self.sessions: dict[str, DeviceSession] = {}
+        self.loop = None
+
+        # Counters
+        self.accepted = 0
+        self.rejected = 0
+
+    async def serve(self, host: str = GATEWAY_HOST, port: int = GATEWAY_PORT, ready=None):
+        """Serve devices until cancelled; `ready` (an asyncio.Event) is set once listening."""
+        if not self.device_tokens:
+            raise RuntimeError("No devices allowed in: set GATEWAY_DEVICE_TOKENS")
+        self.loop = asyncio.get_running_loop()
+        # Every session's blocking work (tool call handling, conversation
+        # teardown) shares this one bounded pool
+        self.loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="tt-gateway")
+        )
+        auth = basic_auth(realm="tt-gateway", credentials=list(self.device_tokens.items()))
+        async with serve(
+            self._serve_device, host, port, process_request=auth, max_size=None, compression=None
+        ):
+            print(f"[gateway] Listening on ws://{host}:{port} (max {self.max_sessions} sessions)")
+            if ready is not None:
+                ready.set()
+            try:
+                await asyncio.Future()
+            finally:
+                for session in list(self.sessions.values()):
+                    await session.ws.close(1001, "gateway shutting down")
+
+    async def _serve_device(self, ws):
+        # Set by basic_auth once the handshake's credentials checked out
+        device_id = ws.username
+        previous = self.sessions.get(device_id)
+        if previous is not None:
+            await previous.ws.close(CLOSE_REPLACED, "replaced by a new connection")
+        elif len(self.sessions) >= self.max_sessions:
+            self.rejected += 1
+            await ws.close(CLOSE_FULL, "gateway full")
+            return
+
+        session = self._new_session(device_id, ws)
+        self.sessions[device_id] = session
+        self.accepted += 1
+        print(f"[gateway] {device_id} connected ({len(self.sessions)} sessions)")
+        try:
+            await self._run(session)
+        finally:
+            if self.sessions.get(device_id) is session:
+                del self.sessions[device_id]
+            print(f"[gateway] {device_id} disconnected ({len(self.sessions)} sessions)")
+
+    def _new_session(self, device_id: str, ws) -> DeviceSession:
+        state_mgr = StateManager()
+        audio = DeviceAudioIO(ws, self.loop)
+        # The device's firmware follows its state (servos, sensors...)
+        state_mgr.on_change(lambda old, new: audio.send_control({"type": "state", "state": new.value}))
+        conv = AsyncRealtimeConversation(
+            self.api_key,
+            state_mgr,
+            audio=audio,
+            ws_url=self.ws_url,
+            memory=self.memory,
+            tool_context=ToolContext(device_id=device_id, namespace=device_id),
+            loop=self.loop,
+        )
+        return DeviceSession(device_id, ws, conv, audio, state_mgr)
+
+    async def _run(self, session: DeviceSession):
+        conv = session.conv
+        activated = False
+        try:
+            await conv.aconnect()
+            session.state_mgr.transition(State.ACTIVE)
+            await conv.aactivate()
+            activated = True
+            pump = asyncio.create_task(self._pump_mic(session))
+            upstream = asyncio.create_task(conv.sock.wait_closed())
+            await asyncio.wait({pump, upstream}, return_when=asyncio.FIRST_COMPLETED)
+            for task in (pump, upstream):
+                task.cancel()
+        except Exception as e:
+            print(f"[gateway] {session.device_id} session error: {e}")
+        finally:
+            # Teardown blocks (socket close waits on this loop, the log is
+            # spooled to disk), so it runs on the worker pool
+            await self.loop.run_in_executor(None, conv.stop if activated else conv.discard)
+            session.state_mgr.transition(State.IDLE)
+            await session.audio.aclose()
+            await session.ws.close()
+
+    async def _pump_mic(self, session: DeviceSession):
+        try:
+            async for frame in session.ws:
+                if isinstance(frame, bytes):
+                    session.audio.feed_mic(frame)
+        except ConnectionClosed:
+            pass
+
+    def stats(self) -> dict:
+        return {
+            "sessions": len(self.sessions),
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "devices": {
+                device_id: {"state": s.state_mgr.state.value, "audio": s.audio.stats()}
+                for device_id, s in self.sessions.items()
+            },
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default=GATEWAY_HOST)
+    parser.add_argument("--port", type=int, default=GATEWAY_PORT)
+    parser.add_argument("--max-sessions", type=int, default=GATEWAY_MAX_SESSIONS)
+    parser.add_argument("--workers", type=int, default=GATEWAY_WORKERS, help="Shared blocking-work threads")
+    parser.add_argument("--ws-url", default=None, help="Realtime endpoint (default: OpenAI)")
+    args = parser.parse_args()
+
+    # Memorize sessions spooled while offline, and load highlight embeddings
+    # before the first device asks for memories
+    from tt.brain.hippocampus.spool import get_worker
+    get_worker()
+
+    from tt.config import HIPPOCAMPUS_LOCAL_INDEX
+    if HIPPOCAMPUS_LOCAL_INDEX:
+        from tt.brain.hippocampus.local_index import preload
+        preload()
+
+    gateway = Gateway(max_sessions=args.max_sessions, workers=args.workers, ws_url=args.ws_url)
+    try:
+        asyncio.run(gateway.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n[gateway] Shutting down.")
+
+
+if __name__ == "__main__":
+    main()
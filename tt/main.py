@@ -6,46 +6,91 @@ Cycles through:  IDLE (wake word) → ACTIVE (conversation) → WINDING_DOWN →
 Usage:
     python -m tt.main                    # default: elevenlabs backend
     python -m tt.main --backend openai   # use OpenAI Realtime API
+    python -m tt.main --backend openai --runtime asyncio   # single event loop runtime
+    python -m tt.main --backend openai --profile-dispatch  # per-event handler timings on exit
+
+This loop drives one local device. To host many devices that stream audio
+in over the network, run the gateway instead: python -m tt.gateway
 """
 
 import argparse
 import sys
+import time
 
 from tt.state_manager import State, StateManager
 
 
-def run(backend: str = "elevenlabs"):
+def run(backend: str = "elevenlabs", runtime: str = "threaded", profile_dispatch: bool = False):
     state_mgr = StateManager()
+    warm_pool = None
 
     # Lazy imports so we only load the backend we need
     if backend == "openai":
-        from tt.brain.prefrontal_cortex.openai_realtime import RealtimeConversation
-        from tt.config import OPENAI_API_KEY
+        if runtime == "asyncio":
+            from tt.brain.prefrontal_cortex.openai_realtime_async import (
+                AsyncRealtimeConversation as RealtimeConversation,
+            )
+        else:
+            from tt.brain.prefrontal_cortex.openai_realtime import RealtimeConversation
+        from tt.config import OPENAI_API_KEY, REALTIME_WARM_SESSION
+        from tt.brain.prefrontal_cortex.warm_session import WarmSessionPool
+
+        def new_conversation():
+            return RealtimeConversation(OPENAI_API_KEY, state_mgr)
+
+        warm_pool = WarmSessionPool(new_conversation) if REALTIME_WARM_SESSION else None
+
+        # Only this backend's ConversationLog spools sessions. Memorization
+        # runs in the background; start it now so any sessions spooled while
+        # offline get stored
+        from tt.brain.hippocampus.spool import get_worker
+        get_worker()
     elif backend == "elevenlabs":
         from tt.brain.prefrontal_cortex.elevenlabs_realtime import play_audio
     else:
         print(f"Unknown backend: {backend}")
         sys.exit(1)
 
+    if profile_dispatch:
+        from tt.brain.handlers import enable_profiling
+        enable_profiling()  # Report printed on exit
+
+    from tt.config import HIPPOCAMPUS_LOCAL_INDEX
+    if HIPPOCAMPUS_LOCAL_INDEX:
+        from tt.brain.hippocampus.local_index import preload
+        preload()  # Load highlight embeddings while we wait for the wake word
+
+    # Porcupine + PyAudio stay loaded across cycles
+    from tt.ears.wakeword_start import get_engine
+    wake = get_engine()
+
     print(f"[main] TT starting with {backend} backend. Ctrl+C to quit.")
 
     try:
         while True:
             # ---- IDLE: listen for wake word ----
             state_mgr.transition(State.IDLE)
+            if warm_pool:
+                warm_pool.prepare()  # Connect + configure while we listen
 
-            from tt.ears.wakeword_start import wait_for_wakeword
-            wait_for_wakeword()
+            wake.wait()
+            woke_at = time.monotonic()
 
             # ---- ACTIVE: run conversation ----
             state_mgr.transition(State.ACTIVE)
 
             if backend == "openai":
-                conv = RealtimeConversation(OPENAI_API_KEY, state_mgr)
-                conv.start()
+                if warm_pool:
+                    conv = warm_pool.acquire()
+                else:
+                    conv = new_conversation()
+                    conv.connect()
+                # Hand over the mic, with what was said around the wake word
+                conv.activate(woke_at, preroll=wake.finish(), preroll_rate=wake.sample_rate)
                 conv.wait_until_done()
                 conv.stop()  # saves log, triggers WINDING_DOWN via state_mgr
             else:
+                wake.finish()  # Release the mic for the ElevenLabs session
                 play_audio(state_mgr)  # blocks until session ends, triggers WINDING_DOWN
 
             # ---- WINDING_DOWN → back to top of loop (IDLE) ----
@@ -54,6 +99,10 @@ def run(backend: str = "elevenlabs"):
     except KeyboardInterrupt:
         print("\n[main] Shutting down.")
         state_mgr.transition(State.IDLE)
+    finally:
+        if warm_pool:
+            warm_pool.close()
+        wake.close()
 
 
 def main():
@@ -64,8 +113,19 @@ def main():
         default="elevenlabs",
         help="Conversation backend to use (default: elevenlabs)",
     )
+    parser.add_argument(
+        "--runtime",
+        choices=["threaded", "asyncio"],
+        default="threaded",
+        help="OpenAI backend runtime: recv/mic/tool threads or one asyncio loop (default: threaded)",
+    )
+    parser.add_argument(
+        "--profile-dispatch",
+        action="store_true",
+        help="Record per-event-type handler timings and print a report on exit (also PROFILE_DISPATCH=1)",
+    )
     args = parser.parse_args()
-    run(backend=args.backend)
+    run(backend=args.backend, runtime=args.runtime, profile_dispatch=args.profile_dispatch)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,245 @@
+"""
+Real-time safe audio buffers shared between PortAudio callbacks and app threads.
+
+SpeakerRingBuffer: preallocated single-producer/single-consumer ring for TTS
+playback. The WebSocket thread writes, the PortAudio speaker callback reads.
+
+CaptureQueue: bounded, blocking queue of mic frames. The PortAudio mic
+callback puts, the sender thread blocks in get() until a frame lands.
+"""
+
+import collections
+import threading
+import time
+
+DROP_OLDEST = "drop_oldest"
+BLOCK = "block"
+
+
+class SpeakerRingBuffer:
+    """
+    Fixed-capacity SPSC byte ring.
+
+    Read/write positions are monotonic byte counters: the producer only ever
+    advances `_write_pos` and the consumer only ever advances `_read_pos`, each
+    *after* its copy is done, so no lock is needed between the two threads.
+    Reads hand out memoryviews into the ring, so the only copy on the playback
+    path is the one PortAudio needs to turn the chunk into `bytes`.
+    """
+
+    def __init__(self, capacity_bytes: int):
+        if capacity_bytes <= 0:
+            raise ValueError("capacity_bytes must be positive")
+        self.capacity = capacity_bytes
+        self._buf = bytearray(capacity_bytes)
+        self._view = memoryview(self._buf)
+        self._write_pos = 0
+        self._read_pos = 0
+
+        # Counters (plain ints; each is only written by one side)
+        self.underruns = 0        # reads that ran dry mid-stream (consumer)
+        self.underrun_bytes = 0   # silence padded in because of underruns
+        self.overruns = 0         # writes that didn't fully fit (producer)
+        self.overrun_bytes = 0    # bytes dropped because the ring was full
+
+    @classmethod
+    def for_duration(cls, seconds: float, rate: int, sample_width: int = 2, channels: int = 1):
+        """Build a ring sized to hold `seconds` of PCM audio."""
+        frame_bytes = sample_width * channels
+        return cls(max(frame_bytes, int(seconds * rate) * frame_bytes))
+
+    def __len__(self):
+        return self._write_pos - self._read_pos
+
+    # -----------------------------------------------------------------
+    # Producer side
+    # -----------------------------------------------------------------
+
+    def write(self, data) -> int:
+        """
+        Copy `data` into the ring. Returns the number of bytes accepted.
+        Anything that doesn't fit is dropped and counted as an overrun.
+        """
+        src = memoryview(data).cast("B")
+        size = len(src)
+        free = self.capacity - (self._write_pos - self._read_pos)
+        n = min(size, free)
+        if n < size:
+            self.overruns += 1
+            self.overrun_bytes += size - n
+        if n:
+            start = self._write_pos % self.capacity
+            first = min(n, self.capacity - start)
+            self._view[start:start + first] = src[:first]
+            if first < n:
+                self._view[:n - first] = src[first:n]
+            self._write_pos += n
+        return n
+
+    # -----------------------------------------------------------------
+    # Consumer side
+    # -----------------------------------------------------------------
+
+    def read_views(self, max_bytes: int) -> list[memoryview]:
+        """
+        Return up to `max_bytes` of buffered audio as one or two memoryviews
+        into the ring (two when the data wraps around), without consuming it.
+
+        The producer can't touch those bytes until the consumer calls
+        advance(), so copy them out first, then advance() by what was used.
+        """
+        n = min(max_bytes, self._write_pos - self._read_pos)
+        if n <= 0:
+            return []
+        start = self._read_pos % self.capacity
+        first = min(n, self.capacity - start)
+        views = [self._view[start:start + first]]
+        if first < n:
+            views.append(self._view[:n - first])
+        return views
+
+    def advance(self, n: int):
+        """Consume `n` bytes handed out by read_views() (after copying them)."""
+        self._read_pos += min(n, self._write_pos - self._read_pos)
+
+    def read(self, size: int, silence: bytes | None = None) -> tuple[bytes, int]:
+        """
+        Read exactly `size` bytes, padding with silence if the ring runs dry.
+        Returns (chunk, bytes_of_real_audio).
+
+        A partial read (some audio, but not enough) counts as an underrun;
+        an empty ring is just idle and is not counted.
+        """
+        views = self.read_views(size)
+        got = sum(len(v) for v in views)
+        if got < size:
+            pad = size - got
+            if got:
+                self.underruns += 1
+                self.underrun_bytes += pad
+            views.append(memoryview(silence)[:pad] if silence and len(silence) >= pad else b"\x00" * pad)
+        chunk = b"".join(views)
+        # Only now are the slots free for the producer
+        self.advance(got)
+        return chunk, got
+
+    def clear(self):
+        """Drop everything buffered (consumer side, e.g. on barge-in)."""
+        self._read_pos = self._write_pos
+
+    def stats(self) -> dict:
+        return {
+            "buffered_bytes": len(self),
+            "capacity_bytes": self.capacity,
+            "underruns": self.underruns,
+            "underrun_bytes": self.underrun_bytes,
+            "overruns": self.overruns,
+            "overrun_bytes": self.overrun_bytes,
+        }
+
+
+class CaptureQueue:
+    """
+    Bounded FIFO of captured mic frames with a configurable overflow policy.
+
+    - "drop_oldest": a full queue evicts its oldest frame so the newest audio
+      always gets through (never stalls the PortAudio callback).
+    - "block": the producer waits up to `block_timeout` seconds for room, then
+      drops the new frame rather than stalling the audio thread forever.
+    """
+
+    def __init__(self, maxsize: int = 64, overflow: str = DROP_OLDEST, block_timeout: float = 0.05):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if overflow not in (DROP_OLDEST, BLOCK):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self._frames = collections.deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._listeners: list[callable] = []
+
+        # Counters
+        self.put_frames = 0
+        self.dropped_frames = 0
+        self.max_depth = 0
+
+    def __len__(self):
+        return len(self._frames)
+
+    def on_put(self, callback):
+        """
+        Register callback() to run after every accepted frame.
+        Called on the PortAudio thread, so it must be cheap and non-blocking.
+        """
+        self._listeners.append(callback)
+
+    def put(self, frame) -> bool:
+        """Enqueue a frame. Returns False if the frame was dropped."""
+        with self._cond:
+            if self._closed:
+                return False
+            if len(self._frames) >= self.maxsize:
+                if self.overflow == DROP_OLDEST:
+                    self._frames.popleft()
+                    self.dropped_frames += 1
+                else:
+                    deadline = time.monotonic() + self.block_timeout
+                    while len(self._frames) >= self.maxsize and not self._closed:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self.dropped_frames += 1
+                            return False
+                        self._cond.wait(remaining)
+                    if self._closed:
+                        return False
+            self._frames.append(frame)
+            self.put_frames += 1
+            if len(self._frames) > self.max_depth:
+                self.max_depth = len(self._frames)
+            self._cond.notify_all()
+
+        for cb in self._listeners:
+            cb()
+        return True
+
+    def get(self, timeout: float | None = None):
+        """
+        Block until a frame is available and return it.
+        Returns None on timeout or once the queue is closed and drained.
+        """
+        with self._cond:
+            if not self._frames and not self._closed:
+                self._cond.wait_for(lambda: self._frames or self._closed, timeout)
+            if not self._frames:
+                return None
+            frame = self._frames.popleft()
+            self._cond.notify_all()
+            return frame
+
+    def get_nowait(self):
+        """Return the next frame, or None if the queue is empty."""
+        with self._cond:
+            if not self._frames:
+                return None
+            frame = self._frames.popleft()
+            self._cond.notify_all()
+            return frame
+
+    def close(self):
+        """Wake every waiter; further puts are rejected."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def stats(self) -> dict:
+        return {
+            "depth": len(self._frames),
+            "max_depth": self.max_depth,
+            "capacity": self.maxsize,
+            "put_frames": self.put_frames,
+            "dropped_frames": self.dropped_frames,
+            "overflow": self.overflow,
+        }
@@ -0,0 +1,118 @@
+"""
+Audio I/O for a remote device connected to the gateway (tt/gateway.py).
+
+Same surface as AudioIO, but the mic is the PCM the device streams in as
+binary websocket frames, and the speaker is the device itself: model audio
+goes back to it as binary frames. Control messages (e.g. state changes)
+share the same outbox, so the device sees everything in order. One sender
+task per device runs on the gateway's event loop.
+"""
+
+import asyncio
+import json
+
+from websockets.exceptions import ConnectionClosed
+
+from tt.utils.audio_buffers import DROP_OLDEST, CaptureQueue
+
+# Max mic frames waiting to be sent upstream before the oldest are dropped
+DEFAULT_MIC_QUEUE_FRAMES = 64
+
+
+class DeviceAudioIO:
+    """Bridges one device's websocket to a conversation's audio surface."""
+
+    def __init__(
+        self,
+        ws,
+        loop: asyncio.AbstractEventLoop,
+        rate: int = 24000,
+        sample_width: int = 2,
+        mic_queue_frames: int = DEFAULT_MIC_QUEUE_FRAMES,
+        mic_overflow: str = DROP_OLDEST,
+    ):
+        self.ws = ws
+        self.loop = loop
+        self.rate = rate
+        self.sample_width = sample_width
+        # Filled from the device's frames, drained by the conversation's mic pump
+        self.mic_queue = CaptureQueue(maxsize=mic_queue_frames, overflow=mic_overflow)
+        # Called whenever model audio is handed to the device
+        self.on_playback = None
+        self.ducking = False
+        self._outbox = asyncio.Queue()  # bytes (audio) or str (control JSON)
+        self._sender = None
+
+        # Counters
+        self.received_bytes = 0
+        self.sent_bytes = 0
+
+    def start(self):
+        """Start sending to the device. Call on the loop."""
+        if self._sender is None:
+            self._sender = self.loop.create_task(self._send_loop())
+
+    def stop(self):
+        # Sending carries on until aclose(): the device still gets the state
+        # changes that follow the end of the conversation
+        self.mic_queue.close()
+
+    async def aclose(self, timeout: float = 2.0):
+        """Flush what's queued for the device and stop sending. Call on the loop."""
+        if self._sender is None:
+            return
+        self._outbox.put_nowait(None)
+        try:
+            await asyncio.wait_for(self._sender, timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            pass
+
+    def feed_mic(self, frame: bytes):
+        """Mic audio from the device (16-bit mono PCM at `rate`)."""
+        self.received_bytes += len(frame)
+        self.mic_queue.put(frame)
+
+    def read_mic_chunk(self, timeout: float | None = None):
+        return self.mic_queue.get(timeout)
+
+    def push_tts(self, audio_bytes: bytes):
+        self._post(audio_bytes)
+
+    def send_control(self, obj: dict):
+        """Queue a JSON control message for the device; thread-safe."""
+        self._post(json.dumps(obj))
+
+    def _post(self, item):
+        try:
+            on_loop = asyncio.get_running_loop() is self.loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._outbox.put_nowait(item)
+            return
+        try:
+            self.loop.call_soon_threadsafe(self._outbox.put_nowait, item)
+        except RuntimeError:
+            pass  # Loop already closed during shutdown
+
+    async def _send_loop(self):
+        while True:
+            item = await self._outbox.get()
+            if item is None:
+                break
+            try:
+                await self.ws.send(item)
+            except ConnectionClosed:
+                break
+            if isinstance(item, bytes):
+                self.sent_bytes += len(item)
+                if self.on_playback is not None:
+                    self.on_playback()
+
+    def stats(self) -> dict:
+        return {
+            "mic": self.mic_queue.stats(),
+            "received_bytes": self.received_bytes,
+            "sent_bytes": self.sent_bytes,
+            "outbox": self._outbox.qsize(),
+        }
@@ -3,16 +3,43 @@ import threading
 
 import pyaudio
 
+from tt.utils.audio_buffers import DROP_OLDEST, CaptureQueue, SpeakerRingBuffer
+
+# How much model speech we can hold ahead of playback. TTS arrives much faster
+# than real time, so this needs to cover a whole long response.
+DEFAULT_SPEAKER_BUFFER_SECONDS = 120.0
+# Max mic chunks waiting to be sent (64 x 1024 samples @ 24 kHz ≈ 2.7 s)
+DEFAULT_MIC_QUEUE_FRAMES = 64
+
 
 class AudioIO:
     """Audio I/O interface for OpenAI Realtime API."""
     
-    def __init__(self, chunk_size=1024, rate=24000, format=pyaudio.paInt16):
-        self.p = pyaudio.PyAudio()
-        self.mic_queue = []
-        self.mic_lock = threading.Lock()
-        self.audio_buffer = bytearray()
+    def __init__(
+        self,
+        chunk_size=1024,
+        rate=24000,
+        format=pyaudio.paInt16,
+        speaker_buffer_seconds: float = DEFAULT_SPEAKER_BUFFER_SECONDS,
+        mic_queue_frames: int = DEFAULT_MIC_QUEUE_FRAMES,
+        mic_overflow: str = DROP_OLDEST,
+    ):
+        # PortAudio is only opened by start(): a conversation waiting in the
+        # warm session pool doesn't hold (or pay for) one
+        self.p = None
+        # Written by the mic callback, drained by the sender thread
+        self.mic_queue = CaptureQueue(maxsize=mic_queue_frames, overflow=mic_overflow)
+        self.sample_width = pyaudio.get_sample_size(format)
+        # Written by the WebSocket thread, read by the speaker callback
+        self.speaker = SpeakerRingBuffer.for_duration(
+            speaker_buffer_seconds, rate, self.sample_width
+        )
+        self._silence = bytes(chunk_size * self.sample_width)
         self._stop_event = threading.Event()
+        self.in_stream = None
+        self.out_stream = None
+        # Called from the speaker callback whenever model audio is played
+        self.on_playback = None
         self.ducking = False
         self.chunk_size = chunk_size
         self.rate = rate
@@ -27,24 +54,21 @@ class AudioIO:
                 data = audioop.mul(in_data, 2, 0.5623)
             except Exception:
                 data = in_data
-        with self.mic_lock:
-            self.mic_queue.append(data)
+        self.mic_queue.put(data)
         return (None, pyaudio.paContinue)
 
     # Speaker callback: play whatever audio we have from the model
     def _spk_cb(self, in_data, frame_count, time_info, status):
-        needed = frame_count * 2  # 2 bytes per sample
-        if len(self.audio_buffer) >= needed:
-            chunk = self.audio_buffer[:needed]
-            self.audio_buffer = self.audio_buffer[needed:]
-            self.ducking = True  # Enable ducking when playing audio
-        else:
-            chunk = self.audio_buffer + b"\x00" * (needed - len(self.audio_buffer))
-            self.audio_buffer.clear()
-            self.ducking = False  # Disable ducking when no audio
-        return (bytes(chunk), pyaudio.paContinue)
+        needed = frame_count * self.sample_width
+        chunk, got = self.speaker.read(needed, self._silence)
+        # Duck the mic while a full chunk of model audio is playing
+        self.ducking = got == needed
+        if got and self.on_playback is not None:
+            self.on_playback()
+        return (chunk, pyaudio.paContinue)
 
     def start(self):
+        self.p = pyaudio.PyAudio()
         self.in_stream = self.p.open(
             format=self.format,
             channels=1,
@@ -65,19 +89,24 @@ class AudioIO:
         self.out_stream.start_stream()
 
     def stop(self):
+        """Close the streams (if start() opened them) and release PortAudio."""
         self._stop_event.set()
-        self.in_stream.stop_stream()
-        self.in_stream.close()
-        self.out_stream.stop_stream()
-        self.out_stream.close()
-        self.p.terminate()
+        self.mic_queue.close()
+        for stream in (self.in_stream, self.out_stream):
+            if stream is not None:
+                stream.stop_stream()
+                stream.close()
+        if self.p is not None:
+            self.p.terminate()
+            self.p = None
 
     def push_tts(self, audio_bytes: bytes):
-        self.audio_buffer.extend(audio_bytes)
+        self.speaker.write(audio_bytes)
+
+    def stats(self) -> dict:
+        return {"speaker": self.speaker.stats(), "mic": self.mic_queue.stats()}
 
-    def read_mic_chunk(self):
-        with self.mic_lock:
-            if self.mic_queue:
-                return self.mic_queue.pop(0)
-        return None
+    def read_mic_chunk(self, timeout: float | None = None):
+        """Block until the next mic chunk arrives (None on timeout or stop)."""
+        return self.mic_queue.get(timeout)
 
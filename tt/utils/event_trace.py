@@ -0,0 +1,153 @@
+"""
+Record and replay the inbound event stream of a realtime session.
+
+Traces are gzip'd JSON lines, one per received frame:
+
+    {"t": 1.234, "raw": "<frame text exactly as received>"}
+
+`t` is seconds since recording started (monotonic). With audio stripped,
+audio delta frames keep their shape but carry an empty payload and the
+original decoded size, and replay refills them with silence:
+
+    {"t": 1.250, "raw": "{...\"delta\":\"\"...}", "audio": 4800}
+
+FakeSocket and FakeAudioIO stand in for the network and sound card so a
+RealtimeConversation can be driven from a trace (see
+tt/experimental/replay_events.py).
+"""
+
+import base64
+import gzip
+import json
+import threading
+import time
+from pathlib import Path
+
+from tt.utils.audio_buffers import CaptureQueue, SpeakerRingBuffer
+
+_AUDIO_DELTA_PREFIX = '{"type":"response.audio.delta"'
+_DELTA_KEY = '"delta":"'
+
+
+class EventRecorder:
+    """Appends received frames to a gzip JSONL trace. Thread-safe."""
+
+    def __init__(self, path: Path | str, include_audio: bool = False):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.include_audio = include_audio
+        self._file = gzip.open(self.path, "wt", encoding="utf-8", compresslevel=6)
+        self._lock = threading.Lock()
+        self._start = time.monotonic()
+        self.events = 0
+
+    def record(self, raw):
+        if isinstance(raw, (bytes, bytearray)):
+            raw = raw.decode("utf-8", "replace")
+        entry = {"t": round(time.monotonic() - self._start, 6), "raw": raw}
+        if not self.include_audio and raw.startswith(_AUDIO_DELTA_PREFIX):
+            stripped = _strip_audio(raw)
+            if stripped is not None:
+                entry["raw"], entry["audio"] = stripped
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line)
+            self.events += 1
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def _strip_audio(raw: str) -> tuple[str, int] | None:
+    start = raw.find(_DELTA_KEY)
+    if start < 0:
+        return None
+    start += len(_DELTA_KEY)
+    end = raw.find('"', start)
+    if end < 0:
+        return None
+    payload = raw[start:end]
+    size = len(payload) * 3 // 4 - payload[-2:].count("=")
+    return raw[:start] + raw[end:], size
+
+
+def read_events(path: Path | str):
+    """Yield (t, raw) from a trace, with stripped audio refilled as silence."""
+    silence = {}
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            raw = entry["raw"]
+            size = entry.get("audio")
+            if size:
+                if size not in silence:
+                    silence[size] = base64.b64encode(bytes(size)).decode("ascii")
+                raw = raw.replace(_DELTA_KEY + '"', _DELTA_KEY + silence[size] + '"', 1)
+            yield entry["t"], raw
+
+
+# -------------------------------------------------------------------
+# Stand-ins for replay
+# -------------------------------------------------------------------
+
+
+class FakeSocket:
+    """Same surface as RealtimeSocket; keeps what would have been sent."""
+
+    def __init__(self):
+        self.done_event = threading.Event()
+        self.lock = threading.Lock()
+        self.sent = []  # (monotonic time, message dict)
+
+    def connect(self):
+        pass
+
+    def send(self, obj: dict):
+        with self.lock:
+            self.sent.append((time.monotonic(), obj))
+
+    def send_raw(self, text: str):
+        self.send(json.loads(text))
+
+    def close(self):
+        self.done_event.set()
+
+
+class FakeAudioIO:
+    """Same surface as AudioIO, without a sound card. Audio "plays" instantly."""
+
+    def __init__(self, rate: int = 24000, sample_width: int = 2, speaker_buffer_seconds: float = 5.0):
+        self.rate = rate
+        self.sample_width = sample_width
+        self.speaker = SpeakerRingBuffer.for_duration(speaker_buffer_seconds, rate, sample_width)
+        self.mic_queue = CaptureQueue()
+        self.on_playback = None
+        self.ducking = False
+        self.played_bytes = 0
+
+    def start(self):
+        pass
+
+    def stop(self):
+        self.mic_queue.close()
+
+    def push_tts(self, audio_bytes: bytes):
+        self.speaker.write(audio_bytes)
+        got = sum(len(view) for view in self.speaker.read_views(len(self.speaker)))
+        self.speaker.advance(got)
+        self.played_bytes += got
+        if got and self.on_playback is not None:
+            self.on_playback()
+
+    def read_mic_chunk(self, timeout: float | None = None):
+        return self.mic_queue.get(timeout)
+
+    def stats(self) -> dict:
+        return {"speaker": self.speaker.stats(), "mic": self.mic_queue.stats()}
@@ -7,11 +7,13 @@ from websocket import create_connection, WebSocketConnectionClosedException
 class RealtimeSocket:
     """WebSocket wrapper for OpenAI Realtime API."""
     
-    def __init__(self, api_key, ws_url, on_msg):
+    def __init__(self, api_key, ws_url, on_msg, on_raw=None):
         self.api_key = api_key
         self.ws_url = ws_url
         self.ws = None
         self.on_msg = on_msg
+        # Optional fast path: on_raw(text) -> True if it consumed the frame
+        self.on_raw = on_raw
         self._stop_event = threading.Event()
         self.done_event = threading.Event()  # Set when the connection is fully closed
         self.lock = threading.Lock()
@@ -30,7 +32,9 @@ class RealtimeSocket:
         while not self._stop_event.is_set():
             try:
                 raw = self.ws.recv()
-                if raw and self.on_msg:
+                if not raw or (self.on_raw and self.on_raw(raw)):
+                    continue
+                if self.on_msg:
                     self.on_msg(json.loads(raw))
             except WebSocketConnectionClosedException:
                 break
@@ -41,9 +45,13 @@ class RealtimeSocket:
         self.done_event.set()
 
     def send(self, obj: dict):
+        self.send_raw(json.dumps(obj))
+
+    def send_raw(self, text: str):
+        """Send an already-serialized message."""
         try:
             with self.lock:
-                self.ws.send(json.dumps(obj))
+                self.ws.send(text)
         except Exception as e:
             print("Send error:", e)
 
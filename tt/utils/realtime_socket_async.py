@@ -0,0 +1,109 @@
+import asyncio
+import json
+import threading
+
+from websockets.asyncio.client import connect
+from websockets.exceptions import ConnectionClosed
+
+
+class AsyncRealtimeSocket:
+    """
+    asyncio WebSocket wrapper for OpenAI Realtime API.
+
+    Same surface as RealtimeSocket (send / send_raw / close / done_event), but
+    receive and send both run as tasks on one event loop. Outgoing messages go
+    through a queue drained by a single sender task, so there is no send lock;
+    send() is safe to call from the loop or from any other thread.
+    """
+
+    def __init__(self, api_key, ws_url, on_msg, on_raw=None):
+        self.api_key = api_key
+        self.ws_url = ws_url
+        self.ws = None
+        self.on_msg = on_msg
+        # Optional fast path: on_raw(text) -> True if it consumed the frame
+        self.on_raw = on_raw
+        self.loop = None
+        self._loop_thread_id = None
+        self.done_event = threading.Event()  # Set when the connection is fully closed
+        self._outbox = None
+        self._tasks = []
+
+    async def connect(self):
+        self.loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._outbox = asyncio.Queue()
+        self.ws = await connect(
+            self.ws_url,
+            additional_headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "OpenAI-Beta": "realtime=v1",
+            },
+            max_size=None,
+        )
+        self._tasks = [
+            asyncio.create_task(self._recv_loop()),
+            asyncio.create_task(self._send_loop()),
+        ]
+
+    async def _recv_loop(self):
+        try:
+            async for raw in self.ws:
+                if not raw or (self.on_raw and self.on_raw(raw)):
+                    continue
+                if self.on_msg:
+                    self.on_msg(json.loads(raw))
+        except ConnectionClosed:
+            pass
+        except Exception as e:
+            print("Receive error:", e)
+        # Signal that the connection is done (server closed, error, or manual stop)
+        self.done_event.set()
+
+    async def _send_loop(self):
+        while True:
+            text = await self._outbox.get()
+            try:
+                await self.ws.send(text)
+            except ConnectionClosed:
+                break
+            except Exception as e:
+                print("Send error:", e)
+
+    def send(self, obj: dict):
+        self.send_raw(json.dumps(obj))
+
+    def send_raw(self, text: str):
+        """Queue an already-serialized message; thread-safe."""
+        if self.loop is None or self.loop.is_closed():
+            print("Send error: socket is not connected")
+            return
+        if threading.get_ident() == self._loop_thread_id:
+            self._outbox.put_nowait(text)
+        else:
+            self.loop.call_soon_threadsafe(self._outbox.put_nowait, text)
+
+    async def wait_closed(self):
+        """Wait (on the loop) until the server side is gone; see done_event."""
+        if self._tasks:
+            await asyncio.wait({self._tasks[0]})
+
+    async def aclose(self):
+        for task in self._tasks:
+            task.cancel()
+        try:
+            if self.ws:
+                await self.ws.close()
+        except Exception:
+            pass
+        self.done_event.set()
+
+    def close(self, timeout: float = 5.0):
+        """Close from outside the loop (blocks until the socket is torn down)."""
+        if self.loop is None or self.loop.is_closed():
+            self.done_event.set()
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self.aclose(), self.loop).result(timeout)
+        except Exception:
+            pass
@@ -0,0 +1,190 @@
+"""
+Per-turn latency tracing for realtime conversations.
+
+A turn starts when the server reports the user stopped speaking and collects
+monotonic timestamps for what follows (transcript, tool calls, first audio
+from the model, first audio out of the speaker, response done). It closes
+when the next turn starts or the conversation ends; closed turns are
+appended as one JSON line each and fed into rolling percentiles.
+
+    sink = TurnLatencySink("conversation_logs/turn_latency.jsonl")
+    tracer = TurnTracer(sink)          # one per conversation
+    tracer.start_turn()                # speech stopped
+    tracer.mark("first_audio_delta")   # first mark of a kind wins
+    ...
+    sink.summary()  # {"first_audio_delta": {"count", "p50", "p95", "p99"}, ...}
+"""
+
+import json
+import math
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+# Marks in the order they normally happen (all in ms after speech stopped)
+TURN_MARKS = (
+    "transcript_completed",
+    "first_audio_delta",
+    "first_playback",
+    "response_done",
+)
+# Marks that keep the latest time instead of the first
+_LAST_WINS = {"response_done"}
+# Marks that only count once another has happened this turn: audio still
+# playing from before the user spoke (barge-in) isn't this turn's playback
+_REQUIRES = {"first_playback": "first_audio_delta"}
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class TurnLatencySink:
+    """Shared by every conversation: JSONL output + rolling percentiles."""
+
+    def __init__(self, path: Path | str | None = None, window: int = 200):
+        self.path = Path(path) if path else None
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples = {}  # metric -> deque of ms
+        self._file = None  # opened on the first turn, kept until close()
+        self.turns = 0
+
+    def record(self, span: dict):
+        with self._lock:
+            self.turns += 1
+            for name, ms in span["marks_ms"].items():
+                self._add(name, ms)
+            for call in span["tools"]:
+                if call.get("end_ms") is not None:
+                    self._add("tool", call["end_ms"] - call["start_ms"])
+            if self.path is not None:
+                try:
+                    if self._file is None:
+                        self.path.parent.mkdir(parents=True, exist_ok=True)
+                        self._file = open(self.path, "a", encoding="utf-8")
+                    self._file.write(json.dumps(span) + "\n")
+                    self._file.flush()
+                except OSError as e:
+                    print(f"[latency] Couldn't write {self.path}: {e}")
+
+    def close(self):
+        """Close the JSONL file (reopened if another turn is recorded)."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _add(self, name: str, ms: float):
+        samples = self._samples.get(name)
+        if samples is None:
+            samples = self._samples[name] = deque(maxlen=self.window)
+        samples.append(ms)
+
+    def summary(self) -> dict:
+        with self._lock:
+            snapshot = {name: sorted(samples) for name, samples in self._samples.items()}
+        return {
+            name: {
+                "count": len(ordered),
+                "p50": _percentile(ordered, 50),
+                "p95": _percentile(ordered, 95),
+                "p99": _percentile(ordered, 99),
+            }
+            for name, ordered in snapshot.items()
+            if ordered
+        }
+
+    def format_summary(self) -> str:
+        summary = self.summary()
+        order = [*TURN_MARKS, "tool"]
+        lines = [
+            f"  {name:<22} p50 {s['p50']:7.0f}  p95 {s['p95']:7.0f}  p99 {s['p99']:7.0f} ms  (n={s['count']})"
+            for name, s in sorted(summary.items(), key=lambda kv: order.index(kv[0]) if kv[0] in order else len(order))
+        ]
+        return "\n".join(lines)
+
+
+class TurnTracer:
+    """Timestamps for one conversation's turns. Safe to call from any thread."""
+
+    def __init__(self, sink: TurnLatencySink, session: str | None = None):
+        self.sink = sink
+        self.session = session
+        self._lock = threading.Lock()
+        self._turn = 0
+        self._start = None  # monotonic time speech stopped; None = no open turn
+        self._started_at = None
+        self._marks = {}
+        self._tools = {}  # call_id -> {"name", "start", "end"}
+
+    def start_turn(self):
+        """The user stopped speaking: close any open turn and start a new one."""
+        now = time.monotonic()
+        with self._lock:
+            span = self._close()
+            self._turn += 1
+            self._start = now
+            self._started_at = datetime.now().isoformat()
+        if span:
+            self.sink.record(span)
+
+    def mark(self, name: str):
+        # Hot path (every audio delta / speaker callback): bail before locking
+        # once this turn already has the mark
+        if self._start is None or (name in self._marks and name not in _LAST_WINS):
+            return
+        now = time.monotonic()
+        with self._lock:
+            if self._start is None or (name in self._marks and name not in _LAST_WINS):
+                return
+            required = _REQUIRES.get(name)
+            if required is None or required in self._marks:
+                self._marks[name] = now
+
+    def tool_start(self, call_id: str, name: str):
+        now = time.monotonic()
+        with self._lock:
+            if self._start is not None:
+                self._tools[call_id] = {"name": name, "start": now, "end": None}
+
+    def tool_end(self, call_id: str):
+        now = time.monotonic()
+        with self._lock:
+            call = self._tools.get(call_id)
+            if call is not None:
+                call["end"] = now
+
+    def end_turn(self):
+        """Close the open turn (e.g. the conversation is ending)."""
+        with self._lock:
+            span = self._close()
+        if span:
+            self.sink.record(span)
+
+    def _close(self) -> dict | None:
+        if self._start is None:
+            return None
+        start = self._start
+
+        def ms(t):
+            return None if t is None else round((t - start) * 1000, 1)
+
+        span = {
+            "session": self.session,
+            "turn": self._turn,
+            "speech_stopped_at": self._started_at,
+            "marks_ms": {name: ms(t) for name, t in self._marks.items()},
+            "tools": [
+                {"name": c["name"], "start_ms": ms(c["start"]), "end_ms": ms(c["end"])}
+                for c in self._tools.values()
+            ],
+        }
+        self._start = None
+        self._marks = {}
+        self._tools = {}
+        return span